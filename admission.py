@@ -0,0 +1,146 @@
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from flask import g, jsonify, request
+
+# ─── 1) Defaults ─────────────────────────────────────────────────────────────────
+MAX_IN_FLIGHT = 16      # requests computing at once
+MAX_QUEUE = 32          # requests allowed to wait for a slot; beyond this they are shed
+MAX_QUEUE_WAIT = 0.5    # seconds a queued request waits before it is shed
+RETRY_AFTER = 1         # seconds suggested to shed clients
+CLIENT_RATE = float(os.environ.get('ADMISSION_CLIENT_RATE', 5.0))  # sustained requests/s per client; 0 turns it off
+CLIENT_BURST = 20       # requests a client may send back to back
+MAX_CLIENTS = 10_000    # least recently seen buckets are dropped past this many clients
+# peers whose X-Forwarded-For names the real client: the dashboard (or a reverse
+# proxy) on this host; anyone else is keyed on their own address
+TRUSTED_PROXIES = frozenset(os.environ.get('ADMISSION_TRUSTED_PROXIES', '127.0.0.1,::1').split(','))
+
+
+class Rejected(Exception):
+    """A request turned away before doing any work."""
+
+    def __init__(self, status, reason, retry_after):
+        super().__init__(reason)
+        self.status = status
+        self.reason = reason
+        self.retry_after = max(1, math.ceil(retry_after))
+
+    def headers(self):
+        return {'Retry-After': str(self.retry_after)}
+
+
+# ─── 2) Per-client token bucket ──────────────────────────────────────────────────
+class TokenBuckets:
+    """One bucket per client: refills at rate tokens/s up to burst, a request takes one."""
+
+    def __init__(self, rate=CLIENT_RATE, burst=CLIENT_BURST, max_clients=MAX_CLIENTS):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._lock = threading.Lock()
+        self._buckets = OrderedDict()   # client -> (tokens, last refill), least recently seen first
+
+    def take(self, client):
+        """Seconds until the client may retry, or 0 if a token was taken."""
+        if not self.rate:
+            return 0
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self._buckets.pop(client, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            wait = 0 if tokens >= 1 else (1 - tokens) / self.rate
+            self._buckets[client] = (tokens - 1 if not wait else tokens, now)
+            while len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        return wait
+
+
+# ─── 3) Admission controller ─────────────────────────────────────────────────────
+class AdmissionController:
+    """Bounds concurrent work so admitted requests keep a flat latency under overload.
+
+    A request is rejected with 429 when its client is over its token bucket,
+    and with 503 when max_in_flight are running and either the queue is already
+    max_queue deep or no slot frees up within max_queue_wait.
+    """
+
+    def __init__(self, max_in_flight=MAX_IN_FLIGHT, max_queue=MAX_QUEUE,
+                 max_queue_wait=MAX_QUEUE_WAIT, buckets=None):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.max_queue_wait = max_queue_wait
+        self.buckets = buckets or TokenBuckets()
+        self._slots = threading.Condition()
+        self.in_flight = 0
+        self.queued = 0
+        self.counts = {'admitted': 0, 'rate_limited': 0, 'shed': 0}
+
+    def acquire(self, client):
+        wait = self.buckets.take(client)
+        if wait:
+            with self._slots:
+                self.counts['rate_limited'] += 1
+            raise Rejected(429, 'Too many requests from this client', wait)
+        with self._slots:
+            if self.in_flight >= self.max_in_flight:
+                if self.queued >= self.max_queue:
+                    self.counts['shed'] += 1
+                    raise Rejected(503, 'Server busy', RETRY_AFTER)
+                self.queued += 1
+                try:
+                    admitted = self._slots.wait_for(lambda: self.in_flight < self.max_in_flight,
+                                                    self.max_queue_wait)
+                finally:
+                    self.queued -= 1
+                if not admitted:
+                    self.counts['shed'] += 1
+                    raise Rejected(503, 'Server busy', RETRY_AFTER)
+            self.in_flight += 1
+            self.counts['admitted'] += 1
+
+    def release(self):
+        with self._slots:
+            self.in_flight -= 1
+            self._slots.notify()
+
+    def stats(self):
+        with self._slots:
+            return {'in_flight': self.in_flight, 'queued': self.queued, **self.counts,
+                    'max_in_flight': self.max_in_flight, 'max_queue': self.max_queue}
+
+
+# ─── 4) Flask wiring ─────────────────────────────────────────────────────────────
+def client_id(req, trusted=TRUSTED_PROXIES):
+    """The caller's address.
+
+    X-Forwarded-For is only read when the peer is a trusted proxy, and then
+    only its last entry, the one that proxy added itself. (Under waitress'
+    trusted_proxy setting remote_addr already is the client's address.)
+    """
+    if req.remote_addr in trusted:
+        forwarded = req.headers.get('X-Forwarded-For', '').split(',')[-1].strip()
+        if forwarded:
+            return forwarded
+    return req.remote_addr
+
+
+def install(app, controller, endpoints=('predict',)):
+    """Admit requests to the given Flask endpoints through controller."""
+    @app.before_request
+    def _admit():
+        if request.endpoint not in endpoints:
+            return None
+        try:
+            controller.acquire(client_id(request))
+        except Rejected as e:
+            return jsonify({'error': e.reason}), e.status, e.headers()
+        g.admitted = True
+        return None
+
+    @app.teardown_request
+    def _release(exc):
+        if g.pop('admitted', False):
+            controller.release()
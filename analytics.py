@@ -0,0 +1,229 @@
+import os
+import sys
+import threading
+
+import duckdb
+import pandas as pd
+
+from bitmap_index import INDEXED_COLUMNS, BitmapIndex
+from dataset_store import CLEAN_PATH, PART, STORE_DIR
+from model_meta import DATE_COL
+
+# ─── 1) Defaults ─────────────────────────────────────────────────────────────────
+# One on-disk DuckDB file holds a table per dataset the dashboard reads. Every
+# dashboard process opens it read-only, so they share the OS page cache instead
+# of each keeping its own DataFrame, and DuckDB runs the scans on all cores.
+DB_PATH = 'dataset/analytics.duckdb'
+SOURCES = {
+    'postings': CLEAN_PATH,     # dashboard.py (read from dataset/store once built)
+}
+SALARY_COLUMNS = ['min_salary', 'mean_salary', 'max_salary']
+FREQS = ['day', 'week', 'month', 'quarter', 'year']
+
+
+def source_of(table):
+    path = SOURCES[table]
+    return STORE_DIR if path == CLEAN_PATH and os.path.isdir(STORE_DIR) else path
+
+
+def _load(con, table, source):
+    if os.path.isdir(source):
+        con.execute(f"CREATE OR REPLACE TABLE {table} AS SELECT * FROM "
+                    f"read_parquet(?, hive_partitioning = false, union_by_name = true)",
+                    [os.path.join(source, '*', '*', PART)])
+    else:
+        con.execute(f"CREATE OR REPLACE TABLE {table} AS SELECT * FROM read_csv_auto(?)", [source])
+    columns = [row[0] for row in con.execute(f"DESCRIBE {table}").fetchall()]
+    if DATE_COL in columns:
+        # the parquet store keeps listingDate as text
+        con.execute(f'ALTER TABLE {table} ALTER "{DATE_COL}" SET DATA TYPE TIMESTAMPTZ')
+
+
+def build(db_path=DB_PATH, tables=None):
+    """Rebuild the database from the sources into a new file and swap it in.
+
+    Dashboards holding the old file keep reading it until they restart.
+    """
+    tmp = db_path + '.tmp'
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    con = duckdb.connect(tmp)
+    for table in tables or SOURCES:
+        source = source_of(table)
+        if not os.path.exists(source):
+            print(f"⏭  {table}: {source} not found")
+            continue
+        _load(con, table, source)
+        n = con.execute(f"SELECT count(*) FROM {table}").fetchone()[0]
+        print(f"📥 {table}: {n:,} rows from {source}")
+    con.close()
+    os.replace(tmp, db_path)
+
+
+# ─── 2) Query layer ──────────────────────────────────────────────────────────────
+class Analytics:
+    """Parameterized aggregates over one table.
+
+    Filters are keyword arguments column=value (or a list of values), None
+    meaning "no filter", like BitmapIndex.rows(). Column names are checked
+    against the table; values are always bound as parameters.
+
+    On a SharedDataset, counts() over the bitmap-indexed columns (category,
+    state, type, location) filtered only by those columns, the dashboard pies,
+    are answered from a BitmapIndex over the mapped frame instead of a scan.
+    """
+
+    def __init__(self, table, db_path=DB_PATH, shared=None):
+        self.table = table
+        self._con = None
+        self._shared = shared
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._bitmaps = (None, None)    # (shared frame it indexes, BitmapIndex)
+        if shared is not None:
+            # queries scan the memory-mapped frame of a SharedDataset, no copy per worker
+            self._con = duckdb.connect()
+        elif os.path.exists(db_path):
+            con = duckdb.connect(db_path, read_only=True)
+            if con.execute("SELECT count(*) FROM duckdb_tables() WHERE table_name = ?", [table]).fetchone()[0]:
+                self._con = con
+            else:
+                con.close()
+        if self._con is None:
+            print(f"⚠️  {table} not in {db_path}; loading {source_of(table)} in memory "
+                  f"(run analytics.py to share one database between processes)")
+            self._con = duckdb.connect()
+            _load(self._con, table, source_of(table))
+        self.columns = [row[0] for row in self._sql_rows(f"DESCRIBE {table}")]
+
+    def _cursor(self):
+        # the connection itself must not be shared between threads
+        if self._shared is None:
+            return self._con.cursor()
+        # registered frames are per cursor: one per thread, re-registered on a new generation
+        frame = self._shared.frame()
+        local = self._local
+        if getattr(local, 'generation', None) != self._shared.generation:
+            local.cursor = self._con.cursor()
+            local.cursor.register(self.table, frame)
+            local.generation = self._shared.generation
+        return local.cursor
+
+    @property
+    def generation(self):
+        """The shared generation being queried, or None when reading the DuckDB file."""
+        if self._shared is None:
+            return None
+        self._shared.frame()    # re-attaches if CURRENT has moved
+        return self._shared.generation
+
+    def _bitmap_index(self, by, filters):
+        """This generation's BitmapIndex if it can answer counts(by, **filters), else None."""
+        if self._shared is None or by not in INDEXED_COLUMNS:
+            return None
+        for col, value in filters.items():
+            # an empty list matches nothing in SQL but means "no filter" to BitmapIndex
+            if col not in INDEXED_COLUMNS or (isinstance(value, (list, tuple, set)) and not value):
+                return None
+        frame = self._shared.frame()
+        with self._lock:
+            indexed, index = self._bitmaps
+            if indexed is not frame:
+                columns = [c for c in INDEXED_COLUMNS
+                           if c in frame.columns and isinstance(frame[c].dtype, pd.CategoricalDtype)]
+                index = BitmapIndex(frame, columns)
+                self._bitmaps = (frame, index)
+        return index if by in index.codes and all(col in index.codes for col in filters) else None
+
+    def _sql_rows(self, sql, params=()):
+        return self._cursor().execute(sql, list(params)).fetchall()
+
+    def _sql(self, sql, params=()):
+        return self._cursor().execute(sql, list(params)).df()
+
+    def _column(self, col):
+        if col not in self.columns:
+            raise KeyError(f"{self.table} has no column {col!r}")
+        return f'"{col}"'
+
+    def _where(self, filters):
+        clauses, params = [], []
+        for col, value in filters.items():
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set)):
+                value = list(value)
+                clauses.append(f"{self._column(col)} IN ({', '.join('?' * len(value))})" if value else 'false')
+                params += value
+            else:
+                clauses.append(f"{self._column(col)} = ?")
+                params.append(value)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def distinct(self, col):
+        """Sorted non-null values of a column (dropdown options)."""
+        c = self._column(col)
+        return [row[0] for row in self._sql_rows(f"SELECT DISTINCT {c} FROM {self.table} "
+                                                 f"WHERE {c} IS NOT NULL ORDER BY 1")]
+
+    def counts(self, by, **filters):
+        """Postings per value of `by` as a label/count frame, largest first."""
+        index = self._bitmap_index(by, filters)
+        if index is not None:
+            # same rows and order as the query: count desc, then label (category order), missing last
+            frame = index.count_frame(by, index.rows(**filters), dropna=False)
+            frame['label'] = frame['label'].astype(pd.CategoricalDtype(index.labels[by], ordered=True))
+            return frame.sort_values('count', ascending=False, kind='stable', ignore_index=True)
+        where, params = self._where(filters)
+        c = self._column(by)
+        return self._sql(f"SELECT {c} AS label, count(*) AS count FROM {self.table}{where} "
+                         f"GROUP BY 1 ORDER BY 2 DESC, 1", params)
+
+    def salary_stats(self, by=None, **filters):
+        """Postings and average min/mean/max salary, overall or per value of `by`."""
+        where, params = self._where(filters)
+        stats = ', '.join(f"avg({self._column(s)}) AS {s}" for s in SALARY_COLUMNS if s in self.columns)
+        if by is None:
+            return self._sql(f"SELECT count(*) AS count, {stats} FROM {self.table}{where}", params)
+        c = self._column(by)
+        return self._sql(f"SELECT {c}, count(*) AS count, {stats} FROM {self.table}{where} "
+                         f"GROUP BY 1 ORDER BY 1", params)
+
+    def time_series(self, value='mean_salary', freq='month', **filters):
+        """Average `value` and posting count per listingDate period (period, value, count)."""
+        if freq not in FREQS:
+            raise ValueError(f"freq must be one of {FREQS}")
+        where, params = self._where(filters)
+        date, v = self._column(DATE_COL), self._column(value)
+        where = (where + ' AND ' if where else ' WHERE ') + f"{date} IS NOT NULL"
+        return self._sql(f"SELECT date_trunc('{freq}', {date}) AS period, avg({v}) AS {v}, "
+                         f"count(*) AS count FROM {self.table}{where} GROUP BY 1 ORDER BY 1", params)
+
+    def histogram(self, value, bins=30, by=None, **filters):
+        """Equal-width bin counts of `value` over its full range: (edges, frame of [by,] bin, count)."""
+        where, params = self._where(filters)
+        v = self._column(value)
+        lo, hi = self._sql_rows(f"SELECT min({v}), max({v}) FROM {self.table}")[0]
+        if lo is None:
+            return [], self._sql("SELECT NULL AS bin, 0 AS count WHERE false")
+        width = (hi - lo) / bins or 1
+        edges = [lo + i * width for i in range(bins + 1)]
+        where = (where + ' AND ' if where else ' WHERE ') + f"{v} IS NOT NULL"
+        bin_ = f"least(CAST(floor(({v} - ?) / ?) AS INTEGER), {bins - 1}) AS bin"
+        group = f"{self._column(by)}, " if by else ''
+        frame = self._sql(f"SELECT {group}{bin_}, count(*) AS count FROM {self.table}{where} "
+                          f"GROUP BY ALL ORDER BY ALL", [lo, width] + params)
+        return edges, frame
+
+    def cube(self, dims, **filters):
+        """Posting count and per-salary sum / non-null count grouped by dims, for re-aggregating client-side."""
+        where, params = self._where(filters)
+        group = ', '.join(self._column(d) for d in dims)
+        measures = ', '.join(f"sum({self._column(s)}) AS {s}_sum, count({self._column(s)}) AS {s}_n"
+                             for s in SALARY_COLUMNS if s in self.columns)
+        return self._sql(f"SELECT {group}, count(*) AS count, {measures} FROM {self.table}{where} "
+                         f"GROUP BY ALL ORDER BY ALL", params)
+
+
+if __name__ == '__main__':
+    build(sys.argv[1] if len(sys.argv) > 1 else DB_PATH)
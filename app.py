@@ -1,41 +1,63 @@
-from flask import Flask, request, jsonify
+import os
+from flask import Flask, Response, request, jsonify
 import pandas as pd
 import joblib
 from sklearn.pipeline import Pipeline
 from waitress import serve  # For production deployment
+from singleflight import SingleFlight
+from admission import AdmissionController, install
+from wire_format import MalformedBody, UnsupportedFormat, decode, render
+from forest_export import FOREST_DIR, MappedForest
 
 app = Flask(__name__)
 
-# Load the trained model
+# Load the trained model (the memory-mapped export when present, shared by all workers)
 try:
-    model = joblib.load('salary_predictor_model.pkl')
+    if os.path.isdir(FOREST_DIR):
+        model = MappedForest(FOREST_DIR)
+    else:
+        model = joblib.load('salary_predictor_model.pkl')
     print("✅ Model loaded successfully")
 except Exception as e:
     print(f"❌ Error loading model: {str(e)}")
     raise e
 
+# Bounded in-flight work: past the limit, requests are shed fast with 503 + Retry-After
+admission = AdmissionController()
+install(app, admission)
+
+# Identical requests arriving together (double clicks, popular combos) share one prediction
+flights = SingleFlight()
+
+def predict_one(record):
+    sample_input = pd.DataFrame([record])
+    return model.predict(sample_input)[0]
+
+# Bodies in JSON, MessagePack or Arrow (Content-Type); answers in whatever Accept asks for
+def read_body():
+    return decode(request.get_data(), request.content_type)
+
+def reply(body, status=200):
+    data, headers = render(body, request.headers.get('Accept'), request.headers.get('Accept-Encoding'))
+    return Response(data, status, headers)
+
 @app.route('/predict', methods=['POST'])
 def predict():
     try:
         # Get input data from request
-        input_data = request.json
+        input_data = read_body()
         
         # Validate input
         required_fields = ['job_title', 'category', 'role', 'location', 'type']
-        if not all(field in input_data for field in required_fields):
-            return jsonify({'error': 'Missing required fields'}), 400
+        if not isinstance(input_data, dict) or not all(field in input_data for field in required_fields):
+            return reply({'error': 'Missing required fields'}, 400)
+        not_text = [field for field in required_fields if not isinstance(input_data[field], str)]
+        if not_text:
+            return reply({'error': 'Fields must be strings', 'fields': not_text}, 400)
         
-        # Create DataFrame for prediction
-        sample_input = pd.DataFrame([{
-            'job_title': input_data['job_title'],
-            'category': input_data['category'],
-            'role': input_data['role'],
-            'location': input_data['location'],
-            'type': input_data['type']
-        }])
-        
-        # Make prediction
-        predicted_avg = model.predict(sample_input)[0]
+        # Create DataFrame for prediction (shared with identical in-flight requests)
+        record = {field: input_data[field] for field in required_fields}
+        predicted_avg = flights.do(tuple(record.values()), lambda: predict_one(record))
         
         # Create response (you can adjust the multipliers based on your data distribution)
         response = {
@@ -44,18 +66,29 @@ def predict():
             'max_salary': predicted_avg * 1.15   # Example: 15% above average
         }
         
-        return jsonify(response)
+        return reply(response)
     
+    except UnsupportedFormat as e:
+        return reply({'error': str(e)}, 415)
+
+    except MalformedBody as e:
+        return reply({'error': str(e)}, 400)
+
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return reply({'error': str(e)}, 500)
 
 @app.route('/health', methods=['GET'])
 def health_check():
     return jsonify({'status': 'healthy'})
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    return jsonify({'single_flight': flights.stats(), 'admission': admission.stats()})
+
 if __name__ == '__main__':
     # For development
     app.run(host='0.0.0.0', port=5000, debug=True)
     
     # For production (recommended):
-    # serve(app, host='0.0.0.0', port=5000)
+    # serve(app, host='0.0.0.0', port=5000, threads=64,  # more threads than admission lets in
+    #       trusted_proxy='127.0.0.1', trusted_proxy_headers={'x-forwarded-for'})  # per-user rate limits
@@ -1,57 +1,106 @@
-from flask import Flask, request, jsonify
-import pandas as pd
-from catboost import CatBoostRegressor
+from flask import Flask, Response, request, jsonify
 from waitress import serve  # For production deployment
+from prediction import MODEL_PATH, PredictionError, SalaryPredictor
+from batching import MAX_BATCH
+from admission import AdmissionController, install
+from wire_format import MalformedBody, UnsupportedFormat, decode, render
 
 app = Flask(__name__)
 
-# Load CatBoost model
+# Load CatBoost model and the vocabulary it was trained on
 try:
-    model = CatBoostRegressor()
-    model.load_model('model/catboost_salary_model2.cbm')
-    print("✅ Model loaded successfully")
+    predictor = SalaryPredictor(MODEL_PATH)
+    print(f"✅ Model loaded successfully (vocabulary {predictor.vocab.version})")
 except Exception as e:
     print(f"❌ Error loading model: {str(e)}")
     raise e
 
+# Let a full batch compute at once; past the queue, requests are shed fast with 503 + Retry-After
+admission = AdmissionController(max_in_flight=MAX_BATCH)
+install(app, admission, endpoints=('predict', 'predict_batch', 'explain'))
+
+MAX_BATCH_RECORDS = 100_000
+
+# Bodies in JSON, MessagePack or Arrow (Content-Type); answers in whatever Accept asks for
+def read_body():
+    return decode(request.get_data(), request.content_type)
+
+def reply(body, status=200):
+    data, headers = render(body, request.headers.get('Accept'), request.headers.get('Accept-Encoding'))
+    return Response(data, status, headers)
+
 @app.route('/predict', methods=['POST'])
 def predict():
     try:
-        input_data = request.json
+        # Normalize, encode and predict (batched with any concurrent requests)
+        return reply(predictor.predict(read_body()))
 
-        required_fields = ['category', 'role', 'location', 'type']
-        if not all(field in input_data for field in required_fields):
-            return jsonify({'error': 'Missing required fields'}), 400
+    except UnsupportedFormat as e:
+        return reply({'error': str(e)}, 415)
 
-        # Prepare input
-        sample_input = pd.DataFrame([{
-            'category': input_data['category'], 
-            'role': input_data['role'],
-            'location': input_data['location'],
-            'type': input_data['type']
-        }])
+    except MalformedBody as e:
+        return reply({'error': str(e)}, 400)
 
-        # Predict
-        predicted_avg = model.predict(sample_input)[0]
+    except PredictionError as e:
+        return reply(e.body, e.status)
+
+    except Exception as e:
+        return reply({'error': str(e)}, 500)
+
+@app.route('/predict/batch', methods=['POST'])
+def predict_batch():
+    try:
+        # A list of records (or an Arrow table); one result per record, in order
+        records = read_body()
+        if not isinstance(records, list):
+            return reply({'error': 'Expected a list of records'}, 400)
+        if len(records) > MAX_BATCH_RECORDS:
+            return reply({'error': f"At most {MAX_BATCH_RECORDS:,} records per batch"}, 413)
+        return reply(predictor.predict_many(records))
 
-        response = {
-            'min_salary': round(predicted_avg * 0.85, 2),
-            'mean_salary': round(predicted_avg, 2),
-            'max_salary': round(predicted_avg * 1.15, 2)
-        }
+    except UnsupportedFormat as e:
+        return reply({'error': str(e)}, 415)
 
-        return jsonify(response)
+    except MalformedBody as e:
+        return reply({'error': str(e)}, 400)
 
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return reply({'error': str(e)}, 500)
+
+@app.route('/explain', methods=['POST'])
+def explain():
+    try:
+        # One record, or a list of them; contributions add up to the predicted mean salary
+        body = read_body()
+        if isinstance(body, list):
+            if len(body) > MAX_BATCH_RECORDS:
+                return reply({'error': f"At most {MAX_BATCH_RECORDS:,} records per batch"}, 413)
+            return reply(predictor.explain_many(body))
+        result = predictor.explain_many([body])[0]
+        return reply(result, 400 if 'error' in result else 200)
+
+    except UnsupportedFormat as e:
+        return reply({'error': str(e)}, 415)
+
+    except MalformedBody as e:
+        return reply({'error': str(e)}, 400)
+
+    except Exception as e:
+        return reply({'error': str(e)}, 500)
 
 @app.route('/health', methods=['GET'])
 def health_check():
     return jsonify({'status': 'healthy'})
 
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    return jsonify({**predictor.stats(), 'admission': admission.stats()})
+
 if __name__ == '__main__':
     # For development
     app.run(host='0.0.0.0', port=5000, debug=True)
 
     # For production (uncomment this)
-    # serve(app, host='0.0.0.0', port=5000)
+    # serve(app, host='0.0.0.0', port=5000, threads=128,  # more threads than admission lets in
+    #       trusted_proxy='127.0.0.1', trusted_proxy_headers={'x-forwarded-for'})  # per-user rate limits
+    # (app_async.py serves the same contract from an event loop)
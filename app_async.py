@@ -0,0 +1,140 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from admission import MAX_QUEUE, RETRY_AFTER, Rejected, TokenBuckets
+from prediction import MODEL_PATH, PredictionError, SalaryPredictor
+from wire_format import MalformedBody, UnsupportedFormat, decode, render
+
+# ─── 1) Defaults ─────────────────────────────────────────────────────────────────
+# Same /predict and /health contract as app2.py, served from one event loop so
+# idle keep-alive and slow clients cost a coroutine instead of an OS thread.
+ENCODE_THREADS = 4      # bounded executor for input normalization/encoding
+MAX_PENDING = 512       # requests between encoding and a result; up to MAX_QUEUE more wait (backpressure)
+MAX_CONNECTIONS = 4096  # uvicorn answers 503 beyond this many open connections
+MAX_BATCH_RECORDS = 100_000
+
+# ─── 2) Model ────────────────────────────────────────────────────────────────────
+try:
+    predictor = SalaryPredictor(MODEL_PATH)
+    print(f"✅ Model loaded successfully (vocabulary {predictor.vocab.version})")
+except Exception as e:
+    print(f"❌ Error loading model: {str(e)}")
+    raise e
+
+executor = ThreadPoolExecutor(max_workers=ENCODE_THREADS, thread_name_prefix='encode')
+pending = asyncio.Semaphore(MAX_PENDING)
+buckets = TokenBuckets()
+waiting = 0     # requests queued behind a full semaphore; shed past MAX_QUEUE
+
+
+# ─── 3) Routes ───────────────────────────────────────────────────────────────────
+def reply(request, body, status=200, headers=None):
+    """Response in the format the request's Accept/Accept-Encoding ask for."""
+    data, negotiated = render(body, request.headers.get('accept'), request.headers.get('accept-encoding'))
+    return Response(data, status, {**negotiated, **(headers or {})})
+
+
+def rejected(request):
+    """Rejected when the client is over its rate or the queue is full, else None."""
+    # uvicorn only takes X-Forwarded-For from --forwarded-allow-ips (127.0.0.1 by default)
+    wait = buckets.take(request.client.host)
+    if wait:
+        return Rejected(429, 'Too many requests from this client', wait)
+    if pending.locked() and waiting >= MAX_QUEUE:
+        return Rejected(503, 'Server busy', RETRY_AFTER)
+    return None
+
+
+@asynccontextmanager
+async def slot():
+    global waiting
+    waiting += 1
+    try:
+        await pending.acquire()
+    finally:
+        waiting -= 1
+    try:
+        yield
+    finally:
+        pending.release()
+
+
+async def predict(request):
+    shed = rejected(request)
+    if shed:
+        return reply(request, {'error': shed.reason}, shed.status, shed.headers())
+    try:
+        input_data = decode(await request.body(), request.headers.get('content-type'))
+        async with slot():
+            # fuzzy matching may be slow on a cache miss, so it stays off the loop;
+            # inference itself runs on the micro-batcher's worker thread
+            loop = asyncio.get_running_loop()
+            future, normalized = await loop.run_in_executor(executor, predictor.submit, input_data)
+            predicted_avg = await asyncio.wrap_future(future)
+        return reply(request, predictor.response(predicted_avg, normalized))
+
+    except UnsupportedFormat as e:
+        return reply(request, {'error': str(e)}, 415)
+
+    except MalformedBody as e:
+        return reply(request, {'error': str(e)}, 400)
+
+    except PredictionError as e:
+        return reply(request, e.body, e.status)
+
+    except Exception as e:
+        return reply(request, {'error': str(e)}, 500)
+
+
+async def predict_batch(request):
+    shed = rejected(request)
+    if shed:
+        return reply(request, {'error': shed.reason}, shed.status, shed.headers())
+    try:
+        body, content_type = await request.body(), request.headers.get('content-type')
+        async with slot():
+            # decoding and the batch's model call both run on the bounded executor
+            loop = asyncio.get_running_loop()
+            records = await loop.run_in_executor(executor, decode, body, content_type)
+            if not isinstance(records, list):
+                return reply(request, {'error': 'Expected a list of records'}, 400)
+            if len(records) > MAX_BATCH_RECORDS:
+                return reply(request, {'error': f"At most {MAX_BATCH_RECORDS:,} records per batch"}, 413)
+            results = await loop.run_in_executor(executor, predictor.predict_many, records)
+        return reply(request, results)
+
+    except UnsupportedFormat as e:
+        return reply(request, {'error': str(e)}, 415)
+
+    except MalformedBody as e:
+        return reply(request, {'error': str(e)}, 400)
+
+    except Exception as e:
+        return reply(request, {'error': str(e)}, 500)
+
+
+async def health_check(request):
+    return JSONResponse({'status': 'healthy'})
+
+
+async def metrics(request):
+    return JSONResponse(predictor.stats())
+
+
+app = Starlette(routes=[
+    Route('/predict', predict, methods=['POST']),
+    Route('/predict/batch', predict_batch, methods=['POST']),
+    Route('/health', health_check, methods=['GET']),
+    Route('/metrics', metrics, methods=['GET']),
+])
+
+if __name__ == '__main__':
+    uvicorn.run(app, host='0.0.0.0', port=int(os.environ.get('PORT', 5000)),
+                limit_concurrency=MAX_CONNECTIONS, backlog=MAX_CONNECTIONS)
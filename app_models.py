@@ -0,0 +1,65 @@
+from flask import Flask, Response, request, jsonify
+from waitress import serve  # For production deployment
+from admission import AdmissionController, client_id, install
+from model_registry import ModelRegistry
+from prediction import PredictionError
+from wire_format import MalformedBody, UnsupportedFormat, decode, render
+
+# Same /predict contract as app.py/app2.py, served from every model at once:
+# live traffic is split between the weighted models in serving.json and the
+# shadow models score each request in the background (logs/shadow.jsonl).
+app = Flask(__name__)
+
+try:
+    registry = ModelRegistry()
+    print(f"✅ Serving {registry.weights} (shadow: {registry.shadow or 'none'})")
+except Exception as e:
+    print(f"❌ Error loading models: {str(e)}")
+    raise e
+
+admission = AdmissionController()
+install(app, admission)
+
+def reply(body, status=200):
+    data, headers = render(body, request.headers.get('Accept'), request.headers.get('Accept-Encoding'))
+    return Response(data, status, headers)
+
+@app.route('/predict', methods=['POST'])
+def predict():
+    try:
+        input_data = decode(request.get_data(), request.content_type)
+        # X-Model (or ?model=) pins a model, e.g. to compare them by hand
+        override = request.headers.get('X-Model') or request.args.get('model')
+        return reply(registry.predict(input_data, client_id(request), override))
+
+    except UnsupportedFormat as e:
+        return reply({'error': str(e)}, 415)
+
+    except MalformedBody as e:
+        return reply({'error': str(e)}, 400)
+
+    except PredictionError as e:
+        return reply(e.body, e.status)
+
+    except Exception as e:
+        return reply({'error': str(e)}, 500)
+
+@app.route('/models', methods=['GET'])
+def models():
+    return jsonify({'models': list(registry.models), 'weights': registry.weights, 'shadow': registry.shadow})
+
+@app.route('/health', methods=['GET'])
+def health_check():
+    return jsonify({'status': 'healthy'})
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    return jsonify({'models': registry.stats(), 'admission': admission.stats()})
+
+if __name__ == '__main__':
+    # For development
+    app.run(host='0.0.0.0', port=5000, debug=True)
+
+    # For production (uncomment this)
+    # serve(app, host='0.0.0.0', port=5000, threads=64,
+    #       trusted_proxy='127.0.0.1', trusted_proxy_headers={'x-forwarded-for'})
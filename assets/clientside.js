@@ -0,0 +1,121 @@
+// Clientside callbacks for DASHBOARD_CLIENTSIDE=1 (see data_layer.client_aggregates).
+// Figures are built from the aggregates shipped once in the 'aggregates' store,
+// so bar clicks and dropdown changes never reach the server.
+(function () {
+    var MARGIN = {t: 40, b: 20, l: 20, r: 20};
+
+    function clickedCategory(clickData) {
+        return clickData ? clickData.points[0].x : null;
+    }
+
+    function histogram(agg, column, category, title, margin) {
+        var h = agg.hist[column];
+        var width = h.edges[1] - h.edges[0];
+        var centers = h.edges.slice(0, -1).map(function (e) { return e + width / 2; });
+        var counts = category === null ? h.all : (h.by[category] || centers.map(function () { return 0; }));
+        return {
+            data: [{type: 'bar', x: centers, y: counts, width: width,
+                    hovertemplate: column + '=%{x:,.0f}<br>count=%{y}<extra></extra>'}],
+            layout: {template: agg.template, title: {text: title}, bargap: 0, margin: margin,
+                     xaxis: {title: {text: 'Salary (RM)'}}, yaxis: {title: {text: 'count'}}}
+        };
+    }
+
+    // rows of the category/state/type cube matching the selected values (null = any)
+    function cubeRows(agg, category, state) {
+        var cols = agg.cube.columns;
+        var ci = cols.indexOf('category'), si = cols.indexOf('state');
+        return agg.cube.rows.filter(function (r) {
+            return (category === null || r[ci] === category) && (state === null || r[si] === state);
+        });
+    }
+
+    function countsBy(agg, rows, dim) {
+        var cols = agg.cube.columns;
+        var di = cols.indexOf(dim), ni = cols.indexOf('count');
+        var totals = {};
+        rows.forEach(function (r) {
+            if (r[di] !== null) { totals[r[di]] = (totals[r[di]] || 0) + r[ni]; }
+        });
+        var labels = Object.keys(totals).sort(function (a, b) { return totals[b] - totals[a]; });
+        return {labels: labels, values: labels.map(function (l) { return totals[l]; })};
+    }
+
+    function averages(agg, rows) {
+        var cols = agg.cube.columns;
+        return ['min_salary', 'mean_salary', 'max_salary'].map(function (s) {
+            var si = cols.indexOf(s + '_sum'), ni = cols.indexOf(s + '_n'), sum = 0, n = 0;
+            rows.forEach(function (r) { sum += r[si] || 0; n += r[ni] || 0; });
+            return n ? sum / n : null;
+        });
+    }
+
+    function pie(agg, counts, title) {
+        return {
+            data: [{type: 'pie', labels: counts.labels, values: counts.values, hole: 0.4}],
+            layout: {template: agg.template, title: {text: title}}
+        };
+    }
+
+    // the same breakdown rules as update_pie / update_summary_pie
+    function breakdown(agg, cat, state) {
+        var rows = cubeRows(agg, cat, state);
+        if (cat !== null && state === null) {
+            return {rows: rows, counts: countsBy(agg, rows, 'state'), title: 'Postings of ' + cat + ' by State'};
+        }
+        if (state !== null && cat === null) {
+            return {rows: rows, counts: countsBy(agg, rows, 'category'), title: 'Postings in ' + state + ' by Category'};
+        }
+        if (cat !== null && state !== null) {
+            return {rows: rows, counts: countsBy(agg, rows, 'type'), title: 'Types for ' + cat + ' in ' + state};
+        }
+        return {rows: rows, counts: countsBy(agg, rows, 'category'), title: 'All Postings by Category'};
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        dashboard: {
+            // Overview: update_charts without re-sending the constant bar chart
+            overviewHists: function (clickData, agg) {
+                var cat = clickedCategory(clickData);
+                var label = cat === null ? '(All Categories)' : '(Category: ' + cat + ')';
+                return [histogram(agg, 'min_salary', cat, 'Min Salary Distribution ' + label, MARGIN),
+                        histogram(agg, 'mean_salary', cat, 'Mean Salary Distribution ' + label, MARGIN)];
+            },
+
+            // Salary Summary: update_hists
+            summaryHists: function (clickData, agg) {
+                var cat = clickedCategory(clickData);
+                var suffix = cat === null ? '(All Categories)' : '(Category: ' + cat + ')';
+                return [histogram(agg, 'min_salary', cat, 'Min Salary Distribution ' + suffix),
+                        histogram(agg, 'max_salary', cat, 'Max Salary Distribution ' + suffix),
+                        histogram(agg, 'mean_salary', cat, 'Mean Salary Distribution ' + suffix)];
+            },
+
+            // Salary Summary: update_summary_pie
+            summaryPie: function (cat, state, agg) {
+                cat = cat || null;
+                state = state || null;
+                var parts = [];
+                if (cat !== null) { parts.push('Category: ' + cat); }
+                if (state !== null) { parts.push('State: ' + state); }
+                var b = breakdown(agg, cat, state);
+                var avg = averages(agg, b.rows);
+                var top = Math.max.apply(null, avg.map(function (v) { return v || 0; }));
+                var summary = {
+                    data: [{type: 'bar', x: ['Avg Min', 'Avg Mean', 'Avg Max'], y: avg, text: avg,
+                            texttemplate: '%{text:,.0f}', textposition: 'outside'}],
+                    layout: {template: agg.template, uniformtext: {minsize: 8},
+                             title: {text: 'Salary Summary (' + (parts.length ? parts.join(' & ') : 'All Data') + ')'},
+                             xaxis: {title: {text: 'Statistic'}}, yaxis: {title: {text: 'Salary (RM)'}, range: [0, top * 1.1]}}
+                };
+                return [summary, pie(agg, b.counts, b.title)];
+            },
+
+            // Trends: update_pie
+            trendsPie: function (cat, state, agg) {
+                var b = breakdown(agg, cat || null, state || null);
+                return pie(agg, b.counts, b.title);
+            }
+        }
+    });
+})();
@@ -0,0 +1,86 @@
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+
+# ─── 1) Defaults ─────────────────────────────────────────────────────────────────
+MAX_BATCH = 64          # rows per model call
+MAX_WAIT = 0.005        # seconds the first queued row waits for company
+
+
+# ─── 2) Batcher ──────────────────────────────────────────────────────────────────
+class MicroBatcher:
+    """Coalesces concurrent single-row predictions into one vectorized call.
+
+    Request threads submit() a row and block on the returned future; one worker
+    thread drains the queue into batches of up to max_batch rows, waiting at
+    most max_wait after the first row, and calls predict_batch(rows) -> values.
+    A lone request therefore pays at most max_wait extra latency.
+    """
+
+    def __init__(self, predict_batch, max_batch=MAX_BATCH, max_wait=MAX_WAIT):
+        self.predict_batch = predict_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._sizes = Counter()      # batch size -> number of batches
+        self._worker = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+        self._worker.start()
+
+    def submit(self, row):
+        future = Future()
+        self._queue.put((row, future))
+        return future
+
+    def predict(self, row, timeout=None):
+        return self.submit(row).result(timeout)
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0
+                             else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            batch = [(row, f) for row, f in batch if f.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            rows = [row for row, _ in batch]
+            futures = [f for _, f in batch]
+            try:
+                values = self.predict_batch(rows)
+            except Exception as e:
+                for f in futures:
+                    f.set_exception(e)
+            else:
+                for f, value in zip(futures, values):
+                    f.set_result(value)
+            with self._lock:
+                self._sizes[len(futures)] += 1
+
+    def stats(self):
+        """Achieved batch sizes: totals, mean and the size -> count histogram."""
+        with self._lock:
+            sizes = dict(sorted(self._sizes.items()))
+        batches = sum(sizes.values())
+        rows = sum(size * n for size, n in sizes.items())
+        return {
+            'batches': batches,
+            'rows': rows,
+            'mean_batch_size': round(rows / batches, 2) if batches else 0,
+            'max_batch_size': max(sizes, default=0),
+            'batch_sizes': sizes,
+            'queued': self._queue.qsize(),
+            'max_batch': self.max_batch,
+            'max_wait_ms': self.max_wait * 1000,
+        }
@@ -0,0 +1,169 @@
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+# ─── 1) Defaults ─────────────────────────────────────────────────────────────────
+# Each size gets its own work directory laid out like the repo root
+# (dataset/clean_preprocessed_dataset.csv + dataset/analytics.duckdb) filled with
+# synthetic postings, and is measured in a fresh process that imports
+# dashboard.py from there, so start-up work and caches never leak between sizes.
+SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+BENCH_DIR = 'bench'
+RESULTS = os.path.join(BENCH_DIR, 'dashboard_scaling.csv')
+SOURCE_PATH = 'dataset/clean_preprocessed_dataset.csv'
+REPEAT = 3              # timed runs per input; the median is kept
+TOP = 5                 # categories/states used to build input sequences
+REPO = os.path.dirname(os.path.abspath(__file__))
+
+
+# ─── 2) Work directories ─────────────────────────────────────────────────────────
+def prepare(size, source=SOURCE_PATH, root=BENCH_DIR, seed=0):
+    """Work directory with `size` synthetic postings and their DuckDB database."""
+    from synth_data import PostingProfile, write_csv
+
+    workdir = os.path.abspath(os.path.join(root, f"rows_{size}"))
+    csv_path = os.path.join(workdir, 'dataset', 'clean_preprocessed_dataset.csv')
+    db_path = os.path.join(workdir, 'dataset', 'analytics.duckdb')
+    if not os.path.exists(csv_path):
+        print(f"📥 Generating {size:,} postings in {workdir}")
+        write_csv(PostingProfile.from_csv(source), size, csv_path, seed=seed)
+    if not os.path.exists(db_path):
+        print(f"⚙️ Building {db_path}")
+        subprocess.run([sys.executable, '-c', "from analytics import build; build()"],
+                       cwd=workdir, env=_env(), check=True)
+    return workdir
+
+
+def _env():
+    return {**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, [REPO, os.environ.get('PYTHONPATH')]))}
+
+
+# ─── 3) Measurement (runs inside the work directory) ─────────────────────────────
+def _json_size(output):
+    import plotly
+    outputs = output if isinstance(output, tuple) else (output,)
+    return sum(len(json.dumps(o, cls=plotly.utils.PlotlyJSONEncoder)) for o in outputs)
+
+
+def _measure_call(fn, args):
+    times = []
+    for _ in range(REPEAT):
+        t = time.perf_counter()
+        output = fn(*args)
+        times.append(time.perf_counter() - t)
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'wall_ms': round(statistics.median(times) * 1000, 2),
+            'peak_mb': round(peak / 2**20, 2), 'json_bytes': _json_size(output)}
+
+
+def input_sequences(data, pages):
+    """Realistic inputs per callback: the unfiltered view, then clicks/selections on the top values."""
+    cats = data.current().category_counts['label'].head(TOP).tolist()
+    states = data.db.counts('state')['label'].head(TOP).tolist()
+    clicks = [None] + [{'points': [{'x': c}]} for c in cats]
+    pairs = [(None, None)] + [(c, None) for c in cats] + [(None, s) for s in states] + \
+            [(c, s) for c in cats[:2] for s in states[:2]]
+    # the most common posting; predict_salary round-trips to app2.py if it is running
+    top = data.db.counts('job_title')['label'].head(1).tolist() + cats[:1] + \
+        [data.db.counts(col)['label'].iloc[0] for col in ('role', 'location', 'type')]
+    return {
+        'update_charts':      (pages['overview'].update_charts, [(c,) for c in clicks]),
+        'update_hists':       (pages['summary'].update_hists, [(c,) for c in clicks]),
+        'update_summary_pie': (pages['summary'].update_summary_pie, pairs),
+        'update_time_line':   (pages['trends'].update_time_line, [(None,)] + [(c,) for c in cats]),
+        'predict_salary':     (pages['predict'].predict_salary, [(1, *top)]),
+    }
+
+
+def measure(rows):
+    """Import the dashboard from the current directory and time every callback input."""
+    t = time.perf_counter()
+    import dash
+    import dashboard  # noqa: F401  (registers the pages and loads the data layer)
+    import data_layer as data
+    startup = time.perf_counter() - t
+    pages = {p['module'].split('.')[-1]: sys.modules[p['module']] for p in dash.page_registry.values()}
+
+    results = [{'callback': 'startup', 'input': '', 'wall_ms': round(startup * 1000, 2),
+                'peak_mb': None, 'json_bytes': None}]
+    for name, (fn, inputs) in input_sequences(data, pages).items():
+        for args in inputs:
+            results.append({'callback': name, 'input': json.dumps(args, default=str)[:120],
+                            **_measure_call(fn, args)})
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    for r in results:
+        r.update(rows=rows, max_rss_mb=round(rss, 1))
+    print(json.dumps(results))
+
+
+# ─── 4) Orchestration ────────────────────────────────────────────────────────────
+def run_label():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = 'unknown'
+    return f"{commit}@{time.strftime('%Y-%m-%dT%H:%M:%S')}"
+
+
+def bench(sizes, source=SOURCE_PATH, root=BENCH_DIR):
+    label = run_label()
+    frames = []
+    for size in sizes:
+        workdir = prepare(size, source, root)
+        print(f"📊 Measuring {size:,} rows")
+        out = subprocess.run([sys.executable, os.path.join(REPO, 'bench_dashboards.py'), '--measure', str(size)],
+                             cwd=workdir, env=_env(), capture_output=True, text=True, check=True).stdout
+        frames.append(pd.DataFrame(json.loads(out.strip().splitlines()[-1])))
+    df = pd.concat(frames, ignore_index=True)
+    df.insert(0, 'run', label)
+    return df
+
+
+def scaling_curves(df):
+    """Median wall time, peak memory and JSON size per callback and dataset size."""
+    return df.groupby(['callback', 'rows'])[['wall_ms', 'peak_mb', 'json_bytes']].median().unstack('rows')
+
+
+def plot(results, path):
+    import plotly.express as px
+    curves = results.groupby(['run', 'callback', 'rows'], as_index=False)['wall_ms'].median()
+    fig = px.line(curves, x='rows', y='wall_ms', color='callback', line_dash='run', markers=True,
+                  log_x=True, log_y=True, template='plotly_white',
+                  title="Dashboard callback wall time (median over inputs)")
+    fig.write_html(path)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3 and sys.argv[1] == '--measure':
+        measure(int(sys.argv[2]))
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(description="Scaling benchmark of the dashboard callbacks")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--source', default=SOURCE_PATH, help="preprocessed CSV the synthetic data is learned from")
+    parser.add_argument('--dir', default=BENCH_DIR, help="where the per-size datasets are kept")
+    parser.add_argument('--out', default=RESULTS, help="CSV the results are appended to, one run per invocation")
+    parser.add_argument('--plot', metavar='HTML', help="write the wall-time curves of every recorded run")
+    args = parser.parse_args()
+
+    df = bench(args.sizes, args.source, args.dir)
+    os.makedirs(os.path.dirname(args.out) or '.', exist_ok=True)
+    df.to_csv(args.out, mode='a', header=not os.path.exists(args.out), index=False)
+    with pd.option_context('display.width', 200, 'display.max_columns', 50):
+        print(scaling_curves(df).to_string())
+    print(f"✅ Appended {len(df)} measurements to {args.out}")
+    if args.plot:
+        plot(pd.read_csv(args.out), args.plot)
+        print(f"✅ Scaling curves written to {args.plot}")
@@ -0,0 +1,115 @@
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+import numpy as np
+import pandas as pd
+
+from prediction import FEATURES
+
+# ─── 1) Servers under test ───────────────────────────────────────────────────────
+# Both serve the same /predict contract from the same model; only the server
+# model differs (thread per connection vs one event loop).
+SERVERS = {
+    'flask/waitress': [sys.executable, '-m', 'waitress', '--port={port}', '--threads=128', 'app2:app'],
+    'asgi/uvicorn': [sys.executable, '-m', 'uvicorn', 'app_async:app', '--port={port}',
+                     '--log-level=warning', '--limit-concurrency=4096'],
+}
+DATA_PATH = 'dataset/clean_preprocessed_dataset.csv'
+CONCURRENCY = [1, 16, 64, 256, 1024]
+# all load comes from one address, so the per-client rate limit is switched off
+SERVER_ENV = {**os.environ, 'ADMISSION_CLIENT_RATE': '0'}
+
+
+def start(command, port):
+    proc = subprocess.Popen([arg.format(port=port) for arg in command], env=SERVER_ENV,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(600):
+        try:
+            if httpx.get(url + '/health', timeout=1).status_code == 200:
+                return proc, url
+        except httpx.HTTPError:
+            pass
+        if proc.poll() is not None:
+            break
+        time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError(f"server did not start: {' '.join(command)}")
+
+
+# ─── 2) Load generator ───────────────────────────────────────────────────────────
+async def load(url, payloads, concurrency, requests):
+    """Fire `requests` posts with `concurrency` open connections; latencies in ms.
+
+    The servers run without the per-client rate limit (SERVER_ENV); shed counts
+    the 503/429 answers of admission control.
+    """
+    latencies, errors, shed = [], 0, 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        queue = iter(range(requests))
+
+        async def worker():
+            nonlocal errors, shed
+            for i in queue:
+                t = time.perf_counter()
+                try:
+                    r = await client.post('/predict', json=payloads[i % len(payloads)])
+                    status = r.status_code
+                except httpx.HTTPError:
+                    status = None
+                if status == 200:
+                    latencies.append((time.perf_counter() - t) * 1000)
+                elif status in (429, 503):
+                    shed += 1
+                else:
+                    errors += 1
+
+        start_time = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start_time
+    lat = np.array(latencies or [np.nan])
+    return {'concurrency': concurrency, 'requests': requests, 'errors': errors, 'shed': shed,
+            'req_per_s': round(len(latencies) / elapsed, 1),
+            'p50_ms': round(float(np.percentile(lat, 50)), 2),
+            'p99_ms': round(float(np.percentile(lat, 99)), 2)}
+
+
+# ─── 3) CLI ──────────────────────────────────────────────────────────────────────
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Throughput of app2.py (Flask/waitress) vs app_async.py (ASGI)")
+    parser.add_argument('--data', default=DATA_PATH, help="postings to draw request payloads from")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=CONCURRENCY)
+    parser.add_argument('--requests', type=int, default=2000, help="requests per concurrency level")
+    parser.add_argument('--port', type=int, default=5100)
+    parser.add_argument('--out', help="optional CSV of the results")
+    args = parser.parse_args()
+
+    payloads = (pd.read_csv(args.data, usecols=FEATURES).dropna()
+                .sample(n=1000, replace=True, random_state=0).to_dict('records'))
+
+    rows = []
+    for i, (name, command) in enumerate(SERVERS.items()):
+        proc, url = start(command, args.port + i)
+        print(f"⚙️ {name} on {url}")
+        try:
+            asyncio.run(load(url, payloads, 8, 200))     # warm-up
+            for c in args.concurrency:
+                result = {'server': name, **asyncio.run(load(url, payloads, c, max(args.requests, c)))}
+                print(f"   c={c:<5} {result['req_per_s']:>8} req/s  p50 {result['p50_ms']} ms  "
+                      f"p99 {result['p99_ms']} ms  shed {result['shed']}  errors {result['errors']}")
+                rows.append(result)
+        finally:
+            proc.terminate()
+            proc.wait()
+
+    table = pd.DataFrame(rows).pivot(index='concurrency', columns='server', values='req_per_s')
+    print("\n📊 Requests per second\n" + table.to_string())
+    if args.out:
+        pd.DataFrame(rows).to_csv(args.out, index=False)
+        print(f"✅ Results saved to {args.out}")
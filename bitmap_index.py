@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+
+# ─── 1) Defaults ─────────────────────────────────────────────────────────────────
+INDEXED_COLUMNS = ['category', 'state', 'type', 'location']
+
+# Rare values keep a sorted row-id list instead of a full bitmap (roaring-style):
+# a uint32 posting costs 4 bytes, a packed bitmap n_rows / 8 bytes.
+POSTING_RATIO = 32
+
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def popcount(bits):
+    return int(_POPCOUNT[bits].sum(dtype=np.int64))
+
+
+# ─── 2) Index ────────────────────────────────────────────────────────────────────
+class BitmapIndex:
+    """Per-value row bitmaps over the categorical columns of a DataFrame.
+
+    Analytics builds one per shared generation (shared_dataset.py stores text
+    columns as category codes) and answers counts() on these columns from it.
+
+    Filters are keyword arguments: a label, a list of labels (OR), or None (no filter).
+    Different columns are ANDed together.
+    """
+
+    def __init__(self, df, columns=INDEXED_COLUMNS):
+        self.n_rows = len(df)
+        self.n_bytes = (self.n_rows + 7) // 8
+        self.codes = {}
+        self.labels = {}
+        self.entries = {}
+        self._lookup = {}
+        for col in columns:
+            if col in df.columns:
+                self._add_column(col, df[col])
+
+    def _add_column(self, col, series):
+        codes = series.cat.codes.to_numpy()
+        categories = series.cat.categories
+        order = np.argsort(codes, kind='stable').astype(np.uint32)
+        bounds = np.searchsorted(codes[order], np.arange(len(categories) + 1))
+        entries = {}
+        for code in range(len(categories)):
+            ids = order[bounds[code]:bounds[code + 1]]
+            if len(ids) == 0:
+                continue
+            if len(ids) * POSTING_RATIO < self.n_rows:
+                entries[code] = ('ids', ids)
+            else:
+                mask = np.zeros(self.n_rows, dtype=bool)
+                mask[ids] = True
+                entries[code] = ('bits', np.packbits(mask))
+        self.codes[col] = codes
+        self.labels[col] = categories
+        self.entries[col] = entries
+        self._lookup[col] = {label: i for i, label in enumerate(categories)}
+
+    # ─── Set algebra ─────────────────────────────────────────────────────────────
+    def _union(self, col, values):
+        if not isinstance(values, (list, tuple, set)):
+            values = [values]
+        found = [self.entries[col][c] for c in (self._lookup[col].get(v) for v in values)
+                 if c in self.entries[col]]
+        if not found:
+            return ('ids', np.empty(0, dtype=np.uint32))
+        if len(found) == 1:
+            return found[0]
+        if all(kind == 'ids' for kind, _ in found):
+            return ('ids', np.sort(np.concatenate([ids for _, ids in found])))
+        bits = np.zeros(self.n_bytes, dtype=np.uint8)
+        for kind, data in found:
+            bits |= data if kind == 'bits' else self._to_bits(data)
+        return ('bits', bits)
+
+    def _to_bits(self, ids):
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[ids] = True
+        return np.packbits(mask)
+
+    def _test(self, bits, ids):
+        hit = (bits[ids >> 3] >> (7 - (ids & 7))) & 1
+        return ids[hit.astype(bool)]
+
+    def _intersect(self, a, b):
+        (ka, da), (kb, db) = a, b
+        if ka == 'bits' and kb == 'bits':
+            return ('bits', da & db)
+        if ka == 'ids' and kb == 'ids':
+            return ('ids', np.intersect1d(da, db, assume_unique=True))
+        bits, ids = (da, db) if ka == 'bits' else (db, da)
+        return ('ids', self._test(bits, ids))
+
+    def select(self, **filters):
+        """Combined selection as ('bits', packed) or ('ids', sorted row ids); None means all rows."""
+        result = None
+        for col, values in filters.items():
+            if values is None or (isinstance(values, (list, tuple, set)) and not values):
+                continue
+            part = self._union(col, values)
+            result = part if result is None else self._intersect(result, part)
+        return result
+
+    # ─── Results ─────────────────────────────────────────────────────────────────
+    def count(self, **filters):
+        selection = self.select(**filters)
+        if selection is None:
+            return self.n_rows
+        kind, data = selection
+        return popcount(data) if kind == 'bits' else len(data)
+
+    def rows(self, **filters):
+        """Row positions for df.take(); None when no filter applies."""
+        selection = self.select(**filters)
+        if selection is None:
+            return None
+        kind, data = selection
+        if kind == 'ids':
+            return data
+        return np.flatnonzero(np.unpackbits(data, count=self.n_rows))
+
+    def counts(self, col, rows=None, dropna=True):
+        """Postings per label of col within rows (all rows if None), zero counts dropped.
+
+        dropna=False adds the rows where col is missing under a NaN label, last.
+        """
+        codes = self.codes[col] if rows is None else self.codes[col][rows]
+        tally = np.bincount(codes[codes >= 0], minlength=len(self.labels[col]))
+        keep = np.flatnonzero(tally)
+        counts = pd.Series(tally[keep], index=self.labels[col][keep], name='count')
+        missing = int((codes < 0).sum())
+        if not dropna and missing:
+            counts = pd.concat([counts, pd.Series([missing], index=[np.nan], name='count')])
+        return counts
+
+    def count_frame(self, col, rows=None, dropna=True):
+        """counts() as a ['label', 'count'] frame for pie charts."""
+        return self.counts(col, rows, dropna).rename_axis('label').reset_index()
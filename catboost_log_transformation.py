@@ -5,6 +5,9 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from catboost import CatBoostRegressor, Pool
 import numpy as np
+from vocab import Vocabulary, VOCAB_PATH, sidecar_path
+
+MODEL_PATH = "catboost_salary_model2.cbm"
 
 # Load dataset
 df = pd.read_csv("dataset/clean_preprocessed_dataset.csv")
@@ -16,21 +19,23 @@ df = df.drop(columns=["job_id", "salary", "min_salary", "max_salary", "listingDa
 
 # Define features and target
 selected_features = ['category', 'role', 'location', 'type']
-X = df[selected_features]
+vocab = Vocabulary.for_frame(df, VOCAB_PATH)
+X = vocab.codes(df, selected_features)
 y = df['log_mean_salary']
 
 # Split data
 X_train_cat, X_test_cat, y_train_cat, y_test_cat = train_test_split(X, y, test_size=0.2, random_state=42)
 
-# Identify categorical columns
-cat_features = [col for col in X.columns if X[col].dtype == 'object']
+# All selected features are vocabulary codes
+cat_features = selected_features
 
 # Initialize and train model
 model_cb = CatBoostRegressor(verbose=0, random_state=42)
 model_cb.fit(X_train_cat, y_train_cat, cat_features=cat_features)
 
-# Save the model
-model_cb.save_model("catboost_salary_model2.cbm")
+# Save the model together with the vocabulary it was trained on
+model_cb.save_model(MODEL_PATH)
+vocab.save(sidecar_path(MODEL_PATH))
 
 # Evaluate the model
 # y_pred_cb = model_cb.predict(X_test_cat)
@@ -1,33 +1,45 @@
+import os
 import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
 import matplotlib.pyplot as plt
 import seaborn as sns
 from catboost import CatBoostRegressor, Pool
+from vocab import Vocabulary, VOCAB_PATH, sidecar_path
+from model_meta import save_meta, watermark_of
+
+MODEL_PATH = "model/catboost_salary_model2.cbm"
 
 # Load dataset
 df = pd.read_csv("dataset/clean_preprocessed_dataset.csv")
 
+# Newest posting the model has seen (starting point for incremental_train.py)
+watermark = watermark_of(df)
+
 # Drop irrelevant columns
 df = df.drop(columns=["job_id", "salary", "min_salary", "max_salary", "listingDate"])
 
 # Define features and target
 selected_features = ['category', 'role', 'location', 'type']
-X = df[selected_features]
+vocab = Vocabulary.for_frame(df, VOCAB_PATH)
+X = vocab.codes(df, selected_features)
 y = df["mean_salary"]
 
 # Split data
 X_train_cat, X_test_cat, y_train_cat, y_test_cat = train_test_split(X, y, test_size=0.2, random_state=42)
 
-# Identify categorical columns
-cat_features = [col for col in X.columns if X[col].dtype == 'object']
+# All selected features are vocabulary codes
+cat_features = selected_features
 
 # Initialize and train model
 model_cb = CatBoostRegressor(verbose=0, random_state=42)
 model_cb.fit(X_train_cat, y_train_cat, cat_features=cat_features)
 
-# # Save the model
-# model_cb.save_model("catboost_salary_model2.cbm")
+# Save the model together with the vocabulary it was trained on
+os.makedirs(os.path.dirname(MODEL_PATH), exist_ok=True)
+model_cb.save_model(MODEL_PATH)
+vocab.save(sidecar_path(MODEL_PATH))
+save_meta(MODEL_PATH, watermark=watermark, vocab_version=vocab.version, rows=len(X_train_cat))
 
 # Evaluate the model
 y_pred_cb = model_cb.predict(X_test_cat)
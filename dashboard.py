@@ -0,0 +1,62 @@
+import dash
+from dash import Dash, dcc, html
+from flask import jsonify, request
+import dash_bootstrap_components as dbc
+
+import data_layer as data
+from search_index import TOP_K
+
+# ─── 1) Initialize App ──────────────────────────────────────────────────────────
+# One process serves every view; pages/*.py register their layouts and
+# callbacks against the shared data layer, which is loaded once, here. Layouts
+# are functions, so each page load shows the generation currently published.
+app = Dash(
+    __name__,
+    use_pages=True,
+    external_stylesheets=[dbc.themes.FLATLY],
+    title="JobStreet Dashboard"
+)
+server = app.server
+
+@server.route('/api/search')
+def search_values():
+    field = request.args.get('field', '')
+    search_indexes = data.current().search_indexes
+    if field not in search_indexes:
+        return jsonify({'error': f"Unknown field: {field}"}), 400
+    k = max(1, min(request.args.get('k', TOP_K, type=int), 100))
+    return jsonify(search_indexes[field].search(request.args.get('q', ''), k))
+
+# ─── 2) Navbar & KPI Cards ──────────────────────────────────────────────────────
+navbar = dbc.NavbarSimple(
+    [dbc.NavItem(dbc.NavLink(page['name'], href=page['relative_path'], active='exact'))
+     for page in dash.page_registry.values()],
+    brand="📈 JobStreet Insights",
+    color="dark",
+    dark=True,
+    fluid=True,
+)
+
+def kpi_row(kpi):
+    return dbc.Row([
+        dbc.Col(dbc.Card(dbc.CardBody([html.H6("Total Postings"), html.H2(f"{kpi.total_jobs:,}")]), color="info", inverse=True), width=3),
+        dbc.Col(dbc.Card(dbc.CardBody([html.H6("Avg Min Salary (RM)"), html.H2(f"{kpi.avg_min_salary:,.0f}")]), color="success", inverse=True), width=3),
+        dbc.Col(dbc.Card(dbc.CardBody([html.H6("Avg Mean Salary (RM)"), html.H2(f"{kpi.avg_mean_salary:,.0f}")]), color="warning", inverse=True), width=3),
+        dbc.Col(dbc.Card(dbc.CardBody([html.H6("Avg Max Salary (RM)"), html.H2(f"{kpi.avg_max_salary:,.0f}")]), color="danger",  inverse=True), width=3),
+    ], className="mt-4 g-4")
+
+# ─── 3) Layout ─────────────────────────────────────────────────────────────────
+def serve_layout():
+    return dbc.Container(fluid=True, children=[
+        navbar,
+        kpi_row(data.current()),
+        dash.page_container,
+        # shipped once per session; only read by the clientside callbacks
+        dcc.Store(id='aggregates', data=data.client_aggregates() if data.CLIENTSIDE else None),
+    ])
+
+app.layout = serve_layout
+
+# ─── 4) Run ─────────────────────────────────────────────────────────────────────
+if __name__ == '__main__':
+    app.run(debug=True)
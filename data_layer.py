@@ -0,0 +1,114 @@
+import functools
+import os
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from analytics import Analytics
+from search_index import SEARCH_FIELDS, SearchIndex
+from shared_dataset import SharedDataset, current_generation
+
+# ─── Shared, read-only data for every dashboard page ─────────────────────────────
+# Imported once per process by dashboard.py; pages only read from it.
+# Once shared_dataset.py has published a generation, every gunicorn worker maps
+# that one copy instead of opening its own (aggregates still run in DuckDB).
+# Anything derived from the data is memoized per generation (per_generation), so
+# a publish shows up on the next page load without restarting the workers.
+if current_generation():
+    db = Analytics('postings', shared=SharedDataset())
+else:
+    db = Analytics('postings')   # dataset/analytics.duckdb
+PX = 'plotly_white'
+SALARY = ['min_salary', 'max_salary', 'mean_salary']
+# DASHBOARD_CLIENTSIDE=1: bar-click histograms and the dropdown pies are drawn in
+# the browser (assets/clientside.js) from client_aggregates(), shipped once
+CLIENTSIDE = os.environ.get('DASHBOARD_CLIENTSIDE') == '1'
+HIST_BINS = 30
+CUBE_DIMS = ['category', 'state', 'type']
+
+
+
+def per_generation(build):
+    """Memoize build() for the generation db is serving; it runs again after a publish."""
+    cached = functools.lru_cache(maxsize=1)(lambda generation: build())
+
+    @functools.wraps(build)
+    def current():
+        return cached(db.generation)
+    return current
+
+
+class Snapshot:
+    """KPIs, dropdown options and search indexes of one generation of the data."""
+
+    def __init__(self):
+        # KPI values
+        self.overall         = db.salary_stats().iloc[0]
+        self.total_jobs      = int(self.overall['count'])
+        self.avg_min_salary  = self.overall['min_salary']
+        self.avg_mean_salary = self.overall['mean_salary']
+        self.avg_max_salary  = self.overall['max_salary']
+
+        # Dropdown options
+        self.categories = db.distinct('category')
+        self.states     = db.distinct('state')
+        self.types      = db.distinct('type')
+        self.roles      = db.distinct('role')
+        self.locations  = db.distinct('location')
+
+        # Postings per category (label/count), shared by the bar and pie charts
+        self.category_counts = db.counts('category')
+
+        # Large option lists (job title, role, location) are searched server-side
+        self.search_indexes = {field: SearchIndex(db.counts(field).set_index('label')['count'])
+                               for field in SEARCH_FIELDS if field in db.columns}
+
+
+current = per_generation(Snapshot)
+
+
+def top_options(field, query=None):
+    return [{'label': v, 'value': v} for v in current().search_indexes[field].search(query)]
+
+
+def _dense(rows):
+    """Counts per bin, zero-filled, from a histogram() frame of bin/count."""
+    bins = [0] * HIST_BINS
+    for b, n in zip(rows['bin'], rows['count']):
+        bins[int(b)] = int(n)
+    return bins
+
+
+def histogram_figure(col, title, margin=None, **filters):
+    """Histogram of a salary column, binned in DuckDB; drawn like assets/clientside.js does."""
+    edges, counts = db.histogram(col, HIST_BINS, **filters)
+    fig = go.Figure()
+    if edges:
+        width = edges[1] - edges[0]
+        fig.add_bar(x=[e + width / 2 for e in edges[:-1]], y=_dense(counts), width=width,
+                    hovertemplate=col + '=%{x:,.0f}<br>count=%{y}<extra></extra>')
+    return fig.update_layout(template=PX, title_text=title, bargap=0, margin=margin,
+                             xaxis_title='Salary (RM)', yaxis_title='count')
+
+
+@per_generation
+def client_aggregates():
+    """Everything the clientside callbacks need, as plain JSON.
+
+    hist: per salary column, the bin edges and counts overall and per category.
+    cube: posting count and salary sums per category/state/type combination,
+    from which any filter of those three dimensions can be re-aggregated.
+    """
+    hist = {}
+    for col in SALARY:
+        edges, counts = db.histogram(col, HIST_BINS)
+        _, by_cat = db.histogram(col, HIST_BINS, by='category')
+        hist[col] = {'edges': edges, 'all': _dense(counts),
+                     'by': {str(cat): _dense(rows) for cat, rows in by_cat.groupby('category', observed=True)}}
+    cube = db.cube(CUBE_DIMS)
+    return {
+        'template': pio.templates[PX].to_plotly_json(),
+        'hist': hist,
+        'cube': {'columns': list(cube.columns),
+                 'rows': cube.astype(object).where(cube.notna(), None).values.tolist()},
+    }
@@ -0,0 +1,142 @@
+import glob
+import os
+import sys
+from urllib.parse import quote, unquote
+
+import pandas as pd
+
+from model_meta import DATE_COL, listing_dates
+
+# ─── 1) Layout ───────────────────────────────────────────────────────────────────
+# dataset/store/month=2025-03/category=Information%20%26%20Communication%20Technology/part.parquet
+# Every file also keeps its listingDate and category columns; the directory
+# names only exist so a query can skip files without opening them.
+STORE_DIR = 'dataset/store'
+CLEAN_PATH = 'dataset/clean_preprocessed_dataset.csv'
+PART = 'part.parquet'
+UNKNOWN_MONTH = 'unknown'
+NULL_CATEGORY = '__null__'
+
+
+def listing_month(df):
+    return listing_dates(df).dt.strftime('%Y-%m').fillna(UNKNOWN_MONTH)
+
+
+def partition_path(root, month, category):
+    return os.path.join(root, f"month={month}", f"category={quote(str(category), safe='')}", PART)
+
+
+def partitions(root=STORE_DIR):
+    """Every partition on disk as a frame of month, category, path."""
+    rows = []
+    for path in glob.glob(os.path.join(root, 'month=*', 'category=*', PART)):
+        category_dir = os.path.dirname(path)
+        month_dir = os.path.dirname(category_dir)
+        rows.append((os.path.basename(month_dir).split('=', 1)[1],
+                     unquote(os.path.basename(category_dir).split('=', 1)[1]), path))
+    return pd.DataFrame(rows, columns=['month', 'category', 'path']).sort_values(['month', 'category'],
+                                                                                 ignore_index=True)
+
+
+# ─── 2) Write ────────────────────────────────────────────────────────────────────
+def write_partitions(df, root=STORE_DIR, months=None):
+    """Write df into month/category partitions.
+
+    Only the months given (default: every month in df) are replaced, and within
+    them any category no longer present is removed; other months are not touched.
+    """
+    month = listing_month(df)
+    months = sorted(set(month) if months is None else set(months))
+    keep = month.isin(months)
+    df, month = df[keep], month[keep]
+    category = df['category'].fillna(NULL_CATEGORY).astype(str)
+
+    written = set()
+    for (m, cat), rows in df.groupby([month, category], sort=True):
+        path = partition_path(root, m, cat)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        rows.to_parquet(path + '.tmp', index=False)
+        os.replace(path + '.tmp', path)
+        written.add(path)
+    for m in months:
+        for path in glob.glob(os.path.join(root, f"month={m}", 'category=*', PART)):
+            if path not in written:
+                os.remove(path)
+    return months
+
+
+# ─── 3) Query ────────────────────────────────────────────────────────────────────
+def _utc(ts):
+    ts = pd.Timestamp(ts)
+    return ts.tz_localize('UTC') if ts.tzinfo is None else ts.tz_convert('UTC')
+
+
+def prune(parts, categories=None, start=None, end=None, months=None):
+    """Partitions that can hold rows with start <= listingDate < end in the given categories/months."""
+    keep = pd.Series(True, index=parts.index)
+    if months is not None:
+        keep &= parts['month'].isin(months)
+    if categories is not None:
+        keep &= parts['category'].isin(categories)
+    if start is not None or end is not None:
+        keep &= parts['month'] != UNKNOWN_MONTH
+    if start is not None:
+        keep &= parts['month'] >= _utc(start).strftime('%Y-%m')
+    if end is not None:
+        keep &= parts['month'] <= _utc(end).strftime('%Y-%m')
+    return parts[keep]
+
+
+def _filter(df, categories=None, start=None, end=None):
+    mask = pd.Series(True, index=df.index)
+    if categories is not None:
+        mask &= df['category'].isin(categories)
+    if start is not None or end is not None:
+        dates = listing_dates(df)
+        if start is not None:
+            mask &= dates >= _utc(start)
+        if end is not None:
+            mask &= dates < _utc(end)
+    return df[mask]
+
+
+def query(columns=None, categories=None, start=None, end=None, months=None, root=STORE_DIR):
+    """Rows from the store, reading only the partitions and columns needed.
+
+    categories / months are lists of values; start / end bound listingDate
+    (start inclusive, end exclusive). columns=None reads every column.
+    """
+    parts = prune(partitions(root), categories, start, end, months)
+    read = None
+    if columns is not None:
+        read = list(dict.fromkeys(columns + ([DATE_COL] if start is not None or end is not None else [])))
+    frames = [pd.read_parquet(path, columns=read) for path in parts['path']]
+    if not frames:
+        return pd.DataFrame(columns=columns or [])
+    df = pd.concat(frames, ignore_index=True)
+    # partition pruning is month-granular; trim the edge months to the exact range
+    df = _filter(df, start=start, end=end).reset_index(drop=True)
+    return df if columns is None else df[columns]
+
+
+def load(columns=None, csv_path=CLEAN_PATH, root=STORE_DIR, **filters):
+    """query() when the store has been built, otherwise the same slice from the flat clean CSV."""
+    if os.path.isdir(root):
+        return query(columns, root=root, **filters)
+    months = filters.pop('months', None)
+    usecols = None
+    if columns is not None:
+        need = set(columns) | {'category', DATE_COL}
+        usecols = lambda c: c in need
+    df = pd.read_csv(csv_path, usecols=usecols)
+    if months is not None:
+        df = df[listing_month(df).isin(months)]
+    df = _filter(df, **filters).reset_index(drop=True)
+    return df if columns is None else df[columns]
+
+
+if __name__ == '__main__':
+    src = sys.argv[1] if len(sys.argv) > 1 else CLEAN_PATH
+    dst = sys.argv[2] if len(sys.argv) > 2 else STORE_DIR
+    written = write_partitions(pd.read_csv(src, dtype={'mean_salary': 'Int64'}), dst)
+    print(f"✅ {len(partitions(dst))} partitions over {len(written)} months written to {dst}")
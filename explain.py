@@ -0,0 +1,127 @@
+import argparse
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from catboost import Pool
+
+# ─── 1) Defaults ─────────────────────────────────────────────────────────────────
+CACHE_SIZE = 200_000    # feature tuples kept in memory
+DATA_PATH = 'dataset/clean_preprocessed_dataset.csv'
+
+
+def shap_path(model_path):
+    """Precomputed explanations that ship next to a model."""
+    return f"{os.path.splitext(model_path)[0]}.shap.npz"
+
+
+def model_digest(model_path):
+    with open(model_path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()[:12]
+
+
+# ─── 2) Explainer ────────────────────────────────────────────────────────────────
+class Explainer:
+    """Per-feature SHAP contributions of a CatBoost model, cached per encoded feature tuple.
+
+    Cache misses of one call are explained together in a single tree-SHAP pass;
+    precompute() fills the cache for every combination seen in the data and
+    save()/load() keep that next to the model for the next server start.
+    """
+
+    def __init__(self, model, features, cache_size=CACHE_SIZE):
+        self.model = model
+        self.features = list(features)
+        self.cache_size = cache_size
+        self._cat_features = list(model.get_cat_feature_indices())
+        self._cache = OrderedDict()     # code tuple -> (base value, contributions)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _shap(self, keys):
+        frame = pd.DataFrame(list(keys), columns=self.features)
+        values = self.model.get_feature_importance(Pool(frame, cat_features=self._cat_features), type='ShapValues')
+        return [(float(v[-1]), v[:-1]) for v in values]      # last column is the expected value
+
+    def _store(self, pairs):
+        with self._lock:
+            for key, value in pairs:
+                self._cache[key] = value
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def explain(self, keys):
+        """(base value, contribution per feature) for each code tuple, in order."""
+        keys = [tuple(int(c) for c in key) for key in keys]
+        found = {}
+        with self._lock:
+            for key in keys:
+                value = self._cache.get(key)
+                if value is not None:
+                    self._cache.move_to_end(key)
+                    found[key] = value
+            missing = list(dict.fromkeys(key for key in keys if key not in found))
+            self.hits += len(keys) - len(missing)
+            self.misses += len(missing)
+        if missing:
+            computed = list(zip(missing, self._shap(missing)))
+            self._store(computed)
+            found.update(computed)
+        return [found[key] for key in keys]
+
+    def precompute(self, keys, batch=50_000):
+        keys = list(dict.fromkeys(tuple(int(c) for c in key) for key in keys))
+        for start in range(0, len(keys), batch):
+            chunk = keys[start:start + batch]
+            self._store(zip(chunk, self._shap(chunk)))
+        return len(keys)
+
+    def save(self, path, digest):
+        with self._lock:
+            keys = np.array(list(self._cache), dtype=np.int32).reshape(-1, len(self.features))
+            base = np.array([v[0] for v in self._cache.values()])
+            contributions = np.array([v[1] for v in self._cache.values()]).reshape(-1, len(self.features))
+        tmp = path + '.tmp.npz'
+        np.savez(tmp, keys=keys, base=base, contributions=contributions,
+                 features=np.array(self.features), digest=np.array(digest))
+        os.replace(tmp, path)
+
+    def load(self, path, digest):
+        """Fill the cache from save(); ignored if it was made for another model or feature set."""
+        if not os.path.exists(path):
+            return 0
+        data = np.load(path)
+        if str(data['digest']) != digest or list(data['features']) != self.features:
+            print(f"⚠️ Ignoring {path}: made for a different model")
+            return 0
+        self._store((tuple(k), (float(b), c)) for k, b, c in
+                    zip(data['keys'].tolist(), data['base'], data['contributions']))
+        return len(data['keys'])
+
+    def stats(self):
+        with self._lock:
+            return {'cached': len(self._cache), 'hits': self.hits, 'misses': self.misses}
+
+
+# ─── 3) Offline precompute ───────────────────────────────────────────────────────
+if __name__ == '__main__':
+    from prediction import MODEL_PATH, SalaryPredictor
+
+    parser = argparse.ArgumentParser(description="Precompute SHAP explanations for every observed feature combination")
+    parser.add_argument('--model', default=MODEL_PATH)
+    parser.add_argument('--data', default=DATA_PATH)
+    args = parser.parse_args()
+
+    predictor = SalaryPredictor(args.model)
+    df = pd.read_csv(args.data, usecols=predictor.features)
+    codes = predictor.vocab.codes(df, predictor.features).drop_duplicates()
+    codes = codes[(codes >= 0).all(axis=1)]
+    explainer = Explainer(predictor.model, predictor.features, cache_size=max(CACHE_SIZE, len(codes)))
+    n = explainer.precompute(codes.itertuples(index=False, name=None))
+    explainer.save(shap_path(args.model), model_digest(args.model))
+    print(f"✅ Saved explanations for {n:,} feature combinations to {shap_path(args.model)}")
@@ -0,0 +1,237 @@
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+# ─── 1) Layout ───────────────────────────────────────────────────────────────────
+# <dir>/meta.json         format, tree/node counts, depth, input columns
+# <dir>/<array>.npy       every tree's nodes in one flat, uncompressed table
+# <dir>/preprocess.pkl    the pipeline's preprocessing steps (small), if any
+#
+# The .npy files are opened with mmap_mode='r', so loading is near-instant and
+# every app.py worker shares one page-cache copy of the trees instead of
+# unpickling its own. Child indices are absolute into the flat table; -1 marks
+# a leaf.
+FOREST_DIR = 'salary_predictor_model.forest'
+PICKLE_PATH = 'salary_predictor_model.pkl'
+ARRAYS = ['left', 'right', 'feature', 'threshold', 'value', 'roots']
+FORMAT = 1
+CHUNK = 1024            # rows walked per traversal pass
+
+
+# ─── 2) Export ───────────────────────────────────────────────────────────────────
+def _split(model):
+    """(preprocessing pipeline or None, fitted forest) from a Pipeline or a bare forest."""
+    if hasattr(model, 'steps'):
+        return (model[:-1] if len(model.steps) > 1 else None), model.steps[-1][1]
+    return None, model
+
+
+def _prune(left, right, value):
+    """Collapse splits whose children are leaves with equal values, then drop unreachable nodes."""
+    left, right, value = left.copy(), right.copy(), value.copy()
+    while True:
+        internal = np.flatnonzero(left >= 0)
+        l, r = left[internal], right[internal]
+        same = (left[l] < 0) & (left[r] < 0) & (value[l] == value[r])
+        if not same.any():
+            break
+        nodes = internal[same]
+        value[nodes] = value[left[nodes]]
+        left[nodes] = right[nodes] = -1
+    keep = np.zeros(len(left), dtype=bool)
+    frontier = np.array([0])
+    while len(frontier):
+        keep[frontier] = True
+        frontier = np.concatenate([left[frontier], right[frontier]])
+        frontier = frontier[frontier >= 0]
+    return keep, left, right, value
+
+
+def export(model, out_dir=FOREST_DIR, compact=False):
+    """Write a fitted RandomForestRegressor (or a Pipeline ending in one) as mappable arrays.
+
+    compact stores thresholds and leaf values as float32 and prunes splits that
+    cannot change the prediction at that precision.
+    """
+    preprocess, forest = _split(model)
+    real = np.float32 if compact else np.float64
+    parts = {name: [] for name in ARRAYS if name != 'roots'}
+    roots, offset = [], 0
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        left, right = tree.children_left.astype(np.int64), tree.children_right.astype(np.int64)
+        value = tree.value[:, 0, 0].astype(real)
+        keep = np.ones(tree.node_count, dtype=bool)
+        if compact:
+            keep, left, right, value = _prune(left, right, value)
+        index = np.cumsum(keep) - 1         # old node id -> new, among kept nodes
+        left = np.where(left[keep] >= 0, index[np.maximum(left[keep], 0)] + offset, -1)
+        right = np.where(right[keep] >= 0, index[np.maximum(right[keep], 0)] + offset, -1)
+        leaf = left < 0
+        parts['left'].append(left.astype(np.int32))
+        parts['right'].append(right.astype(np.int32))
+        parts['feature'].append(np.where(leaf, 0, tree.feature[keep]).astype(np.int32))
+        parts['threshold'].append(np.where(leaf, 0, tree.threshold[keep]).astype(real))
+        parts['value'].append(value[keep])
+        roots.append(offset)
+        offset += int(keep.sum())
+
+    tmp = out_dir + '.tmp'
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    arrays = {name: np.concatenate(chunks) for name, chunks in parts.items()}
+    arrays['roots'] = np.array(roots, dtype=np.int32)
+    for name, values in arrays.items():
+        np.save(os.path.join(tmp, f"{name}.npy"), values, allow_pickle=False)
+    if preprocess is not None:
+        joblib.dump(preprocess, os.path.join(tmp, 'preprocess.pkl'))
+    meta = {
+        'format': FORMAT,
+        'trees': len(roots),
+        'nodes': offset,
+        'compact': compact,
+        'n_features': int(forest.n_features_in_),
+        'columns': list(getattr(model, 'feature_names_in_', [])),
+        'max_depth': int(max(e.tree_.max_depth for e in forest.estimators_)),
+    }
+    with open(os.path.join(tmp, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=1)
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.replace(tmp, out_dir)
+    return meta
+
+
+# ─── 3) Load & predict ───────────────────────────────────────────────────────────
+class MappedForest:
+    """Read-only forest over memory-mapped node arrays; predict() matches the pipeline's."""
+
+    def __init__(self, path=FOREST_DIR):
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        for name in ARRAYS:
+            setattr(self, name, np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r'))
+        pre = os.path.join(path, 'preprocess.pkl')
+        self.preprocess = joblib.load(pre) if os.path.exists(pre) else None
+
+    @staticmethod
+    def _features(X, rows, features):
+        """X[rows, features] as float32, the dtype sklearn compares against the thresholds.
+
+        A sparse X (the one-hot output) is sampled in place rather than densified,
+        which would cost chunk rows * one-hot width per pass.
+        """
+        if hasattr(X, 'tocsr'):
+            rows = np.broadcast_to(rows, features.shape)
+            return np.asarray(X[rows.ravel(), features.ravel()], dtype=np.float32).reshape(features.shape)
+        return X[rows, features].astype(np.float32)
+
+    def _leaves(self, X):
+        """Leaf node per (row, tree), walking every tree level by level."""
+        nodes = np.broadcast_to(np.asarray(self.roots, dtype=np.int64), (X.shape[0], len(self.roots))).copy()
+        rows = np.arange(X.shape[0])[:, None]
+        for _ in range(self.meta['max_depth']):
+            left = self.left[nodes]
+            active = left >= 0
+            if not active.any():
+                break
+            go_left = self._features(X, rows, self.feature[nodes]) <= self.threshold[nodes]
+            nodes = np.where(active, np.where(go_left, left, self.right[nodes]), nodes)
+        return nodes
+
+    def predict(self, X):
+        if self.preprocess is not None:
+            X = self.preprocess.transform(X)
+        X = X.tocsr() if hasattr(X, 'tocsr') else np.asarray(X)
+        out = np.empty(X.shape[0])
+        for start in range(0, X.shape[0], CHUNK):
+            out[start:start + CHUNK] = np.asarray(self.value)[self._leaves(X[start:start + CHUNK])].mean(axis=1)
+        return out
+
+
+# ─── 4) Benchmark ────────────────────────────────────────────────────────────────
+def _rss():
+    """(private, file-backed) resident MB of this process; mapped trees count as file-backed."""
+    stats = {}
+    with open('/proc/self/status', encoding='utf-8') as f:
+        for line in f:
+            key, _, rest = line.partition(':')
+            if key in ('RssAnon', 'RssFile'):
+                stats[key] = int(rest.split()[0]) / 1024
+    return stats.get('RssAnon', resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024), stats.get('RssFile', 0.0)
+
+
+def _measure(kind, path, sample_path):
+    """Run in a fresh process: load one artifact, predict the sample, report as JSON."""
+    sample = pd.read_pickle(sample_path)
+    import sklearn.compose, sklearn.ensemble, sklearn.pipeline  # noqa: F401  (import cost is not load cost)
+    before = _rss()
+    t = time.perf_counter()
+    model = joblib.load(path) if kind == 'pickle' else MappedForest(path)
+    loaded = time.perf_counter() - t
+    t = time.perf_counter()
+    pred = model.predict(sample)
+    predicted = time.perf_counter() - t
+    after = _rss()
+    print(json.dumps({'format': kind, 'load_s': round(loaded, 3), 'predict_s': round(predicted, 3),
+                      'private_mb': round(after[0] - before[0], 1), 'shared_mb': round(after[1] - before[1], 1),
+                      'checksum': float(np.sum(pred))}))
+
+
+def bench(pickle_path, forest_dirs, sample):
+    sample_path = os.path.join(forest_dirs[0], 'bench_sample.pkl')
+    sample.to_pickle(sample_path)
+    rows = []
+    try:
+        for kind, path in [('pickle', pickle_path)] + [('mmap', d) for d in forest_dirs]:
+            out = subprocess.run([sys.executable, __file__, '--measure', kind, path, sample_path],
+                                 capture_output=True, text=True, check=True).stdout
+            rows.append({'artifact': path, **json.loads(out.strip().splitlines()[-1])})
+    finally:
+        os.remove(sample_path)
+    return pd.DataFrame(rows)
+
+
+def disk_mb(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path) / 2**20
+    return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path)) / 2**20
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 5 and sys.argv[1] == '--measure':
+        _measure(*sys.argv[2:])
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(description="Export the random forest pipeline as memory-mappable arrays")
+    parser.add_argument('pickle', nargs='?', default=PICKLE_PATH, help="joblib pipeline from randomforest.py")
+    parser.add_argument('--out', default=FOREST_DIR)
+    parser.add_argument('--compact', action='store_true', help="float32 thresholds/values, redundant splits pruned")
+    parser.add_argument('--bench', metavar='CSV', help="compare load time/RSS with the pickle on rows of this CSV")
+    args = parser.parse_args()
+
+    model = joblib.load(args.pickle)
+    meta = export(model, args.out, compact=args.compact)
+    print(f"✅ Exported {meta['trees']} trees / {meta['nodes']:,} nodes to {args.out} "
+          f"({disk_mb(args.out):.1f} MB, pickle {disk_mb(args.pickle):.1f} MB)")
+
+    if args.bench:
+        columns = meta['columns'] or None
+        sample = pd.read_csv(args.bench, usecols=columns).dropna().head(1000)
+        expected = model.predict(sample)
+        got = MappedForest(args.out).predict(sample)
+        print(f"📊 Max |mapped - pickle| prediction difference: {np.max(np.abs(got - expected)):.6f}")
+        dirs = [args.out]
+        if not args.compact:
+            compact = export(model, args.out + '.compact', compact=True)
+            print(f"   compact: {compact['nodes']:,} nodes, {disk_mb(args.out + '.compact'):.1f} MB")
+            dirs.append(args.out + '.compact')
+        print(bench(args.pickle, dirs, sample).to_string(index=False))
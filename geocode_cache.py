@@ -0,0 +1,140 @@
+import os
+import sqlite3
+import time
+
+from search_index import normalize
+
+# ─── 1) Defaults ─────────────────────────────────────────────────────────────────
+CACHE_PATH = 'dataset/geocode_cache.sqlite'
+TTL = 180 * 86400           # resolved locations are re-checked twice a year
+NEGATIVE_TTL = 14 * 86400   # "no state found" is retried after two weeks
+COMMIT_EVERY = 20           # resolved keys per commit, so an interrupted run keeps what it paid for
+
+
+# ─── 2) Resolvers ────────────────────────────────────────────────────────────────
+# A resolver has a name and resolve(location) -> state name or None.
+# Raising means "could not ask" (network, quota): a key is only cached as "no
+# state" when every resolver was asked and none found one.
+class NominatimResolver:
+    name = 'nominatim'
+
+    def __init__(self, user_agent='geoapi', min_delay=1.0):
+        from geopy.extra.rate_limiter import RateLimiter
+        from geopy.geocoders import Nominatim
+        self._geocode = RateLimiter(Nominatim(user_agent=user_agent).geocode, min_delay_seconds=min_delay)
+
+    def resolve(self, location):
+        loc = self._geocode(location, addressdetails=True, country_codes='my')
+        return loc.raw['address'].get('state') if loc else None
+
+
+class GoogleResolver:
+    name = 'google'
+
+    def __init__(self, api_key):
+        import googlemaps
+        self._client = googlemaps.Client(key=api_key)
+
+    def resolve(self, location):
+        for result in self._client.geocode(location, components={'country': 'MY'})[:1]:
+            for component in result['address_components']:
+                if 'administrative_area_level_1' in component['types']:
+                    return component['long_name']
+        return None
+
+
+class StubResolver:
+    """Offline resolver backed by a plain dict (tests, air-gapped runs)."""
+    name = 'stub'
+
+    def __init__(self, mapping):
+        self._mapping = {normalize(k): v for k, v in mapping.items()}
+
+    def resolve(self, location):
+        return self._mapping.get(normalize(location))
+
+
+# ─── 3) Cache ────────────────────────────────────────────────────────────────────
+class GeocodeCache:
+    """SQLite location -> state cache keyed by normalized location text.
+
+    lookup_many() answers known keys from disk and sends only the missing
+    distinct keys through the resolvers, in order, caching both hits and misses.
+    """
+
+    def __init__(self, path=CACHE_PATH, resolvers=(), ttl=TTL, negative_ttl=NEGATIVE_TTL):
+        self.resolvers = list(resolvers)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS geocode ('
+            ' key TEXT PRIMARY KEY, state TEXT, resolver TEXT, resolved_at REAL NOT NULL)'
+        )
+        self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+    def _fresh(self, keys, now):
+        found = {}
+        keys = list(keys)
+        for i in range(0, len(keys), 500):
+            batch = keys[i:i + 500]
+            rows = self._db.execute(
+                f"SELECT key, state, resolved_at FROM geocode WHERE key IN ({','.join('?' * len(batch))})",
+                batch,
+            )
+            for key, state, resolved_at in rows:
+                ttl = self.ttl if state is not None else self.negative_ttl
+                if now - resolved_at < ttl:
+                    found[key] = state
+        return found
+
+    def _save(self, rows):
+        if rows:
+            self._db.executemany('INSERT OR REPLACE INTO geocode VALUES (?, ?, ?, ?)', rows)
+            self._db.commit()
+            rows.clear()
+
+    def _resolve(self, key):
+        """(state, resolver) to cache for key, or None when it should be asked again later."""
+        failed, resolver = False, None
+        for r in self.resolvers:
+            try:
+                state = r.resolve(key)
+            except Exception as e:
+                print(f"⚠️  {r.name} failed for {key!r}: {e}")
+                failed = True
+                continue
+            if state:
+                return state, r.name
+            resolver = r.name
+        # "no state" is only an answer when no resolver was left unasked
+        return (None, resolver) if resolver and not failed else None
+
+    def lookup_many(self, locations):
+        """{location: state or None} for the distinct locations given."""
+        keys = {loc: normalize(loc) for loc in set(locations)}
+        known = self._fresh(set(keys.values()), time.time())
+        missing = sorted(set(keys.values()) - known.keys())
+
+        rows = []
+        try:
+            for key in missing:
+                answer = self._resolve(key)
+                if answer is None:
+                    continue
+                state, resolver = answer
+                rows.append((key, state, resolver, time.time()))
+                known[key] = state
+                if len(rows) >= COMMIT_EVERY:
+                    self._save(rows)
+        finally:
+            self._save(rows)
+        return {loc: known.get(key) for loc, key in keys.items()}
+
+    def lookup(self, location):
+        return self.lookup_many([location])[location]
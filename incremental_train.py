@@ -0,0 +1,102 @@
+import argparse
+import os
+
+import pandas as pd
+from catboost import CatBoostRegressor
+from sklearn.metrics import mean_absolute_error
+
+from vocab import Vocabulary, sidecar_path
+from model_meta import DATE_COL, load_meta, save_meta, listing_dates, watermark_of
+from dataset_store import STORE_DIR, load
+
+# ─── 1) Defaults ─────────────────────────────────────────────────────────────────
+DATA_PATH = 'dataset/clean_preprocessed_dataset.csv'
+MODEL_PATH = 'model/catboost_salary_model2.cbm'
+FEATURES = ['category', 'role', 'location', 'type']
+TARGET = 'mean_salary'
+HOLDOUT_DAYS = 7        # newest postings kept out of training to judge the candidate
+ITERATIONS = 200        # extra boosting rounds on top of the current model
+TOLERANCE = 0.0         # allowed relative MAE increase before a candidate is rejected
+
+
+# ─── 2) Steps ────────────────────────────────────────────────────────────────────
+def split_new_postings(df, watermark, holdout_days=HOLDOUT_DAYS):
+    """Postings newer than the watermark, split into (train, recent holdout window)."""
+    dates = listing_dates(df)
+    is_new = dates > pd.Timestamp(watermark)
+    new, new_dates = df[is_new], dates[is_new]
+    if new.empty:
+        return new, new
+    cutoff = new_dates.max() - pd.Timedelta(days=holdout_days)
+    return new[new_dates <= cutoff], new[new_dates > cutoff]
+
+
+def continue_training(current, X, y, iterations=ITERATIONS):
+    candidate = CatBoostRegressor(iterations=iterations, verbose=0, random_state=42)
+    candidate.fit(X, y, cat_features=FEATURES, init_model=current)
+    return candidate
+
+
+def promote(candidate, vocab, model_path, **meta):
+    """Swap the candidate in place of the served model, together with its vocabulary."""
+    tmp = model_path + '.tmp'
+    candidate.save_model(tmp)
+    vocab.save(sidecar_path(model_path))
+    os.replace(tmp, model_path)
+    save_meta(model_path, vocab_version=vocab.version, **meta)
+
+
+# ─── 3) Run ──────────────────────────────────────────────────────────────────────
+def main():
+    parser = argparse.ArgumentParser(description="Continue boosting the CatBoost salary model on new postings")
+    parser.add_argument('--data', default=DATA_PATH, help="flat CSV, used when --store has not been built")
+    parser.add_argument('--store', default=STORE_DIR)
+    parser.add_argument('--model', default=MODEL_PATH)
+    parser.add_argument('--holdout-days', type=int, default=HOLDOUT_DAYS)
+    parser.add_argument('--iterations', type=int, default=ITERATIONS)
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE)
+    parser.add_argument('--dry-run', action='store_true', help="evaluate only, never promote")
+    args = parser.parse_args()
+
+    meta = load_meta(args.model)
+    if 'watermark' not in meta:
+        raise SystemExit(f"❌ No watermark recorded for {args.model}; run catboost_model.py for a full fit first")
+
+    # Only months after the watermark are read from the store
+    df = load(columns=FEATURES + [TARGET, DATE_COL], csv_path=args.data, root=args.store,
+              start=meta['watermark'])
+    train, holdout = split_new_postings(df, meta['watermark'], args.holdout_days)
+    print(f"📥 {len(train) + len(holdout)} postings after {meta['watermark']} "
+          f"({len(train)} train / {len(holdout)} holdout)")
+    if train.empty or holdout.empty:
+        print("⏭  Not enough new postings for a train/holdout split; model unchanged")
+        return
+
+    # Codes only ever get appended, so the current model's codes stay valid
+    vocab = Vocabulary.load(sidecar_path(args.model)).extend(df)
+    X_train, y_train = vocab.codes(train, FEATURES), train[TARGET]
+    X_hold, y_hold = vocab.codes(holdout, FEATURES), holdout[TARGET]
+
+    current = CatBoostRegressor()
+    current.load_model(args.model)
+    candidate = continue_training(current, X_train, y_train, args.iterations)
+
+    mae_current = mean_absolute_error(y_hold, current.predict(X_hold))
+    mae_candidate = mean_absolute_error(y_hold, candidate.predict(X_hold))
+    print(f"📊 Holdout MAE: current RM{mae_current:.2f} | candidate RM{mae_candidate:.2f}")
+
+    if mae_candidate > mae_current * (1 + args.tolerance):
+        print("❌ Candidate regresses on the recent window; keeping the current model")
+        return
+    if args.dry_run:
+        print("✅ Candidate would be promoted (dry run)")
+        return
+    promote(candidate, vocab, args.model,
+            watermark=watermark_of(train),
+            rows=meta.get('rows', 0) + len(train),
+            holdout_mae=round(mae_candidate, 2))
+    print(f"✅ Promoted candidate to {args.model}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+import difflib
+from functools import lru_cache
+
+from search_index import normalize
+
+# ─── 1) Defaults ─────────────────────────────────────────────────────────────────
+FUZZY_CUTOFF = 0.85     # difflib ratio needed to accept a nearest known category
+CACHE_SIZE = 65536      # distinct (field, raw input) pairs remembered
+
+
+# ─── 2) Normalizer ───────────────────────────────────────────────────────────────
+class InputNormalizer:
+    """Maps raw user strings onto the categories a model was trained on.
+
+    Order of attempts: exact value, canonical key ("Full-time" == "full time"),
+    then the closest known key. Results are cached per distinct raw input.
+    """
+
+    def __init__(self, vocab, columns, cutoff=FUZZY_CUTOFF):
+        self.columns = list(columns)
+        self.cutoff = cutoff
+        self._known = {col: set(vocab.columns.get(col, [])) for col in self.columns}
+        self._canonical = {}
+        for col in self.columns:
+            table = {}
+            for value in vocab.columns.get(col, []):
+                table.setdefault(normalize(value), value)
+            self._canonical[col] = table
+        self.resolve = lru_cache(maxsize=CACHE_SIZE)(self._resolve)
+
+    def _resolve(self, col, raw):
+        """(known value or None, how it matched)."""
+        if raw in self._known[col]:
+            return raw, 'exact'
+        key = normalize(raw)
+        table = self._canonical[col]
+        if key in table:
+            return table[key], 'canonical'
+        close = difflib.get_close_matches(key, table.keys(), n=1, cutoff=self.cutoff)
+        if close:
+            return table[close[0]], 'fuzzy'
+        return None, None
+
+    def normalize_record(self, record):
+        """Copy of record with known values substituted, plus a report of what changed."""
+        clean = dict(record)
+        report = {}
+        for col in self.columns:
+            raw = record.get(col)
+            if not isinstance(raw, str):
+                continue
+            value, how = self.resolve(col, raw)
+            if value is not None and how != 'exact':
+                clean[col] = value
+                report[col] = {'from': raw, 'to': value, 'match': how}
+        return clean, report
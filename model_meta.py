@@ -0,0 +1,36 @@
+import json
+import os
+
+import pandas as pd
+
+from vocab import sidecar_path
+
+DATE_COL = 'listingDate'
+
+
+def load_meta(model_path):
+    """Training metadata saved next to a model, or {} for models trained before it existed."""
+    path = sidecar_path(model_path, 'meta')
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_meta(model_path, **fields):
+    path = sidecar_path(model_path, 'meta')
+    meta = {**load_meta(model_path), **fields}
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=1, default=str)
+    os.replace(tmp, path)
+    return meta
+
+
+def listing_dates(df):
+    return pd.to_datetime(df[DATE_COL], utc=True, errors='coerce')
+
+
+def watermark_of(df):
+    """Newest listingDate in df as an ISO string: the incremental trainer's starting point."""
+    return listing_dates(df).max().isoformat()
@@ -0,0 +1,196 @@
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import joblib
+import pandas as pd
+
+from forest_export import FOREST_DIR, MappedForest
+from prediction import MODEL_PATH, PredictionError, SalaryPredictor
+from singleflight import SingleFlight
+
+# ─── 1) Defaults ─────────────────────────────────────────────────────────────────
+# serving.json (optional) overrides this: which models to load, how live traffic
+# is split between them, and which ones score every request in the shadow.
+CONFIG_PATH = 'serving.json'
+DEFAULT_CONFIG = {
+    'models': {
+        'catboost':      {'kind': 'catboost', 'path': MODEL_PATH},
+        'random_forest': {'kind': 'pipeline', 'path': FOREST_DIR if os.path.isdir(FOREST_DIR)
+                          else 'salary_predictor_model.pkl'},
+        'lightgbm':      {'kind': 'pipeline', 'path': 'salary_predictor_lgbm.pkl'},
+    },
+    'weights': {'catboost': 1.0},                   # live traffic share per model
+    'shadow': ['random_forest', 'lightgbm'],        # scored off the request path, never returned
+}
+SHADOW_LOG = 'logs/shadow.jsonl'
+SHADOW_THREADS = 2
+SHADOW_QUEUE = 256      # pending shadow jobs; beyond this they are dropped, not queued
+PIPELINE_FEATURES = ['job_title', 'category', 'role', 'location', 'type']
+# The live /predict contract (app2.py) only requires prediction.FEATURES, while the pipelines
+# also need job_title. A shadow is skipped (counted in shadow_skipped) when the
+# request lacks one of its features rather than scoring a made-up value.
+
+
+def load_config(path=CONFIG_PATH):
+    if not os.path.exists(path):
+        return DEFAULT_CONFIG
+    with open(path, encoding='utf-8') as f:
+        return {**DEFAULT_CONFIG, **json.load(f)}
+
+
+# ─── 2) Models ───────────────────────────────────────────────────────────────────
+class CatBoostModel:
+    """app2.py's model: normalized, vocabulary-encoded, micro-batched."""
+
+    def __init__(self, path):
+        self.predictor = SalaryPredictor(path)
+        self.features = self.predictor.features
+
+    def predict(self, input_data):
+        return self.predictor.predict(input_data)
+
+
+class PipelineModel:
+    """app.py's joblib pipelines (random forest, LightGBM) or a forest_export directory."""
+
+    def __init__(self, path, features=PIPELINE_FEATURES):
+        self.features = list(features)
+        self.model = MappedForest(path) if os.path.isdir(path) else joblib.load(path)
+        self.flights = SingleFlight()
+
+    def _predict_one(self, record):
+        return self.model.predict(pd.DataFrame([record]))[0]
+
+    def predict(self, input_data):
+        if not isinstance(input_data, dict) or not all(field in input_data for field in self.features):
+            raise PredictionError({'error': 'Missing required fields'})
+        record = {field: input_data[field] for field in self.features}
+        not_text = [field for field, value in record.items() if not isinstance(value, str)]
+        if not_text:
+            raise PredictionError({'error': 'Fields must be strings', 'fields': not_text})
+        value = self.flights.do(tuple(record.values()), lambda: self._predict_one(record))
+        return SalaryPredictor.response(value, {})
+
+
+KINDS = {'catboost': CatBoostModel, 'pipeline': PipelineModel}
+
+
+# ─── 3) Registry ─────────────────────────────────────────────────────────────────
+class ModelRegistry:
+    """Named models loaded once, a weighted split of live traffic, and shadow scoring.
+
+    A client always lands on the same model (its id is hashed into the weight
+    ranges), so an A/B comparison is per user rather than per request. Shadow
+    models score the same input on a background pool after the response has
+    been computed, with the live model's spelling corrections applied, so a
+    delta compares the models and not the normalization. Their difference to
+    the live answer goes to SHADOW_LOG.
+    """
+
+    def __init__(self, config=None, shadow_log=SHADOW_LOG):
+        config = config or load_config()
+        self.models = {}
+        for name, spec in config['models'].items():
+            try:
+                self.models[name] = KINDS[spec['kind']](spec['path'])
+                print(f"✅ Loaded model {name} from {spec['path']}")
+            except Exception as e:
+                print(f"⚠️ Skipping model {name}: {e}")
+        weights = {n: w for n, w in config['weights'].items() if n in self.models and w > 0}
+        if not weights:
+            raise ValueError("No live model could be loaded")
+        total = sum(weights.values())
+        self.weights = {n: w / total for n, w in weights.items()}
+        self.shadow = [n for n in config['shadow'] if n in self.models]
+
+        self._executor = ThreadPoolExecutor(max_workers=SHADOW_THREADS, thread_name_prefix='shadow')
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.counts = {'live': dict.fromkeys(self.models, 0), 'shadow': dict.fromkeys(self.models, 0),
+                       'shadow_dropped': 0, 'shadow_skipped': 0, 'shadow_errors': 0}
+        self._deltas = {n: [0, 0.0, 0.0] for n in self.models}     # n, sum delta, sum |delta|
+        self.log = logging.getLogger('shadow')
+        if shadow_log and not self.log.handlers:
+            os.makedirs(os.path.dirname(shadow_log) or '.', exist_ok=True)
+            self.log.addHandler(logging.FileHandler(shadow_log, encoding='utf-8'))
+            self.log.setLevel(logging.INFO)
+            self.log.propagate = False
+
+    def choose(self, client, override=None):
+        """The live model for this client; override names one explicitly."""
+        if override:
+            if override not in self.models:
+                raise PredictionError({'error': f"Unknown model: {override}"}, 404)
+            return override
+        point = zlib.crc32(str(client).encode('utf-8')) / 2**32
+        for name, weight in self.weights.items():
+            point -= weight
+            if point < 0:
+                return name
+        return name
+
+    def predict(self, input_data, client, override=None):
+        name = self.choose(client, override)
+        t = time.perf_counter()
+        response = self.models[name].predict(input_data)
+        latency = time.perf_counter() - t
+        with self._lock:
+            self.counts['live'][name] += 1
+        # the record the live model scored: its normalization report maps raw -> known value
+        record = {**input_data, **{col: change['to'] for col, change in response['normalized'].items()}}
+        for shadow in self.shadow:
+            if shadow == name:
+                continue
+            if all(field in record for field in self.models[shadow].features):
+                self._submit_shadow(shadow, record, name, response['mean_salary'], latency)
+            else:
+                with self._lock:
+                    self.counts['shadow_skipped'] += 1
+        return {**response, 'model': name}
+
+    # shadow scoring never raises into, or waits on, the request thread
+    def _submit_shadow(self, shadow, input_data, primary, primary_value, primary_latency):
+        with self._lock:
+            if self._pending >= SHADOW_QUEUE:
+                self.counts['shadow_dropped'] += 1
+                return
+            self._pending += 1
+        self._executor.submit(self._score_shadow, shadow, input_data, primary, primary_value, primary_latency)
+
+    def _score_shadow(self, shadow, input_data, primary, primary_value, primary_latency):
+        try:
+            t = time.perf_counter()
+            value = self.models[shadow].predict(input_data)['mean_salary']
+            latency = time.perf_counter() - t
+            delta = float(value) - float(primary_value)
+            with self._lock:
+                self.counts['shadow'][shadow] += 1
+                acc = self._deltas[shadow]
+                acc[0] += 1
+                acc[1] += delta
+                acc[2] += abs(delta)
+            self.log.info(json.dumps({
+                'ts': time.time(), 'primary': primary, 'shadow': shadow,
+                'input': {k: input_data.get(k) for k in PIPELINE_FEATURES},
+                'primary_mean': round(float(primary_value), 2), 'shadow_mean': round(float(value), 2),
+                'delta': round(delta, 2),
+                'primary_ms': round(primary_latency * 1000, 2), 'shadow_ms': round(latency * 1000, 2),
+            }))
+        except Exception:
+            with self._lock:
+                self.counts['shadow_errors'] += 1
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def stats(self):
+        with self._lock:
+            deltas = {n: {'n': n_, 'mean_delta': round(s / n_, 2), 'mean_abs_delta': round(a / n_, 2)}
+                      for n, (n_, s, a) in self._deltas.items() if n_}
+            return {'weights': self.weights, 'shadow': self.shadow, **self.counts,
+                    'shadow_pending': self._pending, 'shadow_deltas': deltas}
@@ -0,0 +1,91 @@
+import dash
+from dash import dcc, html, Input, Output, State, callback, clientside_callback, ClientsideFunction
+import dash_bootstrap_components as dbc
+import plotly.express as px
+
+import data_layer as data
+
+# Jobs by category with click-through salary histograms
+# (formerly main.py, intergrate.py and the charts of latest_frontend.py)
+dash.register_page(__name__, path='/', name="Overview", order=0)
+
+# ─── 1) Aggregations ────────────────────────────────────────────────────────────
+def job_counts():
+    return data.current().category_counts.rename(columns={'label': 'Category', 'count': 'Count'})
+
+# ─── 2) Figures ─────────────────────────────────────────────────────────────────
+@data.per_generation
+def make_bar_figure():
+    fig = px.bar(
+        job_counts(), x='Category', y='Count',
+        template=data.PX
+    )
+    fig.update_layout(margin=dict(t=20, b=20, l=20, r=20))
+    return fig
+
+def make_histograms(cat_label, **filters):
+    # binned in DuckDB; only the bin counts reach this process
+    margin = dict(t=40, b=20, l=20, r=20)
+    fig_min = data.histogram_figure('min_salary', f"Min Salary Distribution {cat_label}", margin, **filters)
+    fig_mean = data.histogram_figure('mean_salary', f"Mean Salary Distribution {cat_label}", margin, **filters)
+    return fig_min, fig_mean
+
+# ─── 3) Layout ─────────────────────────────────────────────────────────────────
+def layout(**kwargs):
+    return html.Div([
+        dbc.Row([
+            # Bar chart with id for callbacks
+            dbc.Col(dbc.Card([
+                dbc.CardHeader("Jobs by Category"),
+                dbc.CardBody(dcc.Graph(id='bar-chart', config={'displayModeBar':False},
+                                       # drawn once here when the histograms are clientside
+                                       figure=make_bar_figure() if data.CLIENTSIDE else None))
+            ], className="h-100 shadow-sm"), md=6),
+
+            # Min salary histogram
+            dbc.Col(dbc.Card([
+                dbc.CardHeader("Min Salary Distribution"),
+                dbc.CardBody(dcc.Graph(id='min-salary-hist', config={'displayModeBar':False}))
+            ], className="h-100 shadow-sm"), md=6),
+        ], className="mt-4 g-4"),
+
+        dbc.Row([
+            # Mean salary histogram
+            dbc.Col(dbc.Card([
+                dbc.CardHeader("Mean Salary Distribution"),
+                dbc.CardBody(dcc.Graph(id='mean-salary-hist', config={'displayModeBar':False}))
+            ], className="h-100 shadow-sm"), md=12),
+        ], className="mt-4 g-4"),
+    ])
+
+# ─── 4) Callbacks to wire charts together ────────────────────────────────────────
+def update_charts(clickData):
+    # Always show the bar chart unfiltered
+    bar_fig = make_bar_figure()
+
+    if clickData:
+        # extract clicked category
+        cat = clickData['points'][0]['x']
+        filters, label = {'category': cat}, f"(Category: {cat})"
+    else:
+        filters, label = {}, "(All Categories)"
+
+    min_fig, mean_fig = make_histograms(label, **filters)
+    return bar_fig, min_fig, mean_fig
+
+# registered as server callbacks, or as their assets/clientside.js equivalents
+if data.CLIENTSIDE:
+    clientside_callback(
+        ClientsideFunction('dashboard', 'overviewHists'),
+        Output('min-salary-hist', 'figure'),
+        Output('mean-salary-hist', 'figure'),
+        Input('bar-chart', 'clickData'),
+        State('aggregates', 'data')
+    )
+else:
+    callback(
+        Output('bar-chart', 'figure'),
+        Output('min-salary-hist', 'figure'),
+        Output('mean-salary-hist', 'figure'),
+        Input('bar-chart', 'clickData')
+    )(update_charts)
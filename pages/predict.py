@@ -0,0 +1,169 @@
+import dash
+from dash import dcc, html, Input, Output, State, callback
+from dash.exceptions import PreventUpdate
+import dash_bootstrap_components as dbc
+import flask
+import requests  # For making API calls to your backend
+
+from admission import client_id
+import data_layer as data
+from data_layer import top_options
+
+# Salary prediction form backed by app2.py (formerly latest_frontend.py)
+dash.register_page(__name__, path='/predict', name="Predict", order=3)
+
+PREDICT_URL = 'http://localhost:5000/predict'
+PREDICT_TIMEOUT = (2, 5)    # seconds to connect, to read the answer
+
+# ─── 1) Salary Prediction Form ─────────────────────────────────────────────────
+def layout(**kwargs):
+    kpi = data.current()
+    return dbc.Card([
+        dbc.CardHeader("Salary Prediction"),
+        dbc.CardBody([
+            dbc.Row([
+                dbc.Col([
+                    dbc.Label("Job Title"),
+                    dcc.Dropdown(
+                        id='job-title-dropdown',
+                        options=top_options('job_title'),
+                        placeholder="Select Job Title"
+                    ),
+                ], md=6),
+                dbc.Col([
+                    dbc.Label("Category"),
+                    dcc.Dropdown(
+                        id='category-dropdown',
+                        options=[{'label': cat, 'value': cat} for cat in kpi.categories],
+                        placeholder="Select Category"
+                    ),
+                ], md=6),
+            ], className="mb-3"),
+        
+            dbc.Row([
+                dbc.Col([
+                    dbc.Label("Role"),
+                    dcc.Dropdown(
+                        id='role-dropdown',
+                        options=top_options('role'),
+                        placeholder="Select Role"
+                    ),
+                ], md=6),
+                dbc.Col([
+                    dbc.Label("Location"),
+                    dcc.Dropdown(
+                        id='location-dropdown',
+                        options=top_options('location'),
+                        placeholder="Select Location"
+                    ),
+                ], md=6),
+            ], className="mb-3"),
+        
+            dbc.Row([
+                dbc.Col([
+                    dbc.Label("Job Type"),
+                    dcc.Dropdown(
+                        id='type-dropdown',
+                        options=[{'label': typ, 'value': typ} for typ in kpi.types],
+                        placeholder="Select Job Type"
+                    ),
+                ], md=6),
+                dbc.Col([
+                    dbc.Button("Predict Salary", id='predict-button', color="primary", className="mt-4"),
+                ], md=6),
+            ]),
+        
+            # Prediction results will be displayed here
+            html.Div(id='prediction-results', className="mt-4")
+        ])
+    ], className="mt-4 shadow-sm")
+
+# ─── 2) Search-as-you-type for the large dropdowns ───────────────────────────────
+def register_search(dropdown_id, field):
+    @callback(
+        Output(dropdown_id, 'options'),
+        Input(dropdown_id, 'search_value'),
+        State(dropdown_id, 'value')
+    )
+    def update_options(search_value, value):
+        if not search_value:
+            raise PreventUpdate
+        options = top_options(field, search_value)
+        # keep the current selection visible while typing
+        if value and all(o['value'] != value for o in options):
+            options.append({'label': value, 'value': value})
+        return options
+
+register_search('job-title-dropdown', 'job_title')
+register_search('role-dropdown', 'role')
+register_search('location-dropdown', 'location')
+
+# ─── 3) Salary Prediction Callback ───────────────────────────────────────────────
+@callback(
+    Output('prediction-results', 'children'),
+    Input('predict-button', 'n_clicks'),
+    State('job-title-dropdown', 'value'),
+    State('category-dropdown', 'value'),
+    State('role-dropdown', 'value'),
+    State('location-dropdown', 'value'),
+    State('type-dropdown', 'value'),
+    prevent_initial_call=True
+)
+def predict_salary(n_clicks, job_title, category, role, location, job_type):
+    if not all([job_title, category, role, location, job_type]):
+        return dbc.Alert("Please fill in all fields to get a prediction.", color="warning")
+    
+    # Prepare the data to send to your backend API
+    input_data = {
+        'job_title': job_title,
+        'category': category,
+        'role': role,
+        'location': location,
+        'type': job_type
+    }
+    
+    try:
+        # Forward the user's address so the API's per-client rate limit and A/B
+        # split apply per user (resolved the same way the API resolves its peers)
+        client = client_id(flask.request) if flask.has_request_context() else None
+        response = requests.post(PREDICT_URL, json=input_data, timeout=PREDICT_TIMEOUT,
+                                 headers={'X-Forwarded-For': client or ''})
+        if response.status_code in (429, 503):
+            wait = response.headers.get('Retry-After', '1')
+            return dbc.Alert(f"The prediction service is busy, please try again in {wait}s.", color="warning")
+        response.raise_for_status()
+        prediction = response.json()
+        
+        # Assuming your backend returns min, mean, max salary predictions
+        return dbc.Card([
+            dbc.CardHeader("Predicted Salary"),
+            dbc.CardBody([
+                dbc.Row([
+                    dbc.Col([
+                        html.H6("Minimum Salary", className="card-title"),
+                        html.H4(f"RM {prediction.get('min_salary', 0):,.0f}", className="text-success")
+                    ]),
+                    dbc.Col([
+                        html.H6("Average Salary", className="card-title"),
+                        html.H4(f"RM {prediction.get('mean_salary', 0):,.0f}", className="text-primary")
+                    ]),
+                    dbc.Col([
+                        html.H6("Maximum Salary", className="card-title"),
+                        html.H4(f"RM {prediction.get('max_salary', 0):,.0f}", className="text-danger")
+                    ]),
+                ]),
+                html.Hr(),
+                html.P("Based on your selection:", className="text-muted"),
+                html.Ul([
+                    html.Li(f"Job Title: {job_title}"),
+                    html.Li(f"Category: {category}"),
+                    html.Li(f"Role: {role}"),
+                    html.Li(f"Location: {location}"),
+                    html.Li(f"Type: {job_type}"),
+                ])
+            ])
+        ])
+    except requests.Timeout:
+        return dbc.Alert("The prediction service took too long to answer, please try again.", color="warning")
+    except Exception as e:
+        return dbc.Alert(f"Error getting prediction: {str(e)}", color="danger")
@@ -0,0 +1,209 @@
+import dash
+import pandas as pd
+from dash import dcc, html, Input, Output, State, callback, clientside_callback, ClientsideFunction
+import dash_bootstrap_components as dbc
+import plotly.express as px
+import plotly.graph_objects as go
+
+import data_layer as data
+from data_layer import db, PX, histogram_figure
+
+# Salary histograms, summary and category/state breakdown (formerly version1.py)
+dash.register_page(__name__, path='/summary', name="Salary Summary", order=1)
+
+# ─── 1) Initial Figures ─────────────────────────────────────────────────────────
+# built once per published generation of the data (see data_layer.per_generation)
+@data.per_generation
+def initial_figures():
+    # 1.1 Pie/Donut: overall postings by Category
+    fig_pie_init = px.pie(
+        data.current().category_counts,     # columns ['label','count']
+        names='label',
+        values='count',
+        title="Postings by Category",
+        template=PX,
+        hole=0.4
+    )
+
+    # 1.2 Bar: Avg Min & Avg Max by Category
+    avg_min_max = (
+        db.salary_stats('category')[['category','min_salary','max_salary']]
+          .rename(columns={'min_salary':'Avg Min','max_salary':'Avg Max'})
+    )
+    fig_bar = px.bar(
+        avg_min_max,
+        x='category',
+        y=['Avg Min','Avg Max'],
+        barmode='group',
+        labels={'value':'Salary (RM)','variable':'Type','category':'Category'},
+        title='Avg Min & Max Salary by Category',
+        template=PX
+    )
+    fig_bar.update_layout(xaxis_tickangle=-45, margin=dict(t=60,b=130,l=40,r=20))
+
+    # 1.3 Histograms (full data initial, binned in DuckDB)
+    min_hist_init, max_hist_init, mean_hist_init = update_hists(None)
+
+    # 1.4 Salary summary bar (full data initial)
+    overall = data.current().overall
+    stats_init = pd.DataFrame({
+        'Statistic':['Avg Min','Avg Mean','Avg Max'],
+        'Salary (RM)':[
+            overall['min_salary'],
+            overall['mean_salary'],
+            overall['max_salary']
+        ]
+    })
+    fig_summary_init = px.bar(
+        stats_init,
+        x='Statistic',
+        y='Salary (RM)',
+        text='Salary (RM)',
+        title="Salary Summary (All Data)",
+        template=PX
+    )
+    fig_summary_init.update_traces(texttemplate='%{text:,.0f}', textposition='outside')
+    fig_summary_init.update_layout(
+        uniformtext_minsize=8,
+        yaxis_range=[0, stats_init['Salary (RM)'].max()*1.1],
+        margin=dict(t=60,b=20,l=20,r=20)
+    )
+    return {'pie': fig_pie_init, 'bar': fig_bar, 'min_hist': min_hist_init, 'max_hist': max_hist_init,
+            'mean_hist': mean_hist_init, 'summary': fig_summary_init}
+
+# Empty placeholder for callbacks
+empty = go.Figure().update_layout(template=PX, margin=dict(t=40,b=20,l=20,r=20))
+
+
+# ─── 2) Layout ─────────────────────────────────────────────────────────────────
+def layout(**kwargs):
+    figs, kpi = initial_figures(), data.current()
+    return html.Div([
+
+        # ◉ Jobs by Category bar
+        dbc.Row(dbc.Col(dbc.Card([
+            dbc.CardHeader("Avg Min & Avg Max Salary by Category"),
+            dbc.CardBody(dcc.Graph(id='summary-bar-chart', figure=figs['bar'], config={'displayModeBar':False}))
+        ], className="shadow-sm"), width=12), className="mt-4"),
+
+        # ◉ Salary histograms
+        dbc.Row([
+            dbc.Col(dbc.Card([dbc.CardHeader("Min Salary"), dbc.CardBody(dcc.Graph(id='summary-min-salary-hist', figure=figs['min_hist'], config={'displayModeBar':False}))], className="shadow-sm"), md=4),
+            dbc.Col(dbc.Card([dbc.CardHeader("Max Salary"), dbc.CardBody(dcc.Graph(id='summary-max-salary-hist', figure=figs['max_hist'], config={'displayModeBar':False}))], className="shadow-sm"), md=4),
+            dbc.Col(dbc.Card([dbc.CardHeader("Mean Salary"), dbc.CardBody(dcc.Graph(id='summary-mean-salary-hist', figure=figs['mean_hist'], config={'displayModeBar':False}))], className="shadow-sm"), md=4),
+        ], className="mt-4 g-4"),
+
+        html.Hr(),
+
+        # Dropdown filters (no “All”)
+        dbc.Row([
+            dbc.Col([
+                html.Label("Select Category:"),
+                dcc.Dropdown(id='summary-ddl-cat', options=[{'label':c,'value':c} for c in kpi.categories],
+                             placeholder="Select a category", clearable=True)
+            ], md=6),
+            dbc.Col([
+                html.Label("Select State:"),
+                dcc.Dropdown(id='summary-ddl-state', options=[{'label':s,'value':s} for s in kpi.states],
+                             placeholder="Select a state", clearable=True)
+            ], md=6),
+        ], className="mt-4 g-4"),
+
+    # ◉ Pie / Donut chart (first)
+        dbc.Row(dbc.Col(dbc.Card([
+            dbc.CardHeader("Postings by Category"),
+            dbc.CardBody(dcc.Graph(id='summary-pie-chart', figure=figs['pie'], config={'displayModeBar':False}))
+        ], className="shadow-sm"), width=12), className="mt-4"),
+
+        # Salary summary bar
+        dbc.Row(dbc.Col(dbc.Card([
+            dbc.CardHeader("Salary Summary"),
+            dbc.CardBody(dcc.Graph(id='summary-salary-summary', figure=figs['summary'], config={'displayModeBar':False}))
+        ], className="shadow-sm"), width=12), className="mt-4"),
+    ])
+
+# ─── 3) Callbacks ─────────────────────────────────────────────────────────────────
+
+# 3.1 Update histograms on bar‐click
+def update_hists(clickData):
+    if clickData:
+        cat = clickData['points'][0]['x']
+        filters, suffix = {'category': cat}, f"(Category: {cat})"
+    else:
+        filters, suffix = {}, "(All Categories)"
+
+    fmin = histogram_figure('min_salary', f"Min Salary Distribution {suffix}", **filters)
+    fmax = histogram_figure('max_salary', f"Max Salary Distribution {suffix}", **filters)
+    fmean = histogram_figure('mean_salary', f"Mean Salary Distribution {suffix}", **filters)
+    return fmin, fmax, fmean
+
+# 3.2 Update summary & pie on dropdown‐change
+def update_summary_pie(cat_sel, state_sel):
+    summary = db.salary_stats(category=cat_sel, state=state_sel).iloc[0]
+    parts = []
+    if cat_sel:
+        parts.append(f"Category: {cat_sel}")
+    if state_sel:
+        parts.append(f"State: {state_sel}")
+    title = " & ".join(parts) if parts else "All Data"
+
+    # Salary summary
+    stats = pd.DataFrame({'Statistic':['Avg Min','Avg Mean','Avg Max'],
+                          'Salary (RM)':[summary['min_salary'], summary['mean_salary'], summary['max_salary']]})
+    fig_sum = px.bar(stats, x='Statistic', y='Salary (RM)', text='Salary (RM)',
+                     title=f"Salary Summary ({title})", template=PX)
+    fig_sum.update_traces(texttemplate='%{text:,.0f}', textposition='outside')
+    fig_sum.update_layout(uniformtext_minsize=8,
+                          yaxis_range=[0, stats['Salary (RM)'].max()*1.1])
+
+    # Pie breakdown
+    if cat_sel and not state_sel:
+        counts = db.counts('state', category=cat_sel)
+        ptitle = f"Postings of {cat_sel} by State"
+    elif state_sel and not cat_sel:
+        counts = db.counts('category', state=state_sel)
+        ptitle = f"Postings in {state_sel} by Category"
+    elif cat_sel and state_sel:
+        counts = db.counts('type', category=cat_sel, state=state_sel)
+        ptitle = f"Types for {cat_sel} in {state_sel}"
+    else:
+        counts = data.current().category_counts
+        ptitle = "All Postings by Category"
+
+    fig_pie = px.pie(counts, names='label', values='count', title=ptitle, template=PX, hole=0.4)
+    return fig_sum, fig_pie
+
+# registered as server callbacks, or as their assets/clientside.js equivalents
+if data.CLIENTSIDE:
+    clientside_callback(
+        ClientsideFunction('dashboard', 'summaryHists'),
+        Output('summary-min-salary-hist','figure'),
+        Output('summary-max-salary-hist','figure'),
+        Output('summary-mean-salary-hist','figure'),
+        Input('summary-bar-chart','clickData'),
+        State('aggregates', 'data')
+    )
+else:
+    callback(
+        Output('summary-min-salary-hist','figure'),
+        Output('summary-max-salary-hist','figure'),
+        Output('summary-mean-salary-hist','figure'),
+        Input('summary-bar-chart','clickData')
+    )(update_hists)
+
+if data.CLIENTSIDE:
+    clientside_callback(
+        ClientsideFunction('dashboard', 'summaryPie'),
+        Output('summary-salary-summary','figure'),
+        Output('summary-pie-chart','figure'),
+        Input('summary-ddl-cat','value'),
+        Input('summary-ddl-state','value'),
+        State('aggregates', 'data')
+    )
+else:
+    callback(
+        Output('summary-salary-summary','figure'),
+        Output('summary-pie-chart','figure'),
+        Input('summary-ddl-cat','value'),
+        Input('summary-ddl-state','value')
+    )(update_summary_pie)
@@ -0,0 +1,155 @@
+import dash
+from dash import dcc, html, Input, Output, State, callback, clientside_callback, ClientsideFunction
+import dash_bootstrap_components as dbc
+import plotly.express as px
+
+import data_layer as data
+from data_layer import db, PX
+
+# Salary by category, postings by category/state and mean salary over time
+# (formerly version4.py; its prediction form lives on the Predict page)
+dash.register_page(__name__, path='/trends', name="Trends", order=2)
+
+month_order = ["Jan","Feb","Mar","Apr","May","Jun"]
+malaysia_states = [
+    'Johor','Kedah','Kelantan','Melaka','Negeri Sembilan',
+    'Pahang','Penang','Perak','Perlis','Sabah','Sarawak',
+    'Selangor','Terengganu','Kuala Lumpur','Labuan','Putrajaya'
+]
+
+# ─── 1) Initial Figures ─────────────────────────────────────────────────────────
+# built once per published generation of the data (see data_layer.per_generation)
+@data.per_generation
+def initial_figures():
+    # Pie: overall postings by category
+    fig_pie_init = px.pie(
+        data.current().category_counts, names='label', values='count',
+        title="All Postings by Category", template=PX, hole=0.4
+    )
+
+    # Bar: Avg Min & Avg Max salary + count per category, custom hover
+    avg_min_max = (
+        db.salary_stats('category')[['category','count','min_salary','max_salary']]
+          .rename(columns={'count':'Count','min_salary':'Avg Min','max_salary':'Avg Max'})
+    )
+    bar_df = (
+        avg_min_max
+          .melt(id_vars=['category','Count'], value_vars=['Avg Min','Avg Max'],
+                var_name='Type', value_name='Salary')
+    )
+    fig_bar = px.bar(
+        bar_df,
+        x='category', y='Salary', color='Type', barmode='group',
+        labels={'Salary':'Salary (RM)'},
+        hover_data={
+          'Salary': ':.0f',
+          'Count': True,
+          'category': False,
+          'Type': False
+        },
+        title='Avg Min & Avg Max Salary by Category',
+        template=PX
+    )
+    fig_bar.update_layout(xaxis_tickangle=-45, margin=dict(t=60,b=130,l=40,r=20))
+    return {'pie': fig_pie_init, 'bar': fig_bar}
+
+# ─── 2) Layout ───────────────────────────────────────────────────────────────────
+def layout(**kwargs):
+    figs, kpi = initial_figures(), data.current()
+    categories = kpi.categories
+    states = [s for s in kpi.states if s in malaysia_states]
+    return html.Div([
+
+        # Avg Min & Avg Max bar chart
+        dbc.Row(dbc.Col(dbc.Card([
+            dbc.CardHeader("Avg Min & Avg Max Salary by Category"),
+            dbc.CardBody(dcc.Graph(id='trends-bar-chart', figure=figs['bar'], config={'displayModeBar':False}))
+        ], className="shadow-sm"), width=12), className="mt-4 mb-4"),
+
+        # Pie filters & chart
+        dbc.Row([
+            dbc.Col([html.Label("Select Category:"), dcc.Dropdown(
+                id='trends-ddl-cat',
+                options=[{'label':c,'value':c} for c in categories],
+                placeholder="Select a category", clearable=True
+            )], md=6),
+            dbc.Col([html.Label("Select State:"), dcc.Dropdown(
+                id='trends-ddl-state',
+                options=[{'label':s,'value':s} for s in states],
+                placeholder="Select a state", clearable=True
+            )], md=6),
+        ], className="g-4"),
+        dbc.Row(dbc.Col(dbc.Card([
+            dbc.CardHeader("Postings by Category / State"),
+            dbc.CardBody(dcc.Graph(id='trends-pie-chart', figure=figs['pie'], config={'displayModeBar':False}))
+        ], className="shadow-sm"), width=12), className="mt-4 mb-4"),
+
+        # Mean Salary Over Time
+        dbc.Card([
+            dbc.CardHeader("Mean Salary Over Time"),
+            dbc.CardBody([
+                dbc.Row([dbc.Col([html.Label("Select Category:"), dcc.Dropdown(
+                    id="trends-ddl-time-cat",
+                    options=[{"label":c,"value":c} for c in categories],
+                    placeholder="Select a category", clearable=True
+                )], md=4)], className="mb-3"),
+                dcc.Graph(id="trends-time-line", config={"displayModeBar":False})
+            ])
+        ], className="mt-4 mb-4 shadow-sm"),
+
+    ])
+
+# ─── 3) Callbacks ─────────────────────────────────────────────────────────────────
+
+def update_pie(cat_sel, state_sel):
+    if cat_sel and not state_sel:
+        counts = db.counts('state', category=cat_sel)
+        title = f"Postings of {cat_sel} by State"
+    elif state_sel and not cat_sel:
+        counts = db.counts('category', state=state_sel)
+        title = f"Postings in {state_sel} by Category"
+    elif cat_sel and state_sel:
+        counts = db.counts('type', category=cat_sel, state=state_sel)
+        title = f"Types for {cat_sel} in {state_sel}"
+    else:
+        counts = data.current().category_counts
+        title = "All Postings by Category"
+
+    return px.pie(counts, names='label', values='count', title=title, template=PX, hole=0.4)
+
+@callback(
+    Output("trends-time-line","figure"),
+    Input("trends-ddl-time-cat","value")
+)
+def update_time_line(cat_sel):
+    summary = db.time_series('mean_salary', 'month', category=cat_sel)
+    summary["year"]  = summary["period"].dt.year.astype(str)
+    summary["month"] = summary["period"].dt.month_name().str[:3]
+    pivot  = summary.pivot(index="month", columns="year", values="mean_salary").reindex(month_order)
+    plot_df = pivot.reset_index().melt(id_vars="month", var_name="Year", value_name="Mean Salary")
+
+    fig = px.line(
+        plot_df, x="month", y="Mean Salary", color="Year",
+        markers=True, category_orders={"month":month_order},
+        title=f"Mean Salary Over Time ({'All Categories' if not cat_sel else cat_sel})",
+        template=PX
+    )
+    fig.update_layout(xaxis_title="Month", yaxis_title="Mean Salary (RM)",
+                      legend=dict(title="Year", orientation="h", y=-0.2))
+    return fig
+
+# registered as server callbacks, or as their assets/clientside.js equivalents
+if data.CLIENTSIDE:
+    clientside_callback(
+        ClientsideFunction('dashboard', 'trendsPie'),
+        Output('trends-pie-chart','figure'),
+        Input('trends-ddl-cat','value'),
+        Input('trends-ddl-state','value'),
+        State('aggregates', 'data')
+    )
+else:
+    callback(
+        Output('trends-pie-chart','figure'),
+        Input('trends-ddl-cat','value'),
+        Input('trends-ddl-state','value')
+    )(update_pie)
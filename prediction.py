@@ -0,0 +1,122 @@
+import pandas as pd
+from catboost import CatBoostRegressor
+
+from batching import MicroBatcher
+from explain import Explainer, model_digest, shap_path
+from input_normalizer import InputNormalizer
+from singleflight import SingleFlight
+from vocab import Vocabulary, sidecar_path
+
+# ─── 1) Defaults ─────────────────────────────────────────────────────────────────
+MODEL_PATH = 'model/catboost_salary_model2.cbm'
+FEATURES = ['category', 'role', 'location', 'type']
+
+
+class PredictionError(Exception):
+    """A request the model cannot answer; body and status go back to the client."""
+
+    def __init__(self, body, status=400):
+        super().__init__(body.get('error'))
+        self.body = body
+        self.status = status
+
+
+# ─── 2) Predictor ────────────────────────────────────────────────────────────────
+class SalaryPredictor:
+    """The /predict contract, shared by the Flask (app2.py) and ASGI (app_async.py) servers.
+
+    Loads the CatBoost model with the vocabulary it was trained on. Concurrent
+    requests for the same feature tuple share one prediction (SingleFlight) and
+    distinct ones are coalesced into one model call by a MicroBatcher.
+    """
+
+    def __init__(self, model_path=MODEL_PATH, features=FEATURES, **batching):
+        self.features = list(features)
+        self.model = CatBoostRegressor()
+        self.model.load_model(model_path)
+        self.vocab = Vocabulary.load(sidecar_path(model_path))
+        self.normalizer = InputNormalizer(self.vocab, self.features)
+        self.batcher = MicroBatcher(self.predict_batch, **batching)
+        self.flights = SingleFlight()
+        # SHAP explanations, warm from explain.py's offline precompute when it exists
+        self.explainer = Explainer(self.model, self.features)
+        self.explainer.load(shap_path(model_path), model_digest(model_path))
+
+    def predict_batch(self, rows):
+        return self.model.predict(pd.DataFrame(rows, columns=self.features))
+
+    def encode(self, input_data):
+        """(codes, normalization report) for one request, or PredictionError."""
+        if not isinstance(input_data, dict):
+            raise PredictionError({'error': 'Expected a record (an object of fields)'})
+        if not all(field in input_data for field in self.features):
+            raise PredictionError({'error': 'Missing required fields'})
+        not_text = [field for field in self.features if not isinstance(input_data[field], str)]
+        if not_text:
+            raise PredictionError({'error': 'Fields must be strings', 'fields': not_text})
+
+        # Map spelling/case variants onto known categories, then encode
+        record, normalized = self.normalizer.normalize_record(input_data)
+        codes, unknown = self.vocab.encode_record(record, self.features)
+        if unknown:
+            raise PredictionError({'error': 'Unknown values', 'fields': unknown})
+        return codes, normalized
+
+    @staticmethod
+    def response(predicted_avg, normalized):
+        return {
+            'min_salary': round(predicted_avg * 0.85, 2),
+            'mean_salary': round(predicted_avg, 2),
+            'max_salary': round(predicted_avg * 1.15, 2),
+            'normalized': normalized
+        }
+
+    def submit(self, input_data):
+        """Queue one request; returns (future of the prediction, normalization report)."""
+        codes, normalized = self.encode(input_data)
+        key = tuple(codes[f] for f in self.features)
+        return self.flights.submit(key, lambda: self.batcher.submit(codes)), normalized
+
+    def predict_many(self, records):
+        """One vectorized model call for a batch; a bad record gets its error body in place."""
+        results, rows, slots = [None] * len(records), [], []
+        for i, record in enumerate(records):
+            try:
+                codes, normalized = self.encode(record)
+            except PredictionError as e:
+                results[i] = e.body
+                continue
+            rows.append(codes)
+            slots.append((i, normalized))
+        if rows:
+            for (i, normalized), value in zip(slots, self.predict_batch(rows)):
+                results[i] = self.response(value, normalized)
+        return results
+
+    def explain_many(self, records):
+        """Per-feature SHAP contributions in RM for each record; a bad record gets its error body."""
+        results, keys, slots = [None] * len(records), [], []
+        for i, record in enumerate(records):
+            try:
+                codes, normalized = self.encode(record)
+            except PredictionError as e:
+                results[i] = e.body
+                continue
+            keys.append(tuple(codes[f] for f in self.features))
+            slots.append((i, normalized))
+        for (i, normalized), (base, contributions) in zip(slots, self.explainer.explain(keys)):
+            results[i] = {
+                'base_value': round(base, 2),
+                'mean_salary': round(base + float(sum(contributions)), 2),
+                'contributions': {f: round(float(c), 2) for f, c in zip(self.features, contributions)},
+                'normalized': normalized
+            }
+        return results
+
+    def stats(self):
+        return {'batching': self.batcher.stats(), 'single_flight': self.flights.stats(),
+                'explain_cache': self.explainer.stats()}
+
+    def predict(self, input_data):
+        future, normalized = self.submit(input_data)
+        return self.response(future.result(), normalized)
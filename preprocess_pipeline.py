@@ -0,0 +1,379 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import shutil
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import pandas as pd
+
+from salary_parser import parse_salary
+from state_detection import detect_states, map_locations_to_states, UNKNOWN
+from geocode_cache import GeocodeCache, NominatimResolver, GoogleResolver, CACHE_PATH
+from vocab import Vocabulary, VOCAB_PATH
+from dataset_store import STORE_DIR, listing_month, write_partitions
+
+# ─── 1) Defaults ─────────────────────────────────────────────────────────────────
+RAW_PATH = 'dataset/jobstreet_with_monthly_min_max.csv'
+OUT_DIR = 'dataset'
+CHUNKSIZE = 50_000
+PARTITION_DIR = 'partitions'     # incremental output: <out_dir>/partitions/month=YYYY-MM/part.csv
+MANIFEST = 'manifest.csv'        # job_id -> raw row hash + month it was filed under
+CHANGES = 'changes.json'         # months rewritten by the last incremental run
+CLEAN_PART = 'clean.csv'         # a month's clean rows, kept next to its part.csv
+STAGING = '.staging'             # processed changed rows, per month and chunk, until merged
+PARTITION_DTYPES = {'job_id': str, 'min_salary': 'Int64', 'max_salary': 'Int64', 'mean_salary': 'Int64'}
+
+CATEGORY_MAPPING = {
+    # Business & Finance
+    'Accounting': 'Business & Finance',
+    'Banking & Financial Services': 'Business & Finance',
+    'Insurance & Superannuation': 'Business & Finance',
+
+    # Technology
+    'Information & Communication Technology': 'Technology',
+    'Science & Technology': 'Technology',
+
+    # Management & Professional Services
+    'CEO & General Management': 'Management',
+    'Consulting & Strategy': 'Professional Services',
+    'Legal': 'Professional Services',
+    'Human Resources & Recruitment': 'Professional Services',
+
+    # Engineering & Construction
+    'Engineering': 'Engineering & Construction',
+    'Construction': 'Engineering & Construction',
+    'Design & Architecture': 'Engineering & Construction',
+    'Mining, Resources & Energy': 'Engineering & Construction',
+
+    # Healthcare & Social Services
+    'Healthcare & Medical': 'Healthcare',
+    'Community Services & Development': 'Social Services',
+    'Government & Defence': 'Social Services',
+
+    # Sales & Marketing
+    'Sales': 'Sales & Marketing',
+    'Marketing & Communications': 'Sales & Marketing',
+    'Advertising, Arts & Media': 'Sales & Marketing',
+
+    # Operations & Logistics
+    'Manufacturing, Transport & Logistics': 'Operations',
+    'Trades & Services': 'Operations',
+    'Retail & Consumer Products': 'Operations',
+
+    # Hospitality & Lifestyle
+    'Hospitality & Tourism': 'Hospitality',
+    'Sport & Recreation': 'Lifestyle',
+
+    # Education & Administration
+    'Education & Training': 'Education',
+    'Administration & Office Support': 'Administration',
+
+    # Miscellaneous
+    'Farming, Animals & Conservation': 'Agriculture & Environment',
+    'Real Estate & Property': 'Real Estate',
+    'Self Employment': 'Other',
+    'Call Centre & Customer Service': 'Customer Service'
+}
+
+# Model-ready subset (trainers and dashboards read this one)
+CLEAN_COLUMNS = ['job_id', 'job_title', 'category', 'broad_category', 'role', 'location', 'state',
+                 'type', 'salary', 'min_salary', 'max_salary', 'mean_salary', 'listingDate']
+SALARY_COLUMNS = ['min_salary', 'max_salary', 'mean_salary']     # RM per month
+
+
+# ─── 2) Stages ───────────────────────────────────────────────────────────────────
+def process_chunk(chunk):
+    """Salary cleaning, state detection and broad category for one chunk of raw rows."""
+    chunk = chunk.copy()
+    # all three amounts come from the same monthly-normalized parse; the raw
+    # min/max columns only fill in postings whose salary text has no numbers
+    parsed = parse_salary(chunk['salary'])
+    for col in SALARY_COLUMNS:
+        raw = pd.to_numeric(chunk[col], errors='coerce') if col in chunk.columns else None
+        chunk[col] = parsed[col] if raw is None else parsed[col].fillna(raw)
+    midpoint = (chunk['min_salary'] + chunk['max_salary']) / 2
+    chunk['mean_salary'] = chunk['mean_salary'].fillna(midpoint.round())
+    for col in SALARY_COLUMNS:
+        chunk[col] = chunk[col].astype('Float64').round().astype('Int64')
+    chunk['state'] = detect_states(chunk['location'])
+    chunk['broad_category'] = chunk['category'].map(CATEGORY_MAPPING).fillna('Other')
+    return chunk
+
+
+def _write_csv(df, path):
+    tmp = path + '.tmp'
+    df.to_csv(tmp, index=False)
+    os.replace(tmp, path)
+
+
+def _run_chunk(args):
+    i, chunk, part_path = args
+    _write_csv(process_chunk(chunk), part_path)
+    return i, len(chunk)
+
+
+def chunk_dir(raw_path, out_dir, chunksize):
+    """Per-input work directory; a different file or chunk size never reuses old parts."""
+    st = os.stat(raw_path)
+    stamp = hashlib.sha1(f"{os.path.abspath(raw_path)}|{st.st_size}|{st.st_mtime_ns}|{chunksize}".encode()).hexdigest()[:10]
+    return os.path.join(out_dir, '.chunks', f"{os.path.splitext(os.path.basename(raw_path))[0]}-{stamp}")
+
+
+def run_chunks(raw_path, work_dir, chunksize=CHUNKSIZE, workers=None):
+    """Stream the raw CSV through process_chunk on a process pool; finished parts are skipped."""
+    os.makedirs(work_dir, exist_ok=True)
+    workers = workers or os.cpu_count()
+    done = skipped = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for i, chunk in enumerate(pd.read_csv(raw_path, chunksize=chunksize)):
+            part_path = os.path.join(work_dir, f"part-{i:05d}.csv")
+            if os.path.exists(part_path):
+                skipped += 1
+                continue
+            pending.add(pool.submit(_run_chunk, (i, chunk, part_path)))
+            if len(pending) >= workers * 2:     # bound the chunks held in memory
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for f in finished:
+                    f.result()
+                done += len(finished)
+        for f in pending:
+            f.result()
+            done += 1
+    print(f"⚙️  {done} chunks processed, {skipped} already done ({work_dir})")
+
+
+def assemble(work_dir, out_dir, cache=None):
+    """Concatenate the parts and write preprocessed_dataset.csv + clean_preprocessed_dataset.csv."""
+    parts = sorted(glob.glob(os.path.join(work_dir, 'part-*.csv')))
+    df = pd.concat((pd.read_csv(p) for p in parts), ignore_index=True)
+
+    # Geocoding runs once, here, over the distinct locations still Unknown
+    if cache is not None:
+        df['state'] = map_locations_to_states(df['location'], cache)
+
+    df[SALARY_COLUMNS] = df[SALARY_COLUMNS].astype('Int64')
+    _write_csv(df, os.path.join(out_dir, 'preprocessed_dataset.csv'))
+    clean = write_clean(df, out_dir)
+    print(f"✅ {len(df):,} rows -> preprocessed_dataset.csv, {len(clean):,} -> clean_preprocessed_dataset.csv")
+    return df
+
+
+def clean_rows(df):
+    """Rows with a known salary and state, in the model-ready columns."""
+    clean = df[df['mean_salary'].notna() & df['state'].notna() & (df['state'] != UNKNOWN)]
+    return clean[[c for c in CLEAN_COLUMNS if c in clean.columns]]
+
+
+def write_clean(df, out_dir, months=None):
+    """Write clean_preprocessed_dataset.csv (salary and state known), its month/category
+    store partitions (only `months` when given) and extend the vocabulary."""
+    clean = clean_rows(df)
+    _write_csv(clean, os.path.join(out_dir, 'clean_preprocessed_dataset.csv'))
+    write_partitions(clean, os.path.join(out_dir, os.path.basename(STORE_DIR)), months)
+
+    # The categorical vocabulary is built at ingest and only ever extended
+    vocab_path = os.path.join(out_dir, os.path.basename(VOCAB_PATH))
+    vocab = Vocabulary.for_frame(clean, vocab_path)
+    vocab.save(vocab_path)
+    print(f"📊 Vocabulary {vocab.version}")
+    return clean
+
+
+# ─── 3) Incremental mode ─────────────────────────────────────────────────────────
+# Each raw row is hashed with every column read as text, so dtype inference
+# differing between chunks never changes a hash. Only rows whose job_id is new
+# or whose hash changed go through the stages; they are then merged into the
+# month partitions they belong to and every other partition is left as is.
+def row_hashes(chunk):
+    return pd.util.hash_pandas_object(chunk, index=False)
+
+
+def partition_path(part_dir, month):
+    return os.path.join(part_dir, f"month={month}", 'part.csv')
+
+
+def load_manifest(part_dir):
+    path = os.path.join(part_dir, MANIFEST)
+    if not os.path.exists(path):
+        return pd.DataFrame({'row_hash': pd.Series(dtype='uint64'), 'month': pd.Series(dtype=object)},
+                            index=pd.Index([], dtype=object, name='job_id'))
+    return pd.read_csv(path, dtype={'job_id': str, 'row_hash': 'uint64', 'month': str}).set_index('job_id')
+
+
+def changed_rows(raw_path, manifest, chunksize=CHUNKSIZE):
+    """Yield (raw rows, their hashes) for postings that are new or changed since the manifest."""
+    known = manifest['row_hash']
+    for chunk in pd.read_csv(raw_path, chunksize=chunksize, dtype=str):
+        chunk = chunk.drop_duplicates('job_id', keep='last')
+        hashes = row_hashes(chunk)
+        seen = chunk['job_id'].isin(known.index).to_numpy()
+        changed = ~seen
+        changed[seen] = known.reindex(chunk['job_id'][seen]).to_numpy() != hashes[seen].to_numpy()
+        if changed.any():
+            yield chunk[changed], hashes[changed]
+
+
+def stage_chunk(processed, row_hash, i, stage_dir, cache=None):
+    """Spill one processed chunk to <stage_dir>/month=.../chunk-i.csv; returns its job_id/hash/month."""
+    if cache is not None:
+        processed['state'] = map_locations_to_states(processed['location'], cache)
+    month = listing_month(processed)
+    for m, rows in processed.groupby(month):
+        path = os.path.join(stage_dir, f"month={m}", f"chunk-{i:05d}.csv")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        rows.to_csv(path, index=False)
+    return pd.DataFrame({'job_id': processed['job_id'].to_numpy(), 'row_hash': row_hash.reindex(processed.index).to_numpy(),
+                         'month': month.to_numpy(), 'chunk': i})
+
+
+def staged_rows(stage_dir, month, winners):
+    """A month's staged rows, each job_id only from the last chunk it appeared in."""
+    frames = []
+    for path in sorted(glob.glob(os.path.join(stage_dir, f"month={month}", 'chunk-*.csv'))):
+        rows = pd.read_csv(path, dtype=PARTITION_DTYPES)
+        i = int(os.path.basename(path)[len('chunk-'):-len('.csv')])
+        frames.append(rows[winners.reindex(rows['job_id']).to_numpy() == i])
+    return pd.concat(frames, ignore_index=True) if frames else None
+
+
+def merge_partitions(updated, manifest, part_dir, stage_dir, out_dir):
+    """Upsert the staged rows by job_id, one month at a time; returns the months rewritten.
+
+    Only touched months are read: each gets its part.csv and clean.csv
+    rewritten, its store partitions replaced and its values added to the
+    vocabulary.
+    """
+    # a posting whose listingDate moved also has to leave its old month
+    moved_from = manifest['month'].reindex(updated['job_id']).dropna()
+    touched = sorted(set(updated['month']) | set(moved_from))
+    ids = set(updated['job_id'])
+    winners = updated.set_index('job_id')['chunk']
+    store_dir = os.path.join(out_dir, os.path.basename(STORE_DIR))
+    vocab_path = os.path.join(out_dir, os.path.basename(VOCAB_PATH))
+    vocab = Vocabulary.for_frame(pd.DataFrame(), vocab_path)
+    for month in touched:
+        path = partition_path(part_dir, month)
+        rows = staged_rows(stage_dir, month, winners)
+        if os.path.exists(path):
+            part = pd.read_csv(path, dtype=PARTITION_DTYPES)
+            rows = pd.concat([part[~part['job_id'].isin(ids)], rows], ignore_index=True)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _write_csv(rows, path)
+        clean = clean_rows(rows)
+        _write_csv(clean, os.path.join(os.path.dirname(path), CLEAN_PART))
+        write_partitions(clean, store_dir, [month])
+        vocab.extend(clean)
+    vocab.save(vocab_path)
+    print(f"📊 Vocabulary {vocab.version}")
+    return touched
+
+
+def concat_clean(part_dir, out_dir):
+    """clean_preprocessed_dataset.csv from every month's clean.csv, copied as bytes."""
+    path = os.path.join(out_dir, 'clean_preprocessed_dataset.csv')
+    header = None
+    with open(path + '.tmp', 'wb') as out:
+        for month_dir in sorted(glob.glob(os.path.join(part_dir, 'month=*'))):
+            clean_path = os.path.join(month_dir, CLEAN_PART)
+            if not os.path.exists(clean_path):      # partitions written before clean parts were kept
+                part = pd.read_csv(os.path.join(month_dir, 'part.csv'), dtype=PARTITION_DTYPES)
+                _write_csv(clean_rows(part), clean_path)
+            with open(clean_path, 'rb') as f:
+                first = f.readline()
+                if header is None:
+                    header = first
+                    out.write(header)
+                elif first != header:
+                    raise ValueError(f"{clean_path} has different columns than the other months")
+                shutil.copyfileobj(f, out)
+    os.replace(path + '.tmp', path)
+
+
+def run_incremental(raw_path, out_dir, chunksize=CHUNKSIZE, workers=None, cache=None):
+    part_dir = os.path.join(out_dir, PARTITION_DIR)
+    stage_dir = os.path.join(part_dir, STAGING)
+    shutil.rmtree(stage_dir, ignore_errors=True)
+    os.makedirs(part_dir, exist_ok=True)
+    manifest = load_manifest(part_dir)
+
+    # Processed chunks are spilled to stage_dir as they finish, so memory holds
+    # at most workers * 2 chunks plus the job_id/hash/month of changed rows.
+    workers = workers or os.cpu_count()
+    staged = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = {}
+        for i, (rows, row_hash) in enumerate(changed_rows(raw_path, manifest, chunksize)):
+            pending[pool.submit(process_chunk, rows)] = (row_hash, i)
+            if len(pending) >= workers * 2:     # bound the chunks held in memory
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for f in finished:
+                    staged.append(stage_chunk(f.result(), *pending.pop(f), stage_dir, cache))
+        for f, (row_hash, i) in pending.items():
+            staged.append(stage_chunk(f.result(), row_hash, i, stage_dir, cache))
+    if not staged:
+        print(f"⏭  No new or changed postings in {raw_path}; partitions untouched")
+        return []
+
+    # a job_id repeated across chunks keeps its last version
+    updated = pd.concat(staged).sort_values('chunk', kind='stable').drop_duplicates('job_id', keep='last')
+    new = int((~updated['job_id'].isin(manifest.index)).sum())
+
+    # Partitions first, manifest last: a crash in between only means those rows
+    # are processed again next run, and the upsert by job_id is idempotent.
+    touched = merge_partitions(updated, manifest, part_dir, stage_dir, out_dir)
+    manifest = pd.concat([
+        manifest.drop(index=updated['job_id'], errors='ignore'),
+        updated.set_index('job_id')[['row_hash', 'month']],
+    ])
+    _write_csv(manifest.reset_index(), os.path.join(part_dir, MANIFEST))
+    shutil.rmtree(stage_dir, ignore_errors=True)
+
+    changes_path = os.path.join(part_dir, CHANGES)
+    with open(changes_path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump({'updated_at': time.time(), 'months': touched,
+                   'new_rows': new, 'changed_rows': len(updated) - new}, f, indent=1)
+    os.replace(changes_path + '.tmp', changes_path)
+
+    concat_clean(part_dir, out_dir)
+    print(f"✅ {new:,} new + {len(updated) - new:,} changed postings merged into {len(touched)} month "
+          f"partition(s) {touched}; clean_preprocessed_dataset.csv rebuilt from the month parts")
+    return touched
+
+
+# ─── 4) Run ──────────────────────────────────────────────────────────────────────
+def main():
+    parser = argparse.ArgumentParser(description="Raw JobStreet scrape -> model-ready datasets")
+    parser.add_argument('--input', default=RAW_PATH)
+    parser.add_argument('--out-dir', default=OUT_DIR)
+    parser.add_argument('--chunksize', type=int, default=CHUNKSIZE)
+    parser.add_argument('--workers', type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument('--geocode', choices=['off', 'cache', 'nominatim', 'google'], default='cache',
+                        help="'cache' answers from the local cache only and never goes to the network")
+    parser.add_argument('--google-key', default=os.environ.get('GOOGLE_MAPS_API_KEY'))
+    parser.add_argument('--incremental', action='store_true',
+                        help=f"only process new/changed job_ids and merge them into {PARTITION_DIR}/month=YYYY-MM")
+    args = parser.parse_args()
+
+    cache = None
+    if args.geocode != 'off':
+        resolvers = []
+        if args.geocode == 'nominatim':
+            resolvers = [NominatimResolver()]
+        elif args.geocode == 'google':
+            resolvers = [GoogleResolver(args.google_key)]
+        cache = GeocodeCache(os.path.join(args.out_dir, os.path.basename(CACHE_PATH)), resolvers)
+
+    if args.incremental:
+        run_incremental(args.input, args.out_dir, args.chunksize, args.workers, cache)
+        return
+    work_dir = chunk_dir(args.input, args.out_dir, args.chunksize)
+    run_chunks(args.input, work_dir, args.chunksize, args.workers)
+    assemble(work_dir, args.out_dir, cache)
+
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,7 @@ from sklearn.pipeline import Pipeline
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 import joblib
 import numpy as np
+from forest_export import FOREST_DIR, export
 
 # Step 1: Load the dataset
 df = pd.read_csv("dataset/preprocess_dataset3.csv")  # replace with your filename
@@ -59,6 +60,9 @@ print(f"R² Score: {r2:.2f}")
 # Step 8: Save model (optional)
 joblib.dump(model, 'salary_predictor_model.pkl')
 
+# Memory-mapped copy of the trees that app.py workers share (see forest_export.py)
+export(model, FOREST_DIR)
+
 # Predict example
 sample_input = pd.DataFrame([{
     'job_title': 'Accounts Executive',
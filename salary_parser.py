@@ -0,0 +1,198 @@
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+
+# ─── 1) Reference implementation (from eda2.ipynb) ───────────────────────────────
+#find mean
+def clean_salary(salary_str):
+    """Robust salary cleaning that handles all special cases"""
+    if pd.isna(salary_str) or not isinstance(salary_str, str):
+        return None
+
+    # Common replacements first
+    salary_str = salary_str.lower()
+    salary_str = (salary_str.replace('per month', '')
+                  .replace('p.m.', '')
+                  .replace('per annum', '')
+                  .replace('monthly', '')
+                  .replace('â€“', '-')  # Replace en dash with normal hyphen
+                  .replace('–', '-'))  # Replace em dash with normal hyphen
+
+    # Remove all non-numeric characters except digits, commas, and hyphens
+    salary_str = re.sub(r'[^\d,\-]', '', salary_str)
+
+    # Handle cases where no numbers exist
+    if not any(char.isdigit() for char in salary_str):
+        return None
+
+    # Extract all numbers (handle thousand separators)
+    numbers = []
+    for num in re.findall(r'[\d,]+', salary_str):
+        try:
+            numbers.append(int(num.replace(',', '')))
+        except ValueError:
+            continue
+
+    # Calculate mean if valid
+    if len(numbers) == 0:
+        return None
+    elif len(numbers) == 1:
+        return numbers[0]
+    else:
+        return round(sum(numbers) / len(numbers))
+
+
+# ─── 2) Vectorized parser ────────────────────────────────────────────────────────
+# The phrase removals in clean_salary only delete letters, which the character
+# filter deletes anyway; only the dash replacements change the result (they turn
+# "3,000 – 4,000" into two numbers instead of one). Salary strings repeat heavily,
+# so every step runs once per distinct string and is broadcast back by code.
+DASHES = r'â€“|–'
+ANNUAL = r'per annum|p\.a\.|annual|per year|yearly'
+MONTHLY = r'per month|p\.m\.|monthly|a month|/month'
+HOURLY = r'per hour|hourly|an hour|/hour|per hr|/hr'
+HOURS_PER_MONTH = 173   # 40 h a week * 52 weeks / 12
+
+# parse_salary reads amounts as written instead: decimals and a "k" suffix are
+# kept, and only the first salary range counts, so "13th month" or "2 years"
+# later in the text is never taken as a bound. An amount written with RM/MYR
+# wins over a bare number appearing before it.
+_AMOUNT = r'(?P<{0}>\d(?:[\d,]*\d)?(?:\.\d+)?)\s?(?P<{0}_k>k)?\b(?!\s*(?:years?|yrs?)\b)'
+SALARY_RANGE = re.compile(
+    r'(?P<currency>rm|myr)?\s*' + _AMOUNT.format('low') +
+    r'(?:\s*(?:-|–|—|â€“|to)\s*(?:rm|myr)?\s*' + _AMOUNT.format('high') + ')?',
+    re.IGNORECASE,
+)
+
+
+def _distinct(salary):
+    codes, uniques = pd.factorize(salary.astype(object))    # missing -> code -1
+    uniques = pd.Series(uniques, dtype=object)
+    return codes, uniques.where(uniques.map(lambda v: isinstance(v, str)))   # like clean_salary, non-strings are missing
+
+
+def _broadcast(per_unique, codes, n_uniques, index):
+    # position n_uniques is an all-missing row, which is where code -1 lands
+    out = per_unique.reindex(range(n_uniques + 1)).take(codes)
+    out.index = index
+    return out
+
+
+def extract_numbers(values):
+    """Long Series of the integers in each string, indexed by position in values.
+
+    This is clean_salary's reading, quirks included (decimal points and "k"
+    are dropped, every number counts); parse_salary uses salary_ranges().
+    """
+    digits = (values.str.lower()
+              .str.replace(DASHES, '-', regex=True)
+              .str.replace(r'[^\d,\-]', '', regex=True))
+    tokens = digits.str.findall(r'[\d,]+').explode().dropna().str.replace(',', '', regex=False)
+    return tokens[tokens != ''].astype('int64')
+
+
+def clean_salary_vectorized(salary):
+    """clean_salary over a whole column: rounded mean of the numbers, <NA> where there are none."""
+    codes, uniques = _distinct(salary)
+    grouped = extract_numbers(uniques).groupby(level=0)
+    mean = np.round(grouped.sum() / grouped.count())    # round-half-even, like round()
+    return _broadcast(mean, codes, len(uniques), salary.index).astype('Int64')
+
+
+def _amount(matches, name):
+    value = pd.to_numeric(matches[name].str.replace(',', '', regex=False), errors='coerce')
+    return value.where(matches[f"{name}_k"].isna(), value * 1000)
+
+
+def salary_ranges(values):
+    """(low, high) of the first salary range in each string, indexed like values; NaN where there is none."""
+    matches = values.str.extractall(SALARY_RANGE)
+    # first match per string, preferring one with a currency
+    matches = (matches.assign(bare=matches['currency'].isna())
+               .sort_values('bare', kind='stable').groupby(level=0).head(1).droplevel('match'))
+    low = _amount(matches, 'low')
+    high = _amount(matches, 'high').fillna(low)
+    return pd.DataFrame({'low': low, 'high': high}).reindex(values.index)
+
+
+def parse_salary(salary, default_period='month'):
+    """Min/max/mean per posting, normalized to a monthly figure.
+
+    Returns columns salary_period (the period the posting quotes: 'month',
+    'annum' or 'hour'), min_salary, max_salary and mean_salary. The amounts
+    are always monthly: annual figures are divided by 12 and hourly ones
+    multiplied by HOURS_PER_MONTH.
+    """
+    codes, uniques = _distinct(salary)
+    ranges = salary_ranges(uniques)
+    out = pd.DataFrame({
+        'min_salary': ranges.min(axis=1),
+        'max_salary': ranges.max(axis=1),
+        'mean_salary': ranges.mean(axis=1),
+    }).astype('float64')
+
+    text = uniques.str.lower()
+    annual = text.str.contains(ANNUAL, regex=True, na=False)
+    monthly = text.str.contains(MONTHLY, regex=True, na=False)
+    hourly = text.str.contains(HOURLY, regex=True, na=False)
+    period = pd.Series(default_period, index=uniques.index, dtype=object)
+    period[annual & ~monthly] = 'annum'
+    period[hourly & ~annual & ~monthly] = 'hour'
+    period[out['mean_salary'].isna()] = None
+
+    amounts = ['min_salary', 'max_salary', 'mean_salary']
+    out.loc[period == 'annum', amounts] /= 12
+    out.loc[period == 'hour', amounts] *= HOURS_PER_MONTH
+    out[amounts] = out[amounts].round()
+    out.insert(0, 'salary_period', period)
+    return _broadcast(out, codes, len(uniques), salary.index)
+
+
+# ─── 3) Parity check ─────────────────────────────────────────────────────────────
+SAMPLE_SALARIES = [
+    'RM 3,000 – RM 4,000 per month',
+    'RM 3,500 - RM 4,500 per month',
+    'RM 2,800 â€“ RM 3,200 per month',
+    'RM 60,000 – RM 80,000 per annum',
+    'RM 2,000 per month',
+    'RM2,500 - RM3,000 monthly',
+    'RM 4,000 – RM 5,500 p.m.',
+    'RM 1,500.50 per month',
+    'RM 12 – RM 15 per hour',
+    'MYR 5k - 7k',
+    'RM 3,001 – RM 3,002 per month',
+    'RM 2,500 – RM 3,500',
+    'Competitive',
+    'Negotiable',
+    ',',
+    '-',
+    '',
+    '١٢٣',
+    None,
+    3500,
+    float('nan'),
+]
+
+
+def check_parity(salary):
+    """Rows where clean_salary_vectorized disagrees with clean_salary (empty frame = parity)."""
+    expected = salary.map(clean_salary).astype('Int64')
+    actual = clean_salary_vectorized(salary)
+    differs = ~((expected == actual).fillna(False) | (expected.isna() & actual.isna()))
+    return pd.DataFrame({'salary': salary, 'clean_salary': expected, 'vectorized': actual})[differs]
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        corpus = pd.read_csv(sys.argv[1], usecols=['salary'])['salary']
+    else:
+        corpus = pd.Series(SAMPLE_SALARIES, dtype=object)
+    mismatches = check_parity(corpus)
+    if mismatches.empty:
+        print(f"✅ clean_salary_vectorized matches clean_salary on {len(corpus):,} salary strings")
+    else:
+        print(f"❌ {len(mismatches):,} of {len(corpus):,} salary strings differ:")
+        print(mismatches.head(20))
+        sys.exit(1)
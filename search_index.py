@@ -0,0 +1,79 @@
+import bisect
+import re
+from collections import Counter
+
+# ─── 1) Defaults ─────────────────────────────────────────────────────────────────
+SEARCH_FIELDS = ['job_title', 'role', 'location']
+TOP_K = 20
+MIN_TRIGRAM_SCORE = 0.5
+
+_NON_WORD = re.compile(r'[^0-9a-z]+')
+
+
+def normalize(text):
+    return _NON_WORD.sub(' ', str(text).lower()).strip()
+
+
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# ─── 2) Index ────────────────────────────────────────────────────────────────────
+class SearchIndex:
+    """Prefix + trigram index over the distinct values of one text column.
+
+    Word-prefix hits rank first, then fuzzy trigram hits; ties go to the more
+    frequent value.
+    """
+
+    def __init__(self, counts):
+        # counts: value -> number of postings (e.g. a value_counts() Series)
+        items = sorted(((str(v), int(n)) for v, n in counts.items()), key=lambda t: -t[1])
+        self.values = [v for v, _ in items]
+        self.weights = [n for _, n in items]
+        self.keys = [normalize(v) for v in self.values]
+
+        # Every word start of every value, sorted, so a prefix is one bisect range
+        starts = []
+        for i, key in enumerate(self.keys):
+            for m in re.finditer(r'\S+', key):
+                starts.append((key[m.start():], i))
+        starts.sort()
+        self._suffixes = [s for s, _ in starts]
+        self._suffix_ids = [i for _, i in starts]
+
+        self._grams = {}
+        for i, key in enumerate(self.keys):
+            for g in trigrams(key):
+                self._grams.setdefault(g, []).append(i)
+
+    @classmethod
+    def from_series(cls, series):
+        counts = series.dropna().astype(str).value_counts()
+        return cls(counts[counts > 0])
+
+    def _prefix_ids(self, q):
+        lo = bisect.bisect_left(self._suffixes, q)
+        hi = bisect.bisect_left(self._suffixes, q + '\uffff')
+        return set(self._suffix_ids[lo:hi])
+
+    def search(self, query, k=TOP_K):
+        """Top-k values for a typed query; the most frequent values when query is empty."""
+        q = normalize(query or '')
+        if not q:
+            return self.values[:k]
+        hits = sorted(self._prefix_ids(q))    # ids are already in frequency order
+        if len(hits) < k:
+            grams = trigrams(q)
+            shared = Counter(i for g in grams for i in self._grams.get(g, ()))
+            seen = set(hits)
+            fuzzy = [(-n / len(grams), i) for i, n in shared.items()
+                     if i not in seen and n / len(grams) >= MIN_TRIGRAM_SCORE]
+            hits += [i for _, i in sorted(fuzzy)[:k - len(hits)]]
+        return [self.values[i] for i in hits[:k]]
+
+
+def build_indexes(df, fields=SEARCH_FIELDS):
+    """One SearchIndex per text column present in df."""
+    return {field: SearchIndex.from_series(df[field]) for field in fields if field in df.columns}
@@ -0,0 +1,126 @@
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from dataset_store import load
+
+# ─── 1) Layout ───────────────────────────────────────────────────────────────────
+# dataset/shared/CURRENT                 name of the live generation
+# dataset/shared/<generation>/meta.json  row count + per-column kind/dtype/categories
+# dataset/shared/<generation>/<col>.npy  one typed array per column
+#
+# One loader process publishes a generation; every dashboard worker maps the
+# .npy files read-only, so the OS keeps a single copy in the page cache no
+# matter how many workers run. Text columns are stored as pandas category
+# codes and dates as naive UTC datetime64, both of which pandas and DuckDB
+# wrap without copying.
+SHARED_DIR = 'dataset/shared'
+CURRENT = 'CURRENT'
+KEEP = 2        # generations kept on disk (workers still on the previous one re-attach lazily)
+
+
+def _column_kind(series):
+    if isinstance(series.dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_dtype(series):
+        return 'datetime'
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+        return 'numeric'
+    return 'category'
+
+
+def publish(df, root=SHARED_DIR, dates=('listingDate',)):
+    """Write df as a new generation and switch CURRENT to it atomically."""
+    generation = time.strftime('%Y%m%dT%H%M%S') + f"-{os.getpid()}"
+    path = os.path.join(root, generation)
+    os.makedirs(path)
+    meta = {'rows': len(df), 'columns': []}
+    for col in df.columns:
+        series = df[col]
+        if col in dates:
+            series = pd.to_datetime(series, utc=True, errors='coerce')
+        kind = _column_kind(series)
+        info = {'name': col, 'kind': kind}
+        if kind == 'datetime':
+            if series.dt.tz is not None:
+                series = series.dt.tz_convert('UTC').dt.tz_localize(None)
+            values = series.to_numpy('datetime64[ns]')
+        elif kind == 'category':
+            cat = series.astype(str).where(series.notna()).astype('category')
+            values = cat.cat.codes.to_numpy()       # int8/16/32, as pandas itself sizes them
+            info['categories'] = cat.cat.categories.tolist()
+        elif pd.api.types.is_extension_array_dtype(series):
+            # nullable ints keep their width unless something is missing (then NaN floats)
+            values = series.to_numpy('float64' if series.hasnans else series.dtype.numpy_dtype)
+        else:
+            values = series.to_numpy()
+        np.save(os.path.join(path, f"{len(meta['columns'])}.npy"), values, allow_pickle=False)
+        meta['columns'].append(info)
+    with open(os.path.join(path, 'meta.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+
+    pointer = os.path.join(root, CURRENT)
+    with open(pointer + '.tmp', 'w', encoding='utf-8') as f:
+        f.write(generation)
+    os.replace(pointer + '.tmp', pointer)
+
+    # mapped files stay valid after unlink, so pruning never breaks a worker
+    old = sorted(g for g in os.listdir(root) if os.path.isdir(os.path.join(root, g)) and g != generation)
+    for g in old[:max(0, len(old) - (KEEP - 1))]:
+        shutil.rmtree(os.path.join(root, g), ignore_errors=True)
+    return generation
+
+
+# ─── 2) Attach ───────────────────────────────────────────────────────────────────
+def current_generation(root=SHARED_DIR):
+    try:
+        with open(os.path.join(root, CURRENT), encoding='utf-8') as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def attach(root=SHARED_DIR, generation=None):
+    """DataFrame whose columns are read-only memory maps of one generation."""
+    generation = generation or current_generation(root)
+    path = os.path.join(root, generation)
+    with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+        meta = json.load(f)
+    columns = {}
+    for i, info in enumerate(meta['columns']):
+        values = np.load(os.path.join(path, f"{i}.npy"), mmap_mode='r')
+        if info['kind'] == 'category':
+            values = pd.Categorical.from_codes(values, categories=info['categories'], validate=False)
+        columns[info['name']] = values
+    return pd.DataFrame(columns, copy=False)
+
+
+class SharedDataset:
+    """The live generation, re-attached when CURRENT moves to a new one."""
+
+    def __init__(self, root=SHARED_DIR):
+        self.root = root
+        self.generation = None
+        self._frame = None
+        self._lock = threading.Lock()
+
+    def frame(self):
+        generation = current_generation(self.root)
+        if generation != self.generation:
+            with self._lock:
+                if generation != self.generation:
+                    self._frame = attach(self.root, generation)
+                    self.generation = generation
+        return self._frame
+
+
+if __name__ == '__main__':
+    root = sys.argv[1] if len(sys.argv) > 1 else SHARED_DIR
+    df = load()
+    os.makedirs(root, exist_ok=True)
+    generation = publish(df, root)
+    print(f"✅ Published {len(df):,} rows as generation {generation} in {root}")
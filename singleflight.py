@@ -0,0 +1,62 @@
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """Concurrent calls with the same key share one in-flight computation.
+
+    The first caller for a key runs it; anyone arriving before it finishes gets
+    the same result (or exception). Nothing is kept afterwards, so this is
+    deduplication, not a cache.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.calls = 0          # computations actually started
+        self.coalesced = 0      # callers that joined one already in flight
+
+    def submit(self, key, start):
+        """Future of start() for key; start must return a concurrent.futures.Future."""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future
+            future = start()
+            self._calls[key] = future
+            self.calls += 1
+        future.add_done_callback(lambda f: self._forget(key, f))
+        return future
+
+    def do(self, key, fn):
+        """fn() for key, run by the first concurrent caller and shared with the rest."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._forget(key, future)
+
+    def _forget(self, key, future):
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def stats(self):
+        with self._lock:
+            return {'calls': self.calls, 'coalesced': self.coalesced, 'in_flight': len(self._calls)}
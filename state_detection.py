@@ -0,0 +1,192 @@
+from collections import deque
+
+import numpy as np
+import pandas as pd
+from rapidfuzz import fuzz, process, utils
+
+# ─── 1) State keywords (from eda2.ipynb) ─────────────────────────────────────────
+STATE_MAPPING = {
+    'Kuala Lumpur': ['Alam Damai', 'Bandar Malaysia', 'Bandar Sri Permaisuri', 'Bandar Tasik Selatan',
+                     'Bandar Tun Razak', 'Bangsar', 'Bangsar Baru', 'Bangsar South', 'Brickfields',
+                     'Bukit Bintang', 'Bukit Damansara', 'Bukit Jalil', 'Bukit Kiara', 'Bukit Tunku',
+                     'Cheras', 'Chow Kit', 'Desa Pandan', 'Desa Parkcity', 'Desa Petaling', 'Jinjang',
+                     'Kepong', 'Keramat', 'Kuchai Lama', 'Lembah Pantai', 'Menjalara', 'Setapak',
+                     'Sri Damansara', 'Sri Hartamas', 'Sungai Besi', 'Taman Melawati', 'Taman Tun Dr Ismail',
+                     'Wangsa Maju'],
+
+    'Selangor': ['Ampang', 'Ara Damansara', 'Balakong', 'Bandar Amanjaya', 'Bandar Baru Bangi',
+                 'Bandar Baru Klang', 'Bandar Baru Selayang', 'Bandar Botanic', 'Bandar Bukit Puchong',
+                 'Bandar Bukit Tinggi', 'Bandar Kinrara', 'Bandar Mahkota Cheras', 'Bandar Rimbayu',
+                 'Bandar Saujana Putra', 'Bandar Sri Damansara', 'Bangi', 'Banting', 'Batang Kali',
+                 'Bestari Jaya', 'Bukit Beruntung', 'Bukit Jelutong', 'Bukit Raja', 'Bukit Rimau',
+                 'Cheras', 'Cyberjaya', 'Damansara', 'Damansara Damai', 'Damansara Jaya',
+                 'Damansara Perdana', 'Damansara Utama', 'Elmina', 'Gombak', 'Hulu Klang',
+                 'Hulu Langat', 'Kajang', 'Klang', 'Kinrara', 'Kota Damansara', 'Kota Warisan',
+                 'Puchong', 'Rawang', 'Sabak Bernam', 'Selayang', 'Semenyih', 'Seri Kembangan',
+                 'Shah Alam', 'Sungai Buloh', 'USJ'],
+
+    'Penang': ['Alma', 'Ayer Itam', 'Balik Pulau', 'Batu Ferringhi', 'Batu Kawan', 'Batu Maung',
+               'Bayan Baru', 'Bayan Lepas', 'Bukit Bendera', 'Bukit Mertajam', 'Bukit Minyak',
+               'Bukit Tengah', 'Butterworth', 'Farlim', 'George Town', 'Jelutong', 'Juru',
+               'Kepala Batas', 'Perai', 'Paya Terubong', 'Pulau Pinang', 'Relau', 'Sungai Ara',
+               'Simpang Ampat'],
+
+    'Melaka': ['Alor Gajah', 'Ayer Keroh', 'Bachang', 'Bandar Hilir', 'Batu Berendam', 'Bukit Rambai',
+               'Durian Tunggal', 'Jasin', 'Klebang', 'Melaka City', 'Melaka Tengah', 'Sungai Udang'],
+
+    'Johor': ['Johor Bahru', 'Pasir Gudang', 'Kulai', 'Ulu Tiram', 'Pontian', 'Kota Tinggi', 'Segamat',
+              'Batu Pahat', 'Muar', 'Mersing', 'Kluang'],
+
+    'Pahang': ['Bentong', 'Cameron Highlands', 'Chenor', 'Jerantut', 'Karak', 'Kuantan', 'Lipis',
+               'Mentakab', 'Pekan', 'Raub', 'Temerloh'],
+
+    'Perak': ['Ipoh', 'Batu Gajah', 'Kampar', 'Kuala Kangsar', 'Lumut', 'Parit Buntar', 'Simpang Pulai',
+              'Taiping', 'Teluk Intan'],
+
+    'Sarawak': ['Bintulu', 'Kapit', 'Kuching', 'Miri', 'Sibu', 'Sri Aman'],
+
+    'Sabah': ['Beaufort', 'Kota Kinabalu', 'Kudat', 'Lahad Datu', 'Penampang', 'Sandakan', 'Tawau'],
+
+    'Negeri Sembilan': ['Seremban', 'Nilai', 'Port Dickson', 'Bandar Sri Sendayan'],
+
+    'Kelantan': ['Kota Bharu', 'Bachok', 'Pasir Mas', 'Tanah Merah', 'Tumpat'],
+
+    'Terengganu': ['Kuala Terengganu', 'Dungun', 'Marang', 'Kemaman', 'Besut'],
+
+    'Kedah': ['Alor Setar', 'Sungai Petani', 'Kulim', 'Baling'],
+
+    'Perlis': ['Kangar', 'Arau'],
+
+    'Putrajaya': ['Putrajaya'],
+
+    'Labuan': ['Labuan']
+}
+
+UNKNOWN = 'Unknown'
+FUZZY_CUTOFF = 70
+
+
+# ─── 2) Multi-pattern matcher ────────────────────────────────────────────────────
+class StateMatcher:
+    """Aho-Corasick automaton over the state names and their area keywords.
+
+    One left-to-right pass finds every whole-word keyword in a location. When
+    keywords from several states match, the state listed first in STATE_MAPPING
+    wins, as in the notebook's loop (e.g. "Cheras" -> Kuala Lumpur).
+    """
+
+    def __init__(self, mapping=STATE_MAPPING):
+        self.states = list(mapping)
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]     # (keyword length, state rank) ending at each node
+        for rank, state in enumerate(self.states):
+            for keyword in [state] + mapping[state]:
+                self._add(keyword.lower(), rank)
+        self._link()
+
+    def _add(self, keyword, rank):
+        node = 0
+        for ch in keyword:
+            if ch not in self._goto[node]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[node][ch] = len(self._goto) - 1
+            node = self._goto[node][ch]
+        self._out[node].append((len(keyword), rank))
+
+    def _link(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+                queue.append(child)
+
+    def match(self, location):
+        """State for a location string, or None if no keyword occurs as whole words."""
+        text = location.lower()
+        best = None
+        node = 0
+        for end, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for length, rank in self._out[node]:
+                start = end - length + 1
+                if best is not None and rank >= best:
+                    continue
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if end + 1 < len(text) and text[end + 1].isalnum():
+                    continue
+                best = rank
+        return None if best is None else self.states[best]
+
+
+# ─── 3) Fuzzy fallback ───────────────────────────────────────────────────────────
+_KEYWORDS = [kw for kws in STATE_MAPPING.values() for kw in kws]
+_KEYWORD_STATE = [state for state, kws in STATE_MAPPING.items() for _ in kws]
+
+
+def fuzzy_states(locations, cutoff=FUZZY_CUTOFF, workers=-1):
+    """Closest keyword's state for each location (UNKNOWN below cutoff); scored on all cores."""
+    if not locations:
+        return []
+    scores = process.cdist(locations, _KEYWORDS, scorer=fuzz.WRatio,
+                           processor=utils.default_process, workers=workers)
+    best = scores.argmax(axis=1)
+    return [_KEYWORD_STATE[j] if scores[i, j] > cutoff else UNKNOWN for i, j in enumerate(best)]
+
+
+# ─── 4) Entry points ─────────────────────────────────────────────────────────────
+matcher = StateMatcher()
+_resolved = {}      # location text -> state, shared by every call in this process
+
+
+def detect_states(locations):
+    """Vectorized detect_state: each distinct location is resolved once and memoized."""
+    codes, uniques = pd.factorize(locations.astype(object))
+    todo = [loc for loc in uniques if loc not in _resolved]
+    residual = []
+    for loc in todo:
+        state = matcher.match(str(loc))
+        if state is None:
+            residual.append(loc)
+        else:
+            _resolved[loc] = state
+    # fuzzy scoring only for what the automaton could not place
+    _resolved.update(zip(residual, fuzzy_states([str(loc) for loc in residual])))
+    per_unique = np.array([_resolved[loc] for loc in uniques] + [None], dtype=object)
+    return pd.Series(per_unique[codes], index=locations.index, name='state')
+
+
+def detect_state(location):
+    """Identify Malaysian state from location text"""
+    if pd.isna(location):
+        return None
+    return detect_states(pd.Series([location])).iloc[0]
+
+
+def map_locations_to_states(locations, cache=None):
+    """detect_states, with the still-Unknown locations looked up through a GeocodeCache."""
+    states = detect_states(locations)
+    unknown = (states == UNKNOWN).to_numpy()
+    if cache is None or not unknown.any():
+        return states
+    found = cache.lookup_many(locations[unknown].dropna().unique())
+    # geocoders answer "Wilayah Persekutuan Kuala Lumpur", "Pulau Pinang", ...
+    canonical = {loc: (matcher.match(s) or s) if s else UNKNOWN for loc, s in found.items()}
+    states[unknown] = locations[unknown].map(canonical).fillna(UNKNOWN)
+    return states
+
+
+def map_location_to_state(location, cache=None):
+    if pd.isna(location):
+        return None
+    return map_locations_to_states(pd.Series([location]), cache).iloc[0]
@@ -0,0 +1,131 @@
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+# ─── 1) Defaults ─────────────────────────────────────────────────────────────────
+SOURCE_PATH = 'dataset/clean_preprocessed_dataset.csv'
+CHUNKSIZE = 200_000
+JOINT = ['category', 'broad_category', 'role', 'location', 'state', 'type']   # sampled together
+SALARY_JITTER = 0.05    # lognormal sigma applied to a borrowed salary pair
+ID_START = 10**9        # synthetic job_ids start here, clear of real ones
+DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+SALARY_COLUMNS = ['min_salary', 'max_salary', 'mean_salary']
+
+
+# ─── 2) Profile ──────────────────────────────────────────────────────────────────
+class PostingProfile:
+    """What the generator learns from a preprocessed CSV.
+
+    - the joint frequency of category/role/location/state/type tuples
+    - job titles per role, by frequency
+    - the min/max/mean salaries per category, missing ones included
+    - the listingDate distribution
+    Sampling draws from these, so marginals and the correlations between the
+    categorical columns match the source while the rows themselves are new.
+    """
+
+    def __init__(self, df):
+        self.columns = list(df.columns)
+        self.joint = [c for c in JOINT if c in df.columns]
+        tuples = df[self.joint].astype(str).where(df[self.joint].notna()).value_counts(dropna=False)
+        self.tuples = tuples.index.to_frame(index=False)
+        self.weights = (tuples / tuples.sum()).to_numpy()
+
+        self.titles = {}
+        if 'job_title' in df.columns and 'role' in df.columns:
+            for role, titles in df.groupby(df['role'].astype(str), observed=True)['job_title']:
+                counts = titles.value_counts()
+                self.titles[role] = (counts.index.to_numpy(), (counts / counts.sum()).to_numpy())
+
+        self.salaries = {}
+        self.salary_columns = [c for c in SALARY_COLUMNS if c in df.columns]
+        if self.salary_columns and 'category' in df.columns:
+            values = df[self.salary_columns].astype('float64')
+            for cat, rows in values.groupby(df['category'].astype(str), observed=True):
+                self.salaries[cat] = rows.to_numpy()
+        self.all_salaries = np.concatenate(list(self.salaries.values())) if self.salaries else None
+
+        self.dates = None
+        if 'listingDate' in df.columns:
+            dates = pd.to_datetime(df['listingDate'], utc=True, errors='coerce').dropna()
+            self.dates = dates.dt.tz_localize(None).to_numpy('datetime64[s]').astype(np.int64)
+
+    @classmethod
+    def from_csv(cls, path=SOURCE_PATH):
+        return cls(pd.read_csv(path, low_memory=False))
+
+    # ─── Sampling ────────────────────────────────────────────────────────────────
+    def _titles(self, roles, rng):
+        out = np.empty(len(roles), dtype=object)
+        for role, rows in pd.Series(roles).groupby(roles, dropna=False).indices.items():
+            values, p = self.titles.get(role, (np.array([None]), np.array([1.0])))
+            out[rows] = rng.choice(values, size=len(rows), p=p)
+        return out
+
+    def _salaries(self, categories, rng):
+        """A real posting's salaries from the same category, scaled by one random factor."""
+        values = np.empty((len(categories), len(self.salary_columns)))
+        for cat, rows in pd.Series(categories).groupby(categories, dropna=False).indices.items():
+            source = self.salaries.get(cat, self.all_salaries)
+            values[rows] = source[rng.integers(len(source), size=len(rows))]
+        jitter = rng.lognormal(0, SALARY_JITTER, size=(len(values), 1))
+        return np.round(values * jitter)
+
+    def sample(self, n, rng, first_id=ID_START):
+        """n synthetic postings with the source's columns, in the source's order."""
+        picked = self.tuples.iloc[rng.choice(len(self.tuples), size=n, p=self.weights)].reset_index(drop=True)
+        out = {col: picked[col].to_numpy(object) for col in self.joint}
+        out['job_id'] = np.arange(first_id, first_id + n)
+        if self.titles:
+            out['job_title'] = self._titles(out['role'], rng)
+        if self.salaries:
+            values = self._salaries(out['category'], rng)
+            for i, col in enumerate(self.salary_columns):
+                out[col] = pd.array(values[:, i]).astype('Int64')
+            if {'min_salary', 'max_salary'} <= set(self.salary_columns):
+                lo, hi = values[:, 0], values[:, 1]
+                text = pd.Series([f"RM {a:,.0f} – RM {b:,.0f} per month" for a, b in zip(lo, hi)], dtype=object)
+                out['salary'] = text.where(~np.isnan(lo) & ~np.isnan(hi), None)
+        if self.dates is not None and len(self.dates):
+            seconds = self.dates[rng.integers(len(self.dates), size=n)] + rng.integers(0, 86_400, size=n)
+            out['listingDate'] = pd.to_datetime(seconds, unit='s').strftime(DATE_FORMAT)
+        return pd.DataFrame({col: out.get(col) for col in self.columns})
+
+
+def generate(profile, rows, chunksize=CHUNKSIZE, seed=0, first_id=ID_START):
+    """Yield `rows` synthetic postings in frames of at most chunksize (constant memory)."""
+    rng = np.random.default_rng(seed)
+    for start in range(0, rows, chunksize):
+        n = min(chunksize, rows - start)
+        yield profile.sample(n, rng, first_id + start)
+
+
+def write_csv(profile, rows, path, chunksize=CHUNKSIZE, seed=0):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = path + '.tmp'
+    written = 0
+    for i, chunk in enumerate(generate(profile, rows, chunksize, seed)):
+        chunk.to_csv(tmp, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+        written += len(chunk)
+        print(f"📥 {written:,}/{rows:,} rows", end='\r')
+    os.replace(tmp, path)
+    print()
+    return written
+
+
+# ─── 3) CLI ──────────────────────────────────────────────────────────────────────
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate synthetic JobStreet postings at any scale")
+    parser.add_argument('--source', default=SOURCE_PATH, help="preprocessed CSV to learn the distributions from")
+    parser.add_argument('--rows', type=int, required=True)
+    parser.add_argument('--out', required=True)
+    parser.add_argument('--chunksize', type=int, default=CHUNKSIZE)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    profile = PostingProfile.from_csv(args.source)
+    print(f"⚙️ Learned {len(profile.tuples):,} category/role/location/state/type combinations from {args.source}")
+    n = write_csv(profile, args.rows, args.out, args.chunksize, args.seed)
+    print(f"✅ Wrote {n:,} synthetic postings to {args.out}")
@@ -0,0 +1,45 @@
+from flask import Flask
+
+from admission import AdmissionController, TokenBuckets, install
+
+PROXY = '127.0.0.1'
+
+
+def make_client(burst=2):
+    app = Flask(__name__)
+    install(app, AdmissionController(buckets=TokenBuckets(rate=0.001, burst=burst)))
+
+    @app.route('/predict', methods=['POST'])
+    def predict():
+        return 'ok'
+
+    return app.test_client()
+
+
+def post(client, peer, forwarded=None):
+    headers = {'X-Forwarded-For': forwarded} if forwarded is not None else {}
+    return client.post('/predict', headers=headers, environ_base={'REMOTE_ADDR': peer}).status_code
+
+
+def test_clients_behind_the_proxy_get_their_own_buckets():
+    client = make_client()
+    assert [post(client, PROXY, '10.0.0.1') for _ in range(3)] == [200, 200, 429]
+    assert [post(client, PROXY, '10.0.0.2') for _ in range(2)] == [200, 200]
+
+
+def test_proxy_appended_entry_is_used():
+    client = make_client()
+    assert [post(client, PROXY, f"6.6.6.{i}, 10.0.0.1") for i in range(3)] == [200, 200, 429]
+
+
+def test_header_from_an_untrusted_peer_is_ignored():
+    client = make_client()
+    assert [post(client, '203.0.113.7', f"10.0.0.{i}") for i in range(3)] == [200, 200, 429]
+
+
+def test_rate_zero_turns_the_limit_off():
+    app = Flask(__name__)
+    install(app, AdmissionController(buckets=TokenBuckets(rate=0, burst=1)))
+    app.add_url_rule('/predict', 'predict', lambda: 'ok', methods=['POST'])
+    client = app.test_client()
+    assert {post(client, '203.0.113.7') for _ in range(5)} == {200}
@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip('duckdb')
+
+from analytics import Analytics
+from shared_dataset import SharedDataset, publish
+
+
+@pytest.fixture
+def db(tmp_path):
+    n = 400
+    publish(pd.DataFrame({
+        'category': [['Accounting', 'Sales', 'Engineering', 'Retail'][i % 4] for i in range(n)],
+        'state': [None if i % 7 == 0 else ['Johor', 'Penang', 'Selangor'][i % 3] for i in range(n)],
+        'type': ['Full time' if i % 5 else 'Contract' for i in range(n)],
+        'mean_salary': [3000 + i for i in range(n)],
+    }), str(tmp_path))
+    return Analytics('postings', shared=SharedDataset(str(tmp_path)))
+
+
+def duckdb_counts(db, by, **filters):
+    index, db._bitmap_index = db._bitmap_index, lambda by, filters: None
+    try:
+        return db.counts(by, **filters)
+    finally:
+        db._bitmap_index = index
+
+
+@pytest.mark.parametrize('by, filters', [
+    ('state', {}),
+    ('category', {'state': 'Penang'}),
+    ('state', {'category': ['Sales', 'Retail']}),
+    ('type', {'category': 'Sales', 'state': 'Johor'}),
+    ('category', {'state': 'Nowhere'}),
+    ('state', {'category': None}),
+])
+def test_bitmap_counts_match_the_query(db, by, filters):
+    assert db._bitmap_index(by, filters) is not None
+    fast, slow = db.counts(by, **filters), duckdb_counts(db, by, **filters)
+    assert fast['label'].astype(object).tolist() == slow['label'].astype(object).tolist()
+    assert fast['count'].tolist() == slow['count'].tolist()
+
+
+def test_missing_values_are_counted_last(db):
+    counts = db.counts('state')
+    assert counts['label'].isna().tolist() == [False, False, False, True]
+    assert counts['count'].sum() == 400
+
+
+def test_other_filters_go_to_duckdb(db):
+    assert db._bitmap_index('state', {'mean_salary': 3001}) is None
+    assert db._bitmap_index('state', {'category': []}) is None
+    assert db.counts('state', category=[]).empty
@@ -0,0 +1,55 @@
+import pandas as pd
+
+from preprocess_pipeline import SALARY_COLUMNS, assemble, process_chunk, run_chunks
+
+
+def raw_chunk(salaries, **columns):
+    n = len(salaries)
+    return pd.DataFrame({
+        'job_id': [str(i) for i in range(n)],
+        'salary': salaries,
+        'location': ['Kuala Lumpur'] * n,
+        'category': ['Accounting'] * n,
+        **columns,
+    })
+
+
+def test_amounts_are_monthly_and_ordered():
+    out = process_chunk(raw_chunk([
+        'RM 49,200 - RM 55,200 per annum',
+        'RM 3,000 – RM 4,000 per month',
+        'RM 2,000 per month',
+        'RM 60,000 – RM 80,000 per annum',
+    ]))
+    assert out[SALARY_COLUMNS].iloc[0].tolist() == [4100, 4600, 4350]
+    assert out[SALARY_COLUMNS].iloc[3].tolist() == [5000, 6667, 5833]
+    assert (out['min_salary'] <= out['mean_salary']).all()
+    assert (out['mean_salary'] <= out['max_salary']).all()
+
+
+def test_raw_columns_only_fill_unparseable_salaries():
+    out = process_chunk(raw_chunk(['RM 49,200 - RM 55,200 per annum', 'Negotiable', None],
+                                  min_salary=[1, 3000, None], max_salary=[2, 5000, None]))
+    assert out[SALARY_COLUMNS].iloc[0].tolist() == [4100, 4600, 4350]
+    assert out[SALARY_COLUMNS].iloc[1].tolist() == [3000, 5000, 4000]
+    assert out[SALARY_COLUMNS].iloc[2].isna().all()
+
+
+def test_salary_columns_are_integers():
+    out = process_chunk(raw_chunk(['RM 2,500 – RM 3,500', 'Competitive']))
+    for col in SALARY_COLUMNS:
+        assert out[col].dtype == 'Int64'
+
+
+def test_written_salaries_are_integers(tmp_path):
+    raw = tmp_path / 'raw.csv'
+    raw_chunk(['RM 49,200 - RM 55,200 per annum', 'RM 3,000 – RM 4,000 per month', 'Negotiable'] * 3,
+              listingDate=['2025-01-02T00:00:00Z'] * 9,
+              min_salary=[1000.0, 2000.0, None] * 3, max_salary=[2000.0, 3000.0, None] * 3).to_csv(raw, index=False)
+    work_dir = tmp_path / 'chunks'
+    run_chunks(str(raw), str(work_dir), chunksize=4, workers=1)
+    assemble(str(work_dir), str(tmp_path))
+    for name in ['preprocessed_dataset.csv', 'clean_preprocessed_dataset.csv']:
+        written = pd.read_csv(tmp_path / name, dtype=str)
+        for col in SALARY_COLUMNS:
+            assert written[col].dropna().str.fullmatch(r'\d+').all(), (name, col)
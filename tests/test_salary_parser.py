@@ -0,0 +1,118 @@
+import os
+
+import pandas as pd
+import pytest
+
+from salary_parser import (HOURS_PER_MONTH, SAMPLE_SALARIES, check_parity, clean_salary,
+                           clean_salary_vectorized, parse_salary)
+
+RAW_PATH = 'dataset/jobstreet_with_monthly_min_max.csv'
+
+CASES = {
+    'per annum': ['RM 60,000 – RM 80,000 per annum', 'RM 49,200 - RM 55,200 per annum',
+                  'RM 36,000 p.a.', 'RM 48,000 yearly'],
+    'per hour': ['RM 12 – RM 15 per hour', 'RM 10 hourly', 'RM 9.50/hr'],
+    'ranges': ['RM 3,000 – RM 4,000 per month', 'RM 2,800 â€“ RM 3,200 per month',
+               'RM2,500 - RM3,000 monthly', 'RM 4,000 – RM 5,500 p.m.', 'MYR 5k - 7k',
+               'RM 3,001 – RM 3,002 per month', 'RM 2,500 – RM 3,500'],
+    'single values': ['RM 2,000 per month', 'RM 1,500.50 per month', '3500', 'RM 3,500'],
+    'missing values': [None, float('nan'), pd.NA, ''],
+    'malformed input': ['Competitive', 'Negotiable', ',', '-', '–', '١٢٣', 3500, 'RM - per month'],
+}
+
+
+def series(values):
+    return pd.Series(values, dtype=object)
+
+
+# ─── Parity with clean_salary ───────────────────────────────────────────────────
+@pytest.mark.parametrize('case', CASES)
+def test_parity(case):
+    mismatches = check_parity(series(CASES[case]))
+    assert mismatches.empty, mismatches
+
+
+def test_parity_on_sample_corpus():
+    assert check_parity(series(SAMPLE_SALARIES)).empty
+
+
+def test_parity_with_repeated_strings_and_index():
+    salary = series(SAMPLE_SALARIES * 3)
+    salary.index = salary.index[::-1] + 100
+    expected = salary.map(clean_salary).astype('Int64')
+    pd.testing.assert_series_equal(clean_salary_vectorized(salary), expected, check_names=False)
+
+
+@pytest.mark.skipif(not os.path.exists(RAW_PATH), reason=f"{RAW_PATH} not available")
+def test_parity_on_raw_scrape():
+    corpus = pd.read_csv(RAW_PATH, usecols=['salary'])['salary']
+    mismatches = check_parity(corpus)
+    assert mismatches.empty, mismatches.head(20)
+
+
+# ─── parse_salary ───────────────────────────────────────────────────────────────
+def parsed(value):
+    return parse_salary(series([value])).iloc[0]
+
+
+def test_per_annum_is_monthly():
+    row = parsed('RM 49,200 - RM 55,200 per annum')
+    assert row['salary_period'] == 'annum'
+    assert (row['min_salary'], row['max_salary'], row['mean_salary']) == (4100, 4600, 4350)
+
+
+def test_per_hour_is_monthly():
+    row = parsed('RM 12 – RM 15 per hour')
+    assert row['salary_period'] == 'hour'
+    assert (row['min_salary'], row['max_salary']) == (12 * HOURS_PER_MONTH, 15 * HOURS_PER_MONTH)
+
+
+def test_range():
+    row = parsed('RM 3,000 – RM 4,000 per month')
+    assert row['salary_period'] == 'month'
+    assert (row['min_salary'], row['max_salary'], row['mean_salary']) == (3000, 4000, 3500)
+
+
+@pytest.mark.parametrize('value, period, amounts', [
+    ('RM 9.50/hr', 'hour', (1644, 1644, 1644)),
+    ('RM 1,500.50 per month', 'month', (1500, 1500, 1500)),
+    ('MYR 5k - 7k', 'month', (5000, 7000, 6000)),
+    ('RM 12 – RM 15 per hour', 'hour', (2076, 2595, 2336)),
+    ('RM2,500 - RM3,000 monthly', 'month', (2500, 3000, 2750)),
+    ('RM 36,000 p.a.', 'annum', (3000, 3000, 3000)),
+])
+def test_amounts_as_written(value, period, amounts):
+    row = parsed(value)
+    assert row['salary_period'] == period
+    assert (row['min_salary'], row['max_salary'], row['mean_salary']) == amounts
+
+
+@pytest.mark.parametrize('value, amounts', [
+    ('RM 3,000 - 4,000 per month (13th month)', (3000, 4000, 3500)),
+    ('Up to RM 5,000 per month, 2 years experience', (5000, 5000, 5000)),
+    ('13th month bonus, RM 3,000 – RM 3,500', (3000, 3500, 3250)),
+])
+def test_only_the_salary_range_counts(value, amounts):
+    row = parsed(value)
+    assert (row['min_salary'], row['max_salary'], row['mean_salary']) == amounts
+
+
+def test_single_value_defaults_to_month():
+    row = parsed('RM 2,500')
+    assert row['salary_period'] == 'month'
+    assert row['min_salary'] == row['max_salary'] == row['mean_salary'] == 2500
+
+
+@pytest.mark.parametrize('value', CASES['missing values'] + ['Competitive', ',', '-', 3500])
+def test_missing_or_malformed_is_empty(value):
+    row = parsed(value)
+    assert pd.isna(row['salary_period'])
+    assert row[['min_salary', 'max_salary', 'mean_salary']].isna().all()
+
+
+@pytest.mark.parametrize('case', ['per annum', 'per hour', 'ranges', 'single values'])
+def test_min_mean_max_ordered(case):
+    out = parse_salary(series(CASES[case]))
+    assert out['min_salary'].notna().all()
+    assert (out['min_salary'] <= out['mean_salary']).all()
+    assert (out['mean_salary'] <= out['max_salary']).all()
@@ -0,0 +1,103 @@
+import hashlib
+import json
+import os
+import sys
+
+import pandas as pd
+
+# ─── 1) Defaults ─────────────────────────────────────────────────────────────────
+CATEGORICAL_COLUMNS = ['category', 'role', 'location', 'state', 'type']
+VOCAB_PATH = 'dataset/vocab.json'
+
+
+def sidecar_path(model_path, kind='vocab'):
+    """JSON file that ships next to a trained model (vocabulary, metadata, ...)."""
+    return f"{os.path.splitext(model_path)[0]}.{kind}.json"
+
+
+# ─── 2) Vocabulary ───────────────────────────────────────────────────────────────
+class Vocabulary:
+    """Dense int codes for the categorical columns, shared by training and serving."""
+
+    def __init__(self, columns):
+        self.columns = {col: list(values) for col, values in columns.items()}
+        self._index = {col: {v: i for i, v in enumerate(values)} for col, values in self.columns.items()}
+
+    @property
+    def version(self):
+        blob = json.dumps(self.columns, sort_keys=True, ensure_ascii=False).encode('utf-8')
+        return hashlib.sha1(blob).hexdigest()[:12]
+
+    @classmethod
+    def from_frame(cls, df, columns=CATEGORICAL_COLUMNS):
+        return cls({
+            col: sorted(df[col].dropna().astype(str).unique())
+            for col in columns if col in df.columns
+        })
+
+    @classmethod
+    def load(cls, path=VOCAB_PATH):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        vocab = cls(data['columns'])
+        if data.get('version') != vocab.version:
+            raise ValueError(f"Vocabulary {path} does not match its recorded version")
+        return vocab
+
+    @classmethod
+    def for_frame(cls, df, path=VOCAB_PATH):
+        """Ingest vocabulary if present, extended with anything new in df."""
+        vocab = cls.load(path) if os.path.exists(path) else cls({})
+        return vocab.extend(df)
+
+    def save(self, path=VOCAB_PATH):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.version, 'columns': self.columns}, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, path)
+
+    def extend(self, df, columns=CATEGORICAL_COLUMNS):
+        """Append unseen values at the end; existing codes never move."""
+        for col in columns:
+            if col not in df.columns:
+                continue
+            values = self.columns.setdefault(col, [])
+            index = self._index.setdefault(col, {})
+            for v in sorted(set(df[col].dropna().astype(str).unique()) - index.keys()):
+                index[v] = len(values)
+                values.append(v)
+        return self
+
+    # ─── Lookups ─────────────────────────────────────────────────────────────────
+    def code(self, col, value):
+        try:
+            return self._index[col].get(value, -1)
+        except TypeError:       # unhashable (a list or dict from a request body): not a known value
+            return -1
+
+    def label(self, col, code):
+        return self.columns[col][code]
+
+    def codes(self, df, columns):
+        """Int code matrix for model training; unknown values become -1."""
+        return pd.DataFrame({
+            col: pd.Categorical(df[col], categories=self.columns[col]).codes.astype('int32')
+            for col in columns
+        }, index=df.index)
+
+    def encode_record(self, record, columns):
+        """Codes for one request dict, plus the fields whose value is unknown."""
+        codes = {col: self.code(col, record[col]) for col in columns}
+        unknown = [col for col, c in codes.items() if c < 0]
+        return codes, unknown
+
+
+# ─── 3) Build at ingest ──────────────────────────────────────────────────────────
+if __name__ == '__main__':
+    src = sys.argv[1] if len(sys.argv) > 1 else 'dataset/clean_preprocessed_dataset.csv'
+    dst = sys.argv[2] if len(sys.argv) > 2 else VOCAB_PATH
+    vocab = Vocabulary.for_frame(pd.read_csv(src, usecols=lambda c: c in CATEGORICAL_COLUMNS), dst)
+    vocab.save(dst)
+    sizes = ", ".join(f"{col}={len(v)}" for col, v in vocab.columns.items())
+    print(f"✅ Vocabulary {vocab.version} saved to {dst} ({sizes})")
@@ -0,0 +1,142 @@
+import gzip
+import json
+
+# Optional codecs: each format is only offered when its package is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# ─── 1) Formats ──────────────────────────────────────────────────────────────────
+JSON = 'application/json'
+MSGPACK = 'application/msgpack'
+ARROW = 'application/vnd.apache.arrow.stream'    # columnar batches
+ALIASES = {'application/x-msgpack': MSGPACK, 'application/vnd.apache.arrow.file': ARROW}
+COMPRESS_MIN = 1024     # bytes; smaller bodies are sent as is
+GZIP_LEVEL = 5
+ZSTD_LEVEL = 3
+
+
+class UnsupportedFormat(Exception):
+    pass
+
+
+class MalformedBody(Exception):
+    """A body that does not parse as its Content-Type (answered with 400)."""
+
+
+def available():
+    """Content types this process can read and write."""
+    return [JSON] + ([MSGPACK] if msgpack else []) + ([ARROW] if pa else [])
+
+
+def _media_type(header):
+    media = (header or '').split(';')[0].strip().lower()
+    return ALIASES.get(media, media)
+
+
+def _qvalues(header):
+    """{value: q} of an Accept-style header, in header order; q=0 (refused) is left out."""
+    weights = {}
+    for part in (header or '').split(','):
+        value, *params = part.split(';')
+        q = 1.0
+        for param in params:
+            name, _, number = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(number)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            weights[value.strip().lower()] = q
+    return weights
+
+
+# ─── 2) Decode / encode ──────────────────────────────────────────────────────────
+def decode(body, content_type):
+    """Request body -> dict or list of records. Arrow bodies always give records."""
+    media = _media_type(content_type) or JSON
+    if media == JSON or media.endswith('+json'):
+        loads = orjson.loads if orjson else json.loads
+    elif media == MSGPACK and msgpack:
+        loads = msgpack.unpackb
+    elif media == ARROW and pa:
+        loads = lambda data: pa.ipc.open_stream(data).read_all().to_pylist()
+    else:
+        raise UnsupportedFormat(f"Unsupported Content-Type: {content_type}")
+    try:
+        return loads(body)
+    except Exception as e:
+        raise MalformedBody(f"Malformed {media} body: {e}") from e
+
+
+def negotiate(accept):
+    """The available type the client prefers by q-value (JSON when it doesn't say)."""
+    offered = available()
+    weights = _qvalues(accept)
+    for media in map(_media_type, sorted(weights, key=lambda v: -weights[v])):     # stable: ties keep order
+        if media in offered:
+            return media
+        if media in ('*/*', 'application/*', ''):
+            return JSON
+    return JSON
+
+
+def _to_builtin(value):
+    # numpy scalars from model.predict
+    return value.item() if hasattr(value, 'item') else str(value)
+
+
+def encode(obj, media=JSON):
+    """obj -> bytes. Arrow expects a list of records (a dict is sent as one row)."""
+    if media == MSGPACK:
+        return msgpack.packb(obj, default=_to_builtin)
+    if media == ARROW:
+        records = [obj] if isinstance(obj, dict) else obj
+        columns = dict.fromkeys(k for r in records for k in r)    # union, first-seen order
+        table = pa.table({k: [r.get(k) for r in records] for k in columns})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+    if orjson:
+        return orjson.dumps(obj, default=_to_builtin, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=_to_builtin).encode('utf-8')
+
+
+# ─── 3) Compression ──────────────────────────────────────────────────────────────
+def compress(body, accept_encoding, min_size=COMPRESS_MIN):
+    """(body, Content-Encoding or None), by the client's q-values; zstd wins a tie with gzip."""
+    if len(body) < min_size:
+        return body, None
+    weights = _qvalues(accept_encoding)
+    offered = [c for c in (['zstd'] if zstandard else []) + ['gzip'] if c in weights]
+    if not offered:
+        return body, None
+    coding = max(offered, key=weights.get)      # first of the highest q, so zstd on a tie
+    if coding == 'zstd':
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body), 'zstd'
+    return gzip.compress(body, compresslevel=GZIP_LEVEL), 'gzip'
+
+
+def render(obj, accept, accept_encoding):
+    """(body, headers) for a response negotiated from the request's Accept headers."""
+    media = negotiate(accept)
+    body, encoding = compress(encode(obj, media), accept_encoding)
+    headers = {'Content-Type': media, 'Vary': 'Accept, Accept-Encoding'}
+    if encoding:
+        headers['Content-Encoding'] = encoding
+    return body, headers